@@ -0,0 +1,30 @@
+"""
+Performance benchmarks for the books API.
+
+Run them from the project root, e.g. ``python -m benchmarks.fuzzy_search``.
+"""
+
+import os
+
+
+def setup_django(settings_module="core.settings.local"):
+    """Configure Django for benchmarks that touch settings or the ORM."""
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+    django.setup()
+
+
+def percentile(samples, fraction):
+    """Return the given percentile of a list of timings."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def report(label, samples):
+    """Print p50/p95/max of timings in seconds as milliseconds."""
+    print(
+        f"{label:<28} p50 {percentile(samples, 0.50) * 1000:8.2f} ms"
+        f"  p95 {percentile(samples, 0.95) * 1000:8.2f} ms"
+        f"  max {max(samples) * 1000:8.2f} ms"
+    )
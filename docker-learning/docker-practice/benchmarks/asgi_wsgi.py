@@ -0,0 +1,192 @@
+"""
+Benchmark the WSGI and ASGI deployments of the API under concurrent load.
+
+Starts gunicorn (gunicorn.conf.py) twice with the same number of workers:
+with its sync workers on core.wsgi, then with uvicorn workers on core.asgi,
+where the catalog read actions are served by their async views. Each server
+is driven by ``--concurrency`` clients for ``--duration`` seconds over a mix
+of read endpoints (lists, details, related books, statistics, popular), one
+connection per request, authenticated with a session cookie. Reports
+requests per second, p50 and p99 latency and the non-200 responses.
+
+Servers run benchmarks.server_settings unless DJANGO_SETTINGS_MODULE names
+other settings; migrate their database first.
+
+    python manage.py migrate --settings=benchmarks.server_settings
+    python -m benchmarks.asgi_wsgi --concurrency 100
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+from benchmarks import percentile, setup_django
+from benchmarks.list_serialization import seed
+
+SETTINGS = "benchmarks.server_settings"
+
+SERVERS = {
+    "wsgi": ["core.wsgi:application"],
+    "asgi": ["-k", "uvicorn.workers.UvicornWorker", "core.asgi:application"],
+}
+
+
+def make_session():
+    """Return the key of a session logged in as the benchmark user."""
+    from django.contrib.auth import (
+        BACKEND_SESSION_KEY,
+        HASH_SESSION_KEY,
+        SESSION_KEY,
+        get_user_model,
+    )
+    from django.contrib.sessions.backends.db import SessionStore
+
+    user, _ = get_user_model().objects.get_or_create(username="benchmark")
+    session = SessionStore()
+    session[SESSION_KEY] = str(user.pk)
+    session[BACKEND_SESSION_KEY] = "django.contrib.auth.backends.ModelBackend"
+    session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+    session.create()
+    return session.session_key
+
+
+def make_paths(rng, count):
+    """Return request paths over random books, authors and categories."""
+    from books.models.author import Author
+    from books.models.book import Book
+    from books.models.category import Category
+
+    book_ids = list(Book.objects.values_list("id", flat=True)[:10_000])
+    author_ids = list(Author.objects.values_list("id", flat=True)[:10_000])
+    category_ids = list(Category.objects.values_list("id", flat=True))
+    templates = [
+        lambda: "/api/v1/books/",
+        lambda: f"/api/v1/books/?page={rng.randint(1, 50)}",
+        lambda: f"/api/v1/books/{rng.choice(book_ids)}/",
+        lambda: f"/api/v1/authors/{rng.choice(author_ids)}/",
+        lambda: f"/api/v1/authors/{rng.choice(author_ids)}/books/",
+        lambda: f"/api/v1/authors/{rng.choice(author_ids)}/statistics/",
+        lambda: f"/api/v1/categories/{rng.choice(category_ids)}/statistics/",
+        lambda: "/api/v1/categories/popular/",
+    ]
+    return [rng.choice(templates)() for _ in range(count)]
+
+
+async def fetch(port, request):
+    """Send one request on a new connection; return its status code."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(request)
+        response = await reader.read()
+    finally:
+        writer.close()
+    return int(response.split(b" ", 2)[1])
+
+
+async def drive(port, paths, cookie, concurrency, duration):
+    """Run the clients; return (latencies, non-200 count, elapsed seconds)."""
+    requests = [
+        (
+            f"GET {path} HTTP/1.1\r\nHost: 127.0.0.1\r\n"
+            f"Cookie: {cookie}\r\nAccept: application/json\r\n"
+            "Connection: close\r\n\r\n"
+        ).encode()
+        for path in paths
+    ]
+    latencies = []
+    errors = 0
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + duration
+
+    async def client(position):
+        nonlocal errors
+        while loop.time() < deadline:
+            request = requests[position % len(requests)]
+            position += concurrency
+            started = time.perf_counter()
+            try:
+                status = await fetch(port, request)
+            except (OSError, IndexError, ValueError):
+                status = None
+            latencies.append(time.perf_counter() - started)
+            errors += status != 200
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client(position) for position in range(concurrency)))
+    return latencies, errors, time.perf_counter() - started
+
+
+def wait_for_port(port, process, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("server exited during startup")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("server did not start")
+
+
+def run(name, args, paths, cookie):
+    env = {
+        **os.environ,
+        "GUNICORN_BIND": f"127.0.0.1:{args.port}",
+        "GUNICORN_WORKERS": str(args.workers),
+    }
+    command = [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py"]
+    server = subprocess.Popen(
+        command + ["--log-level", "warning", *SERVERS[name]],
+        env=env,
+    )
+    try:
+        wait_for_port(args.port, server)
+        asyncio.run(drive(args.port, paths, cookie, args.concurrency, args.warmup))
+        latencies, errors, elapsed = asyncio.run(
+            drive(args.port, paths, cookie, args.concurrency, args.duration)
+        )
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(
+        f"{name:<6} {len(latencies) / elapsed:>9,.0f} req/s"
+        f" {percentile(latencies, 0.50) * 1000:>9.1f} ms"
+        f" {percentile(latencies, 0.99) * 1000:>9.1f} ms"
+        f" {errors:>8,}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--books", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--warmup", type=float, default=3.0)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--only", choices=list(SERVERS))
+    args = parser.parse_args()
+
+    setup_django(SETTINGS)
+    from django.conf import settings
+
+    rng = random.Random(args.seed)
+    seed(rng, args.books)
+    cookie = f"{settings.SESSION_COOKIE_NAME}={make_session()}"
+    paths = make_paths(rng, 10_000)
+
+    print(f"{'server':<6} {'throughput':>15} {'p50':>12} {'p99':>12} {'non-200':>8}")
+    for name in [args.only] if args.only else SERVERS:
+        run(name, args, paths, cookie)
+
+
+if __name__ == "__main__":
+    main()
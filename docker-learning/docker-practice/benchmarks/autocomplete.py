@@ -0,0 +1,84 @@
+"""
+Benchmark autocomplete suggestions at catalog scale.
+
+Loads the in-process prefix indexes with ``--titles`` synthetic book titles
+(1M), authors and categories, then times random type-ahead prefixes of one to
+four characters, both as raw index lookups and through the full
+``/api/v1/autocomplete/`` view (query validation, response envelope and JSON
+rendering).
+
+    python -m benchmarks.autocomplete --titles 1000000
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks import report, setup_django
+from benchmarks.fuzzy_search import make_name, make_word
+
+
+def make_title(rng):
+    """Return a random title of one to four words."""
+    return " ".join(make_word(rng) for _ in range(rng.randint(1, 4)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--titles", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.contrib.auth import get_user_model
+    from rest_framework.test import APIRequestFactory, force_authenticate
+
+    from books.search.autocomplete import PrefixIndex
+    from books.search.indexes import get_index
+    from books.services.autocomplete_services import AUTOCOMPLETE_SOURCES
+    from books.viewsets.autocomplete_viewset import AutocompleteViewSet
+
+    rng = random.Random(args.seed)
+    sizes = {
+        "books": args.titles,
+        "authors": args.titles // 5,
+        "categories": 200,
+    }
+    makers = {"books": make_title, "authors": make_name, "categories": make_word}
+    for name, (model, field) in AUTOCOMPLETE_SOURCES.items():
+        index = get_index(PrefixIndex, model, field)
+        index.refresh = lambda force=False: None
+        started = time.perf_counter()
+        index.load((i, makers[name](rng)) for i in range(1, sizes[name] + 1))
+        print(
+            f"{name + ' indexed':<28} {sizes[name]:>9,}"
+            f"  in {time.perf_counter() - started:6.2f} s"
+        )
+
+    prefixes = [
+        make_word(rng).lower()[: rng.randint(1, 4)] for _ in range(args.queries)
+    ]
+    books = get_index(PrefixIndex, *AUTOCOMPLETE_SOURCES["books"])
+    timings = []
+    for prefix in prefixes:
+        started = time.perf_counter()
+        books.search(prefix, 10)
+        timings.append(time.perf_counter() - started)
+    report("book index lookup", timings)
+
+    factory = APIRequestFactory()
+    view = AutocompleteViewSet.as_view({"get": "list"})
+    user = get_user_model()(username="benchmark")
+    timings = []
+    for prefix in prefixes:
+        request = factory.get("/api/v1/autocomplete/", {"q": prefix})
+        force_authenticate(request, user=user)
+        started = time.perf_counter()
+        view(request).render()
+        timings.append(time.perf_counter() - started)
+    report("view, all types", timings)
+
+
+if __name__ == "__main__":
+    main()
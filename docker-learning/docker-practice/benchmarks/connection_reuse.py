@@ -0,0 +1,134 @@
+"""
+Benchmark the per-request latency saved by persistent database connections.
+
+Sends ``--requests`` sequential requests per mode through Django's WSGI
+handler, in process, so the request_started/request_finished signals close
+or keep the connection exactly as under gunicorn: one new connection per
+request (CONN_MAX_AGE=0), a persistent connection, and a persistent one
+checked at the start of every request (CONN_HEALTH_CHECKS, as the production
+settings do). The requests are authenticated with a session cookie and mix
+book details, author books and statistics. Reports p50/p95/max latency and
+the connections opened.
+
+Runs the production settings unless DJANGO_SETTINGS_MODULE names others:
+
+    SECRET_KEY=... ALLOWED_HOSTS=localhost POSTGRES_DB=bench \\
+        python -m benchmarks.connection_reuse --requests 2000
+"""
+
+import argparse
+import io
+import logging
+import random
+import sys
+import time
+
+from benchmarks import percentile, setup_django
+from benchmarks.asgi_wsgi import make_paths, make_session
+from benchmarks.list_serialization import seed
+
+MODES = (
+    ("per request", 0, False),
+    ("persistent", None, False),
+    ("persistent + checks", None, True),
+)
+
+
+def make_environ(path, host, cookie):
+    path, _, query = path.partition("?")
+    return {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": path,
+        "QUERY_STRING": query,
+        "SERVER_NAME": host,
+        "SERVER_PORT": "443",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "HTTP_HOST": host,
+        "HTTP_COOKIE": cookie,
+        "HTTP_ACCEPT": "application/json",
+        "wsgi.input": io.BytesIO(),
+        "wsgi.errors": sys.stderr,
+        "wsgi.url_scheme": "https",
+    }
+
+
+def run(handler, paths, host, cookie):
+    """Send every request; return (latencies, non-200 count)."""
+    latencies = []
+    errors = 0
+    statuses = []
+
+    def start_response(status, headers):
+        statuses.append(status)
+
+    for path in paths:
+        environ = make_environ(path, host, cookie)
+        started = time.perf_counter()
+        response = handler(environ, start_response)
+        b"".join(response)
+        # Sends request_finished, which closes or keeps the connection.
+        response.close()
+        latencies.append(time.perf_counter() - started)
+        errors += not statuses.pop().startswith("200")
+    return latencies, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--books", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--max-age", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    setup_django("core.settings.production")
+    from django.conf import settings
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.db import connection
+    from django.db.backends.signals import connection_created
+
+    # Every request must reach the database; keep the output to the results.
+    settings.BOOKS_RESPONSE_CACHE_ENABLED = False
+    logging.getLogger("core_commons").setLevel(logging.ERROR)
+
+    rng = random.Random(args.seed)
+    seed(rng, args.books)
+    cookie = f"{settings.SESSION_COOKIE_NAME}={make_session()}"
+    host = next(host for host in settings.ALLOWED_HOSTS if not host.startswith("."))
+    paths = make_paths(rng, args.requests)
+    handler = WSGIHandler()
+
+    opened = []
+    connection_created.connect(
+        lambda sender, **kwargs: opened.append(sender), weak=False
+    )
+
+    print(f"database {connection.vendor}, {len(paths):,} requests per mode")
+    print(f"{'mode':<20} {'p50':>11} {'p95':>11} {'max':>11} {'connections':>12}")
+    baseline = None
+    for name, max_age, health_checks in MODES:
+        connection.close()
+        connection.settings_dict["CONN_MAX_AGE"] = (
+            args.max_age if max_age is None else max_age
+        )
+        connection.settings_dict["CONN_HEALTH_CHECKS"] = health_checks
+        run(handler, paths[:100], host, cookie)
+        opened.clear()
+        latencies, errors = run(handler, paths, host, cookie)
+        if errors:
+            raise SystemExit(f"{name}: {errors} requests did not return 200")
+
+        p50 = percentile(latencies, 0.50)
+        print(
+            f"{name:<20} {p50 * 1000:>8.2f} ms"
+            f" {percentile(latencies, 0.95) * 1000:>8.2f} ms"
+            f" {max(latencies) * 1000:>8.2f} ms {len(opened):>12,}"
+        )
+        if baseline is None:
+            baseline = p50
+        else:
+            print(f"{'':<20} saves {(baseline - p50) * 1000:.2f} ms per request")
+
+
+if __name__ == "__main__":
+    main()
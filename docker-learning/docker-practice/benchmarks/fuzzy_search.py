@@ -0,0 +1,145 @@
+"""
+Benchmark fuzzy (trigram) author search at catalog scale.
+
+By default the in-process trigram index used on SQLite is loaded with
+``--authors`` synthetic names (1M) and queried with misspelled names.
+``--orm`` instead seeds the configured database up to ``--authors`` rows and
+times the fuzzy search queryset end to end, which exercises the pg_trgm GIN
+index when DJANGO_SETTINGS_MODULE points at PostgreSQL.
+
+    python -m benchmarks.fuzzy_search --authors 1000000
+    DJANGO_SETTINGS_MODULE=core.settings.local python -m benchmarks.fuzzy_search --orm
+"""
+
+import argparse
+import random
+import resource
+import time
+
+from benchmarks import report, setup_django
+
+# fmt: off
+ONSETS = ["", "b", "br", "c", "ch", "d", "f", "g", "gr", "h", "j", "k", "l",
+          "m", "n", "p", "r", "s", "sh", "st", "t", "th", "v", "w", "z"]
+VOWELS = ["a", "e", "i", "o", "u", "ai", "ea", "ou", "y"]
+CODAS = ["", "", "n", "r", "l", "s", "th", "ck", "m", "rd", "nd", "x"]
+# fmt: on
+
+
+def make_word(rng):
+    """Return a pronounceable word of two or three syllables."""
+    return "".join(
+        rng.choice(ONSETS) + rng.choice(VOWELS) + rng.choice(CODAS)
+        for _ in range(rng.randint(2, 3))
+    ).capitalize()
+
+
+def make_name(rng):
+    """Return a random two-word name such as 'Brailen Thoumard'."""
+    return f"{make_word(rng)} {make_word(rng)}"
+
+
+def misspell(rng, name):
+    """Apply one random typo (swap, drop, double or replace a letter)."""
+    position = rng.randrange(1, len(name) - 1)
+    typo = rng.choice(("swap", "drop", "double", "replace"))
+    if typo == "swap":
+        return (
+            name[:position] + name[position + 1] + name[position] + name[position + 2 :]
+        )
+    if typo == "drop":
+        return name[:position] + name[position + 1 :]
+    if typo == "double":
+        return name[:position] + name[position] + name[position:]
+    return name[:position] + rng.choice("aeiou") + name[position + 1 :]
+
+
+def bench_index(args, rng):
+    setup_django()
+    from books.models.author import Author
+    from books.search.backends import FUZZY_MAX_RESULTS
+    from books.search.trigram import TrigramIndex
+
+    names = [make_name(rng) for _ in range(args.authors)]
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    index = TrigramIndex(Author, "name")
+    index.refresh = lambda force=False: None
+    started = time.perf_counter()
+    index.load(enumerate(names, start=1))
+    build = time.perf_counter() - started
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    print(f"authors indexed              {args.authors:,}")
+    print(f"index build                  {build:8.2f} s")
+    print(f"max RSS growth               {(rss_after - rss_before) / 1024:8.0f} MiB")
+
+    timings, found = [], 0
+    for _ in range(args.queries):
+        target = rng.randrange(len(names))
+        term = misspell(rng, names[target].split()[rng.randrange(2)])
+        started = time.perf_counter()
+        matches = index.search(term, args.similarity, FUZZY_MAX_RESULTS)
+        timings.append(time.perf_counter() - started)
+        found += any(object_id == target + 1 for _, object_id in matches)
+    report("name part with a typo", timings)
+    print(f"misspelled author matched    {found / args.queries:8.1%}")
+
+
+def bench_orm(args, rng):
+    setup_django()
+    from django.db import connection
+
+    from books.models.author import Author
+    from books.search.backends import get_search_backend
+
+    missing = args.authors - Author.objects.count()
+    offset = Author.objects.count()
+    while missing > 0:
+        batch = min(missing, 10_000)
+        Author.objects.bulk_create(
+            Author(name=make_name(rng), email=f"bench{offset + i}@example.com")
+            for i in range(batch)
+        )
+        offset += batch
+        missing -= batch
+        print(f"seeded {offset:,} authors", end="\r")
+
+    names = list(
+        Author.objects.order_by("?").values_list("name", flat=True)[: args.queries]
+    )
+    backend = get_search_backend(connection.alias)
+    queryset = Author.objects.all()
+    print(f"authors in {connection.vendor:<18} {Author.objects.count():,}")
+
+    timings = []
+    for name in names:
+        term = misspell(rng, name.split()[rng.randrange(2)])
+        started = time.perf_counter()
+        list(
+            backend.fuzzy_search(queryset, "name", term, args.similarity)
+            .order_by("-search_rank", "-id")
+            .values_list("id", flat=True)[:20]
+        )
+        timings.append(time.perf_counter() - started)
+    report("fuzzy search (first page)", timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--authors", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--similarity", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--orm", action="store_true")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    if args.orm:
+        bench_orm(args, rng)
+    else:
+        bench_index(args, rng)
+
+
+if __name__ == "__main__":
+    main()
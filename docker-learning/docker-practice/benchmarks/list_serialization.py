@@ -0,0 +1,122 @@
+"""
+Benchmark list serialization: model serializers against values() projections.
+
+Seeds the configured database up to ``--books`` books, then renders pages of
+``--page-size`` rows of the book, author and category lists both ways (query,
+representation and JSON rendering, as the list views do) and reports rows per
+second. The two renderings are compared byte for byte first.
+
+    DJANGO_SETTINGS_MODULE=core.settings.local python -m benchmarks.list_serialization
+"""
+
+import argparse
+import random
+import time
+from decimal import Decimal
+
+from benchmarks import setup_django
+from benchmarks.fuzzy_search import make_name, make_word
+
+
+def seed(rng, books):
+    """Fill the catalog up to the given number of books."""
+    from books.models.author import Author
+    from books.models.book import Book
+    from books.models.category import Category
+
+    if not Category.objects.exists():
+        Category.objects.bulk_create(
+            Category(name=f"{make_word(rng)} {index}") for index in range(50)
+        )
+    if Author.objects.count() < books // 10:
+        offset = Author.objects.count()
+        Author.objects.bulk_create(
+            Author(name=make_name(rng), email=f"bench{offset + i}@example.com")
+            for i in range(books // 10 - offset)
+        )
+    author_ids = list(Author.objects.values_list("id", flat=True))
+    category_ids = list(Category.objects.values_list("id", flat=True))
+    Through = Book.categories.through
+    offset = Book.objects.count()
+    while offset < books:
+        batch = Book.objects.bulk_create(
+            Book(
+                title=f"{make_word(rng)} {make_word(rng)}",
+                isbn=f"{offset + i:013d}",
+                price=Decimal(rng.randint(100, 9999)) / 100,
+                author_id=rng.choice(author_ids),
+            )
+            for i in range(min(10_000, books - offset))
+        )
+        Through.objects.bulk_create(
+            Through(book_id=book.pk, category_id=category_id)
+            for book in batch
+            for category_id in rng.sample(category_ids, 2)
+        )
+        offset += len(batch)
+        print(f"seeded {offset:,} books", end="\r")
+    print(f"books in catalog {Book.objects.count():,}")
+
+
+def rows_per_second(render, pages, page_size):
+    """Render every page and return the rendered rows per second."""
+    started = time.perf_counter()
+    for page in range(pages):
+        render(page * page_size, page_size)
+    return pages * page_size / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--books", type=int, default=100_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    setup_django()
+    from rest_framework.renderers import JSONRenderer
+
+    from books.viewsets.author_viewset import AuthorViewSet
+    from books.viewsets.book_viewset import BookViewSet
+    from books.viewsets.category_viewset import CategoryViewSet
+
+    seed(random.Random(args.seed), args.books)
+    renderer = JSONRenderer()
+
+    print(f"{'list':<12} {'serializer':>14} {'projection':>14} {'speedup':>8}")
+    for name, viewset in (
+        ("books", BookViewSet),
+        ("authors", AuthorViewSet),
+        ("categories", CategoryViewSet),
+    ):
+        view = viewset(action="list")
+        queryset = view.get_queryset().order_by(*viewset.ordering, "-id")
+        serializer_class = view.get_serializer_class()
+        projection = viewset.list_projection
+
+        def serialized(offset, limit, queryset=queryset, cls=serializer_class):
+            page = list(queryset[offset : offset + limit])
+            return renderer.render(cls(page, many=True).data)
+
+        def projected(offset, limit, queryset=queryset, projection=projection):
+            page = list(projection.values(queryset)[offset : offset + limit])
+            return renderer.render(projection.represent(page))
+
+        pages = min(args.pages, max(1, queryset.count() // args.page_size))
+        for page in range(pages):
+            offset = page * args.page_size
+            assert serialized(offset, args.page_size) == projected(
+                offset, args.page_size
+            ), f"{name}: projection differs from the serializer"
+
+        before = rows_per_second(serialized, pages, args.page_size)
+        after = rows_per_second(projected, pages, args.page_size)
+        print(
+            f"{name:<12} {before:>10,.0f} r/s {after:>10,.0f} r/s"
+            f" {after / before:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
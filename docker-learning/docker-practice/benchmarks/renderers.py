@@ -0,0 +1,86 @@
+"""
+Benchmark the API renderers and parsers.
+
+Renders a book list page of ``--page-size`` rows (the paginated envelope) and
+a ``success_response`` envelope around a book detail with the stock
+JSONRenderer, ORJSONRenderer and MessagePackRenderer, then parses the bodies
+back. No database is needed.
+
+    python -m benchmarks.renderers
+"""
+
+import argparse
+import io
+import time
+from decimal import Decimal
+
+from benchmarks import setup_django
+
+
+def per_call(func, number):
+    """Return the mean duration of func() in microseconds."""
+    started = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - started) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.utils import timezone
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+
+    from books.utils import success_response
+    from core_commons.parsers import MessagePackParser, ORJSONParser
+    from core_commons.renderers import MessagePackRenderer, ORJSONRenderer
+
+    rows = [
+        {
+            "id": index,
+            "title": f"Book title number {index}",
+            "isbn": f"{index:013d}",
+            "price": f"{index % 90 + 9.99:.2f}",
+            "price_display": f"${index % 90 + 9.99:.2f}",
+            "author_name": "John Doe",
+        }
+        for index in range(args.page_size)
+    ]
+    page = {"count": 100_000, "next": "http://testserver/api/v1/books/?page=3"}
+    page |= {"previous": "http://testserver/api/v1/books/?page=1", "results": rows}
+    detail = success_response(
+        {
+            **rows[0],
+            "price": Decimal("29.99"),
+            "author": {"id": 1, "name": "John Doe", "email": "john@example.com"},
+            "categories": [{"id": 1, "name": "Fiction", "description": ""}],
+            "created_at": timezone.now(),
+            "updated_at": timezone.now(),
+        }
+    ).data
+
+    codecs = [
+        ("JSONRenderer", JSONRenderer(), JSONParser()),
+        ("ORJSONRenderer", ORJSONRenderer(), ORJSONParser()),
+        ("MessagePackRenderer", MessagePackRenderer(), MessagePackParser()),
+    ]
+    print(f"{'payload':<10} {'renderer':<20} {'bytes':>7} {'render':>10} {'parse':>10}")
+    for label, data in (("list page", page), ("detail", detail)):
+        for name, renderer, body_parser in codecs:
+            body = renderer.render(data)
+            render = per_call(lambda r=renderer, d=data: r.render(d), args.number)
+            parse = per_call(
+                lambda p=body_parser, b=body: p.parse(io.BytesIO(b)), args.number
+            )
+            print(
+                f"{label:<10} {name:<20} {len(body):>7,} {render:8.1f}us {parse:8.1f}us"
+            )
+
+
+if __name__ == "__main__":
+    main()
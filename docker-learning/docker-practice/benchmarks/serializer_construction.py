@@ -0,0 +1,99 @@
+"""
+Benchmark per-request serializer construction with and without field plans.
+
+Times building the bound field dict of the books serializers, and a full
+``.data`` on an in-memory instance, with ``FieldPlanMixin`` caching the
+field plan and with DRF rebuilding it every time. No database is needed.
+
+    python -m benchmarks.serializer_construction
+"""
+
+import argparse
+import time
+from decimal import Decimal
+from unittest import mock
+
+from benchmarks import setup_django
+
+
+def per_call(func, number):
+    """Return the mean duration of func() in microseconds."""
+    started = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - started) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=5000)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.utils import timezone
+
+    from books.models.author import Author
+    from books.models.book import Book
+    from books.models.category import Category
+    from books.serializers.author_response_serializers import (
+        AuthorListResponseSerializer,
+    )
+    from books.serializers.book_request_serializers import (
+        BookCreateRequestSerializer,
+    )
+    from books.serializers.book_response_serializers import (
+        BookDetailResponseSerializer,
+        BookListResponseSerializer,
+    )
+    from books.serializers.category_response_serializers import (
+        CategoryListResponseSerializer,
+    )
+    from books.serializers.field_plans import FieldPlanMixin
+
+    now = timezone.now()
+    author = Author(id=1, name="John Doe", email="john@example.com", book_count=3)
+    book = Book(
+        id=1,
+        title="Sample Book",
+        isbn="9781234567890",
+        price=Decimal("29.99"),
+        author=author,
+        created_at=now,
+        updated_at=now,
+    )
+    categories = Category.objects.none()
+    categories._result_cache = [Category(id=1, name="Fiction", description="")]
+    categories._prefetch_done = True
+    book._prefetched_objects_cache = {"categories": categories}
+    category = Category(id=1, name="fiction", book_count=3)
+
+    cases = [
+        (BookDetailResponseSerializer, book),
+        (BookListResponseSerializer, book),
+        (AuthorListResponseSerializer, author),
+        (CategoryListResponseSerializer, category),
+        (BookCreateRequestSerializer, None),
+    ]
+
+    def rebuild(self):
+        return super(FieldPlanMixin, self).get_fields()
+
+    print(f"{'serializer':<32} {'':<8} {'DRF':>9} {'plan':>9} {'saved':>9}")
+    for serializer_class, instance in cases:
+        for label in ("fields", "data") if instance is not None else ("fields",):
+
+            def func(cls=serializer_class, instance=instance, label=label):
+                return getattr(cls(instance), label)
+
+            func()
+            with mock.patch.object(FieldPlanMixin, "get_fields", rebuild):
+                before = per_call(func, args.number)
+            after = per_call(func, args.number)
+            print(
+                f"{serializer_class.__name__:<32} {label:<8}"
+                f" {before:7.1f}us {after:7.1f}us {before - after:7.1f}us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Settings of the servers started by the deployment benchmarks.
+
+The local settings with DEBUG off and without the debug tooling (the debug
+toolbar middleware is sync only: under ASGI it would put every request back
+on a thread) or the query budget checks. The response cache is off so every
+request reaches the database. With POSTGRES_DB set the servers use that
+PostgreSQL database instead of the SQLite file.
+"""
+
+import os
+
+from core.settings.local import *  # noqa: F403
+
+DEBUG = False
+
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app != "debug_toolbar"]  # noqa: F405
+MIDDLEWARE = [
+    middleware
+    for middleware in MIDDLEWARE  # noqa: F405
+    if middleware
+    not in (
+        "debug_toolbar.middleware.DebugToolbarMiddleware",
+        "core_commons.query_budget.QueryBudgetMiddleware",
+    )
+]
+
+BOOKS_RESPONSE_CACHE_ENABLED = False
+
+if os.getenv("POSTGRES_DB"):
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": os.environ["POSTGRES_DB"],
+            "USER": os.environ.get("POSTGRES_USER", "postgres"),
+            "PASSWORD": os.environ.get("POSTGRES_PASSWORD", "postgres"),
+            "HOST": os.environ.get("POSTGRES_HOST", "localhost"),
+            "PORT": os.environ.get("POSTGRES_PORT", "5432"),
+        }
+    }
+
+# Keep the output to the results: no per-request timing or slow-query lines.
+LOGGING["loggers"]["core_commons"]["level"] = "ERROR"  # noqa: F405
@@ -0,0 +1,203 @@
+"""
+Benchmark the latency and the statements of the update and delete endpoints.
+
+Seeds the configured database up to ``--books`` books, then runs ``--rounds``
+rounds of every write endpoint through the API client, in process and with
+the full middleware stack: each round creates a book with two categories
+and an empty category to work on, outside the timings. Reports p50/p95 per
+endpoint and the statements it ran.
+
+Runs the production settings unless DJANGO_SETTINGS_MODULE names others:
+
+    SECRET_KEY=... ALLOWED_HOSTS=localhost POSTGRES_DB=bench \\
+        python -m benchmarks.write_paths --rounds 500
+"""
+
+import argparse
+import logging
+import random
+import time
+from decimal import Decimal
+
+from benchmarks import percentile, setup_django
+from benchmarks.list_serialization import seed
+
+
+def make_fixtures(rng, index, category_ids):
+    """Create the book and the empty category a round writes to."""
+    from books.models.author import Author
+    from books.models.category import Category
+    from books.services.book_services import BookService
+
+    # An author with books of their own, whose delete stays refused.
+    author = Author.objects.filter(book_count__gt=0).order_by("?").first()
+    book = BookService.create_book(
+        {
+            "title": f"Write path {index}",
+            "isbn": f"8{index:012d}",
+            "price": Decimal("9.99"),
+            "author_id": author.id,
+            "category_ids": rng.sample(category_ids, 2),
+        }
+    )
+    category = Category.objects.create(name=f"Write path {index}")
+    return book, category
+
+
+def remove_fixtures():
+    """Delete what an interrupted run left behind."""
+    from books.models.book import Book
+    from books.models.category import Category
+    from books.services.book_services import BookService
+
+    # Seeded ISBNs start with 0, the fixture ones with 8.
+    for book_id in Book.objects.filter(isbn__startswith="8").values_list(
+        "id", flat=True
+    ):
+        BookService.delete_book(book_id)
+    Category.objects.filter(name__startswith="Write path").delete()
+
+
+def make_requests(rng, index, book, category, category_ids):
+    """Return (endpoint, method, path, payload, expected status) of a round."""
+    book_url = f"/api/v1/books/{book.id}/"
+    current = list(book.categories.values_list("id", flat=True))
+    extra = rng.choice([pk for pk in category_ids if pk not in current])
+    return [
+        ("book PATCH title", "patch", book_url, {"title": f"Renamed {index}"}, 200),
+        (
+            "book PUT unchanged",
+            "put",
+            book_url,
+            {
+                "title": f"Renamed {index}",
+                "isbn": book.isbn,
+                "price": "9.99",
+                "author_id": book.author_id,
+                "category_ids": current,
+            },
+            200,
+        ),
+        (
+            "book PATCH categories",
+            "patch",
+            book_url,
+            {"category_ids": [current[0], extra]},
+            200,
+        ),
+        (
+            "book add_category",
+            "post",
+            f"{book_url}add_category/",
+            {"category_id": current[1]},
+            200,
+        ),
+        (
+            "book remove_category",
+            "post",
+            f"{book_url}remove_category/",
+            {"category_id": extra},
+            200,
+        ),
+        (
+            "author PATCH name",
+            "patch",
+            f"/api/v1/authors/{book.author_id}/",
+            {"name": f"Author {index}"},
+            200,
+        ),
+        (
+            "category PATCH",
+            "patch",
+            f"/api/v1/categories/{category.id}/",
+            {"description": f"Written by round {index}"},
+            200,
+        ),
+        ("book DELETE", "delete", book_url, None, 204),
+        (
+            "author DELETE (has books)",
+            "delete",
+            f"/api/v1/authors/{book.author_id}/",
+            None,
+            400,
+        ),
+        (
+            "category DELETE",
+            "delete",
+            f"/api/v1/categories/{category.id}/",
+            None,
+            204,
+        ),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--books", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    setup_django("core.settings.production")
+    from django.conf import settings
+    from django.contrib.auth import get_user_model
+    from django.db import connection
+    from rest_framework.test import APIClient
+
+    from books.models.category import Category
+    from books.services.book_count_services import BookCountService
+
+    settings.BOOKS_RESPONSE_CACHE_ENABLED = False
+    logging.getLogger("core_commons").setLevel(logging.ERROR)
+    logging.getLogger("django.request").setLevel(logging.CRITICAL)
+
+    remove_fixtures()
+    rng = random.Random(args.seed)
+    seed(rng, args.books)
+    # seed() bulk inserts the books without maintaining the counters.
+    BookCountService.repair_authors()
+    BookCountService.repair_categories()
+    host = next(host for host in settings.ALLOWED_HOSTS if not host.startswith("."))
+    client = APIClient(HTTP_HOST=host, SERVER_PORT="443", secure=True)
+    user, _ = get_user_model().objects.get_or_create(username="benchmark")
+    client.force_authenticate(user=user)
+    category_ids = list(
+        Category.objects.exclude(name__startswith="Write path").values_list(
+            "id", flat=True
+        )
+    )
+
+    statements = [0]
+
+    def count(execute, sql, params, many, context):
+        statements[0] += 1
+        return execute(sql, params, many, context)
+
+    latencies = {}
+    queries = {}
+    for index in range(args.rounds):
+        book, category = make_fixtures(rng, index, category_ids)
+        for name, method, path, payload, expected in make_requests(
+            rng, index, book, category, category_ids
+        ):
+            statements[0] = 0
+            with connection.execute_wrapper(count):
+                started = time.perf_counter()
+                response = getattr(client, method)(path, payload, format="json")
+                elapsed = time.perf_counter() - started
+            if response.status_code != expected:
+                raise SystemExit(f"{name}: {response.status_code} {response.data}")
+            latencies.setdefault(name, []).append(elapsed)
+            queries[name] = statements[0]
+
+    print(f"database {connection.vendor}, {args.rounds:,} rounds")
+    print(f"{'endpoint':<26} {'p50':>11} {'p95':>11} {'statements':>11}")
+    for name, samples in latencies.items():
+        print(
+            f"{name:<26} {percentile(samples, 0.50) * 1000:>8.2f} ms"
+            f" {percentile(samples, 0.95) * 1000:>8.2f} ms {queries[name]:>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
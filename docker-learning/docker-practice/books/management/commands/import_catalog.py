@@ -0,0 +1,138 @@
+"""
+Stream a CSV or JSONL catalog into the database in batches.
+"""
+
+import json
+import os
+import time
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from books.services.catalog_import_services import (
+    CatalogImportError,
+    CatalogImportService,
+    parse_record,
+    read_records,
+)
+
+
+class Command(BaseCommand):
+    """
+    Import books, authors and categories from a flat file.
+
+    Every record is one book: title, isbn, price, author_name, author_email
+    and categories ("|"-separated in CSV, a list in JSONL). Authors are
+    matched by email, categories by name and books by ISBN; existing rows are
+    updated. Each batch is committed on its own, together with the book
+    counters of the authors and categories it touches, and with --checkpoint
+    the number of committed records is saved after every batch so an
+    interrupted import resumes where it stopped.
+
+    Usage:
+        python manage.py import_catalog books.csv
+        python manage.py import_catalog books.jsonl --batch-size 10000
+        python manage.py import_catalog books.csv --checkpoint books.ckpt
+    """
+
+    help = "Import a CSV or JSONL catalog of books in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help='Input file, or "-" for stdin.')
+        parser.add_argument(
+            "--format",
+            dest="file_format",
+            choices=["csv", "jsonl"],
+            help="Input format (default: from the file extension).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Records written per transaction (default: 5000).",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help="File recording committed records; resumes from it if present.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database alias to import into.",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        file_format = options["file_format"] or (
+            "csv" if path.lower().endswith(".csv") else "jsonl"
+        )
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be at least 1.")
+        checkpoint = options["checkpoint"]
+        using = options["database"]
+
+        done = self.read_checkpoint(checkpoint, path)
+        if done:
+            self.stdout.write(f"Resuming after {done} record(s).")
+
+        records = islice(read_records(path, file_format), done, None)
+        imported = 0
+        started = time.monotonic()
+        try:
+            while batch := self.next_batch(records, done + imported, batch_size):
+                CatalogImportService.import_batch(batch, using=using)
+                imported += len(batch)
+                self.write_checkpoint(checkpoint, path, done + imported)
+                if options["verbosity"] > 1:
+                    self.report(imported, started)
+        except CatalogImportError as err:
+            raise CommandError(
+                f"{err} ({done + imported} record(s) committed). "
+                "Fix the record and rerun to resume."
+            ) from err
+        except (OSError, ValueError) as err:
+            raise CommandError(f"Cannot read {path}: {err}") from err
+
+        self.stdout.write(self.style.SUCCESS(self.report_line(imported, started)))
+        if checkpoint and os.path.exists(checkpoint):
+            os.remove(checkpoint)
+
+    def next_batch(self, records, offset, batch_size):
+        """Parse the next batch; record numbers are 1-based for messages."""
+        return [
+            parse_record(raw, offset + index)
+            for index, raw in enumerate(islice(records, batch_size), start=1)
+        ]
+
+    def read_checkpoint(self, checkpoint, path):
+        """Return the number of records already committed from path."""
+        if not checkpoint or not os.path.exists(checkpoint):
+            return 0
+        with open(checkpoint, encoding="utf-8") as stream:
+            state = json.load(stream)
+        if state.get("path") != os.path.abspath(path):
+            raise CommandError(
+                f"Checkpoint {checkpoint} belongs to {state.get('path')}."
+            )
+        return state["records"]
+
+    def write_checkpoint(self, checkpoint, path, records):
+        """Atomically record the number of committed records."""
+        if not checkpoint:
+            return
+        temporary = f"{checkpoint}.tmp"
+        with open(temporary, "w", encoding="utf-8") as stream:
+            json.dump({"path": os.path.abspath(path), "records": records}, stream)
+        os.replace(temporary, checkpoint)
+
+    def report_line(self, imported, started):
+        """Describe the progress and throughput so far."""
+        elapsed = time.monotonic() - started
+        rate = imported / elapsed if elapsed else 0.0
+        return f"Imported {imported} record(s) in {elapsed:.1f}s ({rate:,.0f} rows/s)."
+
+    def report(self, imported, started):
+        """Write a progress line."""
+        self.stdout.write(self.report_line(imported, started))
@@ -0,0 +1,22 @@
+"""
+Print a signed X-Profile header value.
+"""
+
+from django.core.management.base import BaseCommand
+
+from core_commons.profiling import HEADER, make_profile_token
+
+
+class Command(BaseCommand):
+    """
+    Print a header profiling the requests that send it, while
+    PROFILER_ENABLED is on and until PROFILER_TOKEN_MAX_AGE expires.
+
+    Usage:
+        curl -H "$(python manage.py profile_token)" http://localhost:8000/api/v1/books/
+    """
+
+    help = "Print a signed X-Profile header for the sampling profiler."
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{HEADER}: {make_profile_token()}")
@@ -0,0 +1,58 @@
+"""
+Verify and repair the denormalized Author/Category book counters.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from books.services.book_count_services import BookCountService
+
+
+class Command(BaseCommand):
+    """
+    Compare the stored book counters with the real relations and fix drift.
+
+    Usage:
+        python manage.py sync_book_counts          # verify and repair
+        python manage.py sync_book_counts --check  # verify only, exit 1 on drift
+    """
+
+    help = "Verify and repair Author.book_count and Category.book_count."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report drift; exit with an error instead of repairing.",
+        )
+
+    def handle(self, *args, **options):
+        author_drift = BookCountService.find_author_drift()
+        category_drift = BookCountService.find_category_drift()
+
+        for label, drift in (("Author", author_drift), ("Category", category_drift)):
+            for object_id, stored, actual in drift:
+                self.stdout.write(
+                    f"{label} {object_id}: stored book_count={stored}, actual={actual}"
+                )
+
+        if not author_drift and not category_drift:
+            self.stdout.write(self.style.SUCCESS("Book counters are in sync."))
+            return
+
+        if options["check"]:
+            raise CommandError(
+                f"Book counters drifted for {len(author_drift)} author(s) "
+                f"and {len(category_drift)} category(ies)."
+            )
+
+        with transaction.atomic():
+            BookCountService.repair_authors([row[0] for row in author_drift])
+            BookCountService.repair_categories([row[0] for row in category_drift])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Repaired {len(author_drift)} author(s) "
+                f"and {len(category_drift)} category(ies)."
+            )
+        )
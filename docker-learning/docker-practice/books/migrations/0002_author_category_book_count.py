@@ -0,0 +1,78 @@
+# Generated by Django 5.0.2 on 2026-10-17 06:57
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_book_counts(apps, schema_editor):
+    """Populate the denormalized counters from the current relations."""
+    Author = apps.get_model("books", "Author")
+    Book = apps.get_model("books", "Book")
+    Category = apps.get_model("books", "Category")
+    BookCategory = Book.categories.through
+    db_alias = schema_editor.connection.alias
+
+    author_counts = (
+        Book.objects.using(db_alias)
+        .filter(author=OuterRef("pk"))
+        .order_by()
+        .values("author")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    Author.objects.using(db_alias).update(
+        book_count=Coalesce(Subquery(author_counts), 0)
+    )
+
+    category_counts = (
+        BookCategory.objects.using(db_alias)
+        .filter(category=OuterRef("pk"))
+        .order_by()
+        .values("category")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    Category.objects.using(db_alias).update(
+        book_count=Coalesce(Subquery(category_counts), 0)
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("books", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="author",
+            name="book_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Denormalized number of books, maintained by BookService",
+            ),
+        ),
+        migrations.AddField(
+            model_name="category",
+            name="book_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Denormalized number of books, maintained by BookService",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="author",
+            index=models.Index(
+                fields=["book_count"], name="authors_book_co_cb0bea_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(
+                fields=["book_count"], name="categories_book_co_dbae2b_idx"
+            ),
+        ),
+        migrations.RunPython(backfill_book_counts, migrations.RunPython.noop),
+    ]
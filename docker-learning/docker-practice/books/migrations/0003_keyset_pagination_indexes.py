@@ -0,0 +1,42 @@
+# Generated by Django 5.0.2 on 2026-10-17 07:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("books", "0002_author_category_book_count"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="author",
+            name="authors_created_5268e2_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="book",
+            name="books_created_a6d93f_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="category",
+            name="categories_created_7b3de3_idx",
+        ),
+        migrations.AddIndex(
+            model_name="author",
+            index=models.Index(
+                fields=["created_at", "id"], name="authors_created_a7aea3_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="book",
+            index=models.Index(
+                fields=["created_at", "id"], name="books_created_bc712c_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(
+                fields=["created_at", "id"], name="categories_created_b8f378_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,247 @@
+# Generated by Django 5.0.2 on 2026-10-17 07:01
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# PostgreSQL: triggers keep a weighted tsvector per row; GIN indexes serve
+# the @@ lookups. Renaming an author re-runs the trigger of their books. The
+# author and category triggers only fire for the indexed columns, so counter
+# updates do not recompute the vectors.
+POSTGRES_FORWARD = [
+    """
+    CREATE OR REPLACE FUNCTION books_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('simple', coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(NEW.isbn, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(
+                (SELECT name FROM authors WHERE id = NEW.author_id), '')), 'B');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER books_search_vector_trigger
+    BEFORE INSERT OR UPDATE ON books
+    FOR EACH ROW EXECUTE FUNCTION books_search_vector_update()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION authors_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('simple', coalesce(NEW.name, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(NEW.email, '')), 'B');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER authors_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF name, email ON authors
+    FOR EACH ROW EXECUTE FUNCTION authors_search_vector_update()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION authors_search_name_propagate() RETURNS trigger AS $$
+    BEGIN
+        IF NEW.name IS DISTINCT FROM OLD.name THEN
+            UPDATE books SET search_vector = NULL WHERE author_id = NEW.id;
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER authors_search_name_trigger
+    AFTER UPDATE OF name ON authors
+    FOR EACH ROW EXECUTE FUNCTION authors_search_name_propagate()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION categories_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('simple', coalesce(NEW.name, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(NEW.description, '')), 'B');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER categories_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF name, description ON categories
+    FOR EACH ROW EXECUTE FUNCTION categories_search_vector_update()
+    """,
+    # Backfill: the BEFORE UPDATE triggers compute the vectors (an UPDATE OF
+    # trigger fires when its columns are assigned, even to the same value).
+    "UPDATE authors SET name = name",
+    "UPDATE categories SET name = name",
+    "UPDATE books SET search_vector = NULL",
+    "CREATE INDEX books_search_vector_idx ON books USING gin (search_vector)",
+    "CREATE INDEX authors_search_vector_idx ON authors USING gin (search_vector)",
+    "CREATE INDEX categories_search_vector_idx ON categories USING gin (search_vector)",
+]
+
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS books_search_vector_idx",
+    "DROP INDEX IF EXISTS authors_search_vector_idx",
+    "DROP INDEX IF EXISTS categories_search_vector_idx",
+    "DROP TRIGGER IF EXISTS books_search_vector_trigger ON books",
+    "DROP TRIGGER IF EXISTS authors_search_vector_trigger ON authors",
+    "DROP TRIGGER IF EXISTS authors_search_name_trigger ON authors",
+    "DROP TRIGGER IF EXISTS categories_search_vector_trigger ON categories",
+    "DROP FUNCTION IF EXISTS books_search_vector_update()",
+    "DROP FUNCTION IF EXISTS authors_search_vector_update()",
+    "DROP FUNCTION IF EXISTS authors_search_name_propagate()",
+    "DROP FUNCTION IF EXISTS categories_search_vector_update()",
+]
+
+# SQLite: FTS5 tables keyed by the model id (rowid), maintained by triggers.
+# Migrations that rebuild books/authors/categories on SQLite (table remakes)
+# drop these triggers and must recreate them.
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE books_fts USING fts5(title, isbn, author_name)",
+    "CREATE VIRTUAL TABLE authors_fts USING fts5(name, email)",
+    "CREATE VIRTUAL TABLE categories_fts USING fts5(name, description)",
+    """
+    INSERT INTO books_fts(rowid, title, isbn, author_name)
+    SELECT books.id, books.title, books.isbn, authors.name
+    FROM books JOIN authors ON authors.id = books.author_id
+    """,
+    "INSERT INTO authors_fts(rowid, name, email) SELECT id, name, email FROM authors",
+    """
+    INSERT INTO categories_fts(rowid, name, description)
+    SELECT id, name, description FROM categories
+    """,
+    """
+    CREATE TRIGGER books_fts_insert AFTER INSERT ON books BEGIN
+        INSERT INTO books_fts(rowid, title, isbn, author_name)
+        VALUES (new.id, new.title, new.isbn,
+                (SELECT name FROM authors WHERE id = new.author_id));
+    END
+    """,
+    """
+    CREATE TRIGGER books_fts_update AFTER UPDATE OF title, isbn, author_id ON books
+    BEGIN
+        DELETE FROM books_fts WHERE rowid = old.id;
+        INSERT INTO books_fts(rowid, title, isbn, author_name)
+        VALUES (new.id, new.title, new.isbn,
+                (SELECT name FROM authors WHERE id = new.author_id));
+    END
+    """,
+    """
+    CREATE TRIGGER books_fts_delete AFTER DELETE ON books BEGIN
+        DELETE FROM books_fts WHERE rowid = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER authors_fts_insert AFTER INSERT ON authors BEGIN
+        INSERT INTO authors_fts(rowid, name, email) VALUES (new.id, new.name, new.email);
+    END
+    """,
+    """
+    CREATE TRIGGER authors_fts_update AFTER UPDATE OF name, email ON authors BEGIN
+        DELETE FROM authors_fts WHERE rowid = old.id;
+        INSERT INTO authors_fts(rowid, name, email) VALUES (new.id, new.name, new.email);
+        UPDATE books_fts SET author_name = new.name
+        WHERE rowid IN (SELECT id FROM books WHERE author_id = new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER authors_fts_delete AFTER DELETE ON authors BEGIN
+        DELETE FROM authors_fts WHERE rowid = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER categories_fts_insert AFTER INSERT ON categories BEGIN
+        INSERT INTO categories_fts(rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER categories_fts_update AFTER UPDATE OF name, description
+    ON categories BEGIN
+        DELETE FROM categories_fts WHERE rowid = old.id;
+        INSERT INTO categories_fts(rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER categories_fts_delete AFTER DELETE ON categories BEGIN
+        DELETE FROM categories_fts WHERE rowid = old.id;
+    END
+    """,
+]
+
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS books_fts_insert",
+    "DROP TRIGGER IF EXISTS books_fts_update",
+    "DROP TRIGGER IF EXISTS books_fts_delete",
+    "DROP TRIGGER IF EXISTS authors_fts_insert",
+    "DROP TRIGGER IF EXISTS authors_fts_update",
+    "DROP TRIGGER IF EXISTS authors_fts_delete",
+    "DROP TRIGGER IF EXISTS categories_fts_insert",
+    "DROP TRIGGER IF EXISTS categories_fts_update",
+    "DROP TRIGGER IF EXISTS categories_fts_delete",
+    "DROP TABLE IF EXISTS books_fts",
+    "DROP TABLE IF EXISTS authors_fts",
+    "DROP TABLE IF EXISTS categories_fts",
+]
+
+
+def _run(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def create_search_index(apps, schema_editor):
+    """Create the vendor specific search index and its triggers."""
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        _run(schema_editor, POSTGRES_FORWARD)
+    elif vendor == "sqlite":
+        _run(schema_editor, SQLITE_FORWARD)
+
+
+def drop_search_index(apps, schema_editor):
+    """Drop the vendor specific search index and its triggers."""
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        _run(schema_editor, POSTGRES_BACKWARD)
+    elif vendor == "sqlite":
+        _run(schema_editor, SQLITE_BACKWARD)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("books", "0003_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="author",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False,
+                help_text="Full-text document maintained by database triggers (PostgreSQL)",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="book",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False,
+                help_text="Full-text document maintained by database triggers (PostgreSQL)",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="category",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False,
+                help_text="Full-text document maintained by database triggers (PostgreSQL)",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.0.2 on 2026-10-17 09:12
+
+from django.db import migrations
+
+# PostgreSQL: GIN trigram indexes serve the strict word similarity (%>>)
+# lookups of fuzzy search. SQLite has no pg_trgm; books.search.trigram
+# indexes in process.
+# Reversing keeps the extension, other objects may depend on it.
+POSTGRES_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS authors_name_trgm_idx "
+    "ON authors USING gin (name gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS books_title_trgm_idx "
+    "ON books USING gin (title gin_trgm_ops)",
+]
+
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS authors_name_trgm_idx",
+    "DROP INDEX IF EXISTS books_title_trgm_idx",
+]
+
+
+def _run(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """Create the pg_trgm indexes on PostgreSQL."""
+    if schema_editor.connection.vendor == "postgresql":
+        _run(schema_editor, POSTGRES_FORWARD)
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    """Drop the pg_trgm indexes on PostgreSQL."""
+    if schema_editor.connection.vendor == "postgresql":
+        _run(schema_editor, POSTGRES_BACKWARD)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("books", "0004_full_text_search"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,86 @@
+# Generated by Django 5.0.2 on 2026-10-17 08:20
+
+from importlib import import_module
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+# SQLite rebuilds a table to add or drop a column constraint, which breaks
+# the full-text search triggers of 0004 that reference the other tables;
+# they are dropped for the rebuilds and recreated afterwards.
+full_text_search = import_module("books.migrations.0004_full_text_search")
+SQLITE_CREATE_TRIGGERS = [
+    statement
+    for statement in full_text_search.SQLITE_FORWARD
+    if "CREATE TRIGGER" in statement
+]
+SQLITE_DROP_TRIGGERS = [
+    statement
+    for statement in full_text_search.SQLITE_BACKWARD
+    if "DROP TRIGGER" in statement
+]
+
+
+def _run_on_sqlite(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor == "sqlite":
+            for statement in statements:
+                schema_editor.execute(statement)
+
+    return run
+
+
+drop_sqlite_triggers = _run_on_sqlite(SQLITE_DROP_TRIGGERS)
+create_sqlite_triggers = _run_on_sqlite(SQLITE_CREATE_TRIGGERS)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("books", "0005_trigram_indexes"),
+    ]
+
+    # Create the named constraints before dropping the column ones they
+    # replace, so uniqueness holds throughout.
+    operations = [
+        migrations.RunPython(drop_sqlite_triggers, create_sqlite_triggers),
+        migrations.AddConstraint(
+            model_name="author",
+            constraint=models.UniqueConstraint(
+                fields=("email",),
+                name="authors_email_uniq",
+                violation_error_message="An author with this email already exists.",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="book",
+            constraint=models.UniqueConstraint(
+                fields=("isbn",),
+                name="books_isbn_uniq",
+                violation_error_message="A book with this ISBN already exists",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="category",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("name"),
+                name="categories_name_ci_uniq",
+                violation_error_message="A category with this name already exists.",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="author",
+            name="email",
+            field=models.EmailField(max_length=254),
+        ),
+        migrations.AlterField(
+            model_name="book",
+            name="isbn",
+            field=models.CharField(max_length=13),
+        ),
+        migrations.AlterField(
+            model_name="category",
+            name="name",
+            field=models.CharField(max_length=100),
+        ),
+        migrations.RunPython(create_sqlite_triggers, drop_sqlite_triggers),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.0.2 on 2026-10-17 08:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("books", "0006_unique_constraints"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="author",
+            index=models.Index(
+                fields=["updated_at"], name="authors_updated_7e1396_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="book",
+            index=models.Index(fields=["updated_at"], name="books_updated_76a26e_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(
+                fields=["updated_at"], name="categories_updated_7b87f8_idx"
+            ),
+        ),
+    ]
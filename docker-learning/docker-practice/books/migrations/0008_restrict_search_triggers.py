@@ -0,0 +1,62 @@
+# Generated by Django 5.0.2 on 2026-10-17 12:40
+
+from django.db import migrations
+
+# Databases migrated before 0004 restricted the author and category search
+# triggers to their indexed columns still recompute the vectors on every
+# update, book counter updates included: recreate both triggers.
+POSTGRES_FORWARD = [
+    "DROP TRIGGER IF EXISTS authors_search_vector_trigger ON authors",
+    """
+    CREATE TRIGGER authors_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF name, email ON authors
+    FOR EACH ROW EXECUTE FUNCTION authors_search_vector_update()
+    """,
+    "DROP TRIGGER IF EXISTS categories_search_vector_trigger ON categories",
+    """
+    CREATE TRIGGER categories_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF name, description ON categories
+    FOR EACH ROW EXECUTE FUNCTION categories_search_vector_update()
+    """,
+]
+
+POSTGRES_BACKWARD = [
+    "DROP TRIGGER IF EXISTS authors_search_vector_trigger ON authors",
+    """
+    CREATE TRIGGER authors_search_vector_trigger
+    BEFORE INSERT OR UPDATE ON authors
+    FOR EACH ROW EXECUTE FUNCTION authors_search_vector_update()
+    """,
+    "DROP TRIGGER IF EXISTS categories_search_vector_trigger ON categories",
+    """
+    CREATE TRIGGER categories_search_vector_trigger
+    BEFORE INSERT OR UPDATE ON categories
+    FOR EACH ROW EXECUTE FUNCTION categories_search_vector_update()
+    """,
+]
+
+
+def _run(schema_editor, statements):
+    if schema_editor.connection.vendor == "postgresql":
+        for statement in statements:
+            schema_editor.execute(statement)
+
+
+def restrict_triggers(apps, schema_editor):
+    """Fire the search triggers for the indexed columns only."""
+    _run(schema_editor, POSTGRES_FORWARD)
+
+
+def unrestrict_triggers(apps, schema_editor):
+    """Fire the search triggers on every update again."""
+    _run(schema_editor, POSTGRES_BACKWARD)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("books", "0007_updated_at_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(restrict_triggers, unrestrict_triggers),
+    ]
@@ -2,6 +2,7 @@
 In this file, we will define the models for the authors app.
 """
 
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils import timezone
 
@@ -15,8 +16,18 @@ class Author(models.Model):
     """
 
     name = models.CharField(max_length=200)
-    email = models.EmailField(unique=True)
+    email = models.EmailField()
     bio = models.TextField(blank=True)
+    book_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Denormalized number of books, maintained by BookService",
+    )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Full-text document maintained by database triggers (PostgreSQL)",
+    )
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -26,7 +37,17 @@ class Author(models.Model):
         indexes = [
             models.Index(fields=["email"]),
             models.Index(fields=["name"]),
-            models.Index(fields=["created_at"]),
+            models.Index(fields=["created_at", "id"]),
+            # Watermark of the in-process search index refresh
+            models.Index(fields=["updated_at"]),
+            models.Index(fields=["book_count"]),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["email"],
+                name="authors_email_uniq",
+                violation_error_message="An author with this email already exists.",
+            ),
         ]
         verbose_name = "Author"
         verbose_name_plural = "Authors"
@@ -2,6 +2,7 @@
 In this file, we will define the models for the books app.
 """
 
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils import timezone
 
@@ -16,7 +17,7 @@ class Book(models.Model):
     """
 
     title = models.CharField(max_length=200)
-    isbn = models.CharField(max_length=13, unique=True)
+    isbn = models.CharField(max_length=13)
     price = models.DecimalField(max_digits=10, decimal_places=2)
     author = models.ForeignKey(
         "books.Author",
@@ -29,6 +30,11 @@ class Book(models.Model):
         related_name="books",
         help_text="Categories this book belongs to",
     )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Full-text document maintained by database triggers (PostgreSQL)",
+    )
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -38,7 +44,16 @@ class Book(models.Model):
         indexes = [
             models.Index(fields=["isbn"]),
             models.Index(fields=["title"]),
-            models.Index(fields=["created_at"]),
+            models.Index(fields=["created_at", "id"]),
+            # Watermark of the in-process search index refresh
+            models.Index(fields=["updated_at"]),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["isbn"],
+                name="books_isbn_uniq",
+                violation_error_message="A book with this ISBN already exists",
+            ),
         ]
 
     def __str__(self):
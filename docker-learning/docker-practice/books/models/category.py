@@ -2,7 +2,9 @@
 In this file, we will define the models for the categories app.
 """
 
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils import timezone
 
 
@@ -14,8 +16,18 @@ class Category(models.Model):
         - books: Reverse ManyToManyField from Book (many-to-many)
     """
 
-    name = models.CharField(max_length=100, unique=True)
+    name = models.CharField(max_length=100)
     description = models.TextField(blank=True)
+    book_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Denormalized number of books, maintained by BookService",
+    )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Full-text document maintained by database triggers (PostgreSQL)",
+    )
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -25,7 +37,19 @@ class Category(models.Model):
         verbose_name_plural = "categories"
         indexes = [
             models.Index(fields=["name"]),
-            models.Index(fields=["created_at"]),
+            models.Index(fields=["created_at", "id"]),
+            # Watermark of the in-process search index refresh
+            models.Index(fields=["updated_at"]),
+            models.Index(fields=["book_count"]),
+        ]
+        constraints = [
+            # Names are unique regardless of case: "Fiction" and "fiction"
+            # are the same category.
+            models.UniqueConstraint(
+                Lower("name"),
+                name="categories_name_ci_uniq",
+                violation_error_message="A category with this name already exists.",
+            ),
         ]
 
     def __str__(self):
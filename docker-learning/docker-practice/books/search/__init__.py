@@ -0,0 +1,3 @@
+"""
+Search backends for the books app.
+"""
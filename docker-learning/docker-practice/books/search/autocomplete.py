@@ -0,0 +1,112 @@
+"""
+In-process prefix index serving the autocomplete endpoint.
+
+Every row is indexed under each of its word starts ("The Hobbit" under
+"the hobbit" and "hobbit"), so a type-ahead prefix matches the beginning of
+any word. Keys are normalized (case folded, punctuation collapsed to single
+spaces) and kept in one sorted list; a lookup is a binary search followed by
+a scan of the matching run, independent of the table size.
+"""
+
+import re
+from bisect import bisect_left
+
+from books.search.indexes import InProcessIndex
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+# Longest indexed key; type-ahead prefixes never get close to it.
+KEY_LENGTH = 64
+
+
+def normalize(text):
+    """Case fold a string and collapse everything but words to single spaces."""
+    return " ".join(_WORD_RE.findall(text.casefold()))
+
+
+def word_start_keys(text):
+    """Return the index keys of a string, one per word start."""
+    normalized = normalize(text)
+    keys = []
+    start = 0
+    while start < len(normalized):
+        keys.append(normalized[start : start + KEY_LENGTH])
+        start = normalized.find(" ", start) + 1 or len(normalized)
+    return keys
+
+
+def _entry(key, object_id):
+    # "\0" sorts before every other character, so entries keep key order and
+    # the id suffix never affects prefix matching.
+    return f"{key}\0{object_id}"
+
+
+class PrefixIndex(InProcessIndex):
+    """
+    One sorted list of "key\\0id" entries over a text column.
+
+    Lookups read the list without the index lock, so it is never modified
+    once published: a refresh builds an updated copy and swaps it in with a
+    single assignment, and a lookup sees the keys and ids of either the old
+    list or the new one.
+    """
+
+    def load(self, rows):
+        texts = {}
+        entries = []
+        for object_id, text in rows:
+            texts[object_id] = text
+            entries.extend(_entry(key, object_id) for key in word_start_keys(text))
+        entries.sort()
+        self._texts = texts
+        self._entries = entries
+
+    def upsert(self, object_id, text):
+        self.upsert_many([(object_id, text)])
+
+    def upsert_many(self, rows):
+        stale = set()
+        fresh = []
+        for object_id, text in rows:
+            previous = self._texts.get(object_id)
+            if previous == text:
+                continue
+            if previous is not None:
+                stale.update(
+                    _entry(key, object_id) for key in word_start_keys(previous)
+                )
+            self._texts[object_id] = text
+            fresh.extend(_entry(key, object_id) for key in word_start_keys(text))
+        if not stale and not fresh:
+            return
+        entries = [entry for entry in self._entries if entry not in stale]
+        # Two sorted runs: the sort merges them in linear time.
+        fresh.sort()
+        entries.extend(fresh)
+        entries.sort()
+        self._entries = entries
+
+    def search(self, prefix, limit):
+        """
+        Return up to ``limit`` distinct (id, text) rows having a word that
+        starts with ``prefix``, in key order.
+        """
+        self.refresh()
+        prefix = normalize(prefix)[:KEY_LENGTH]
+        if not prefix:
+            return []
+
+        entries, texts = self._entries, self._texts
+        results = []
+        seen = set()
+        position = bisect_left(entries, prefix)
+        while position < len(entries) and len(results) < limit:
+            entry = entries[position]
+            if not entry.startswith(prefix):
+                break
+            object_id = int(entry.rpartition("\0")[2])
+            if object_id not in seen and object_id in texts:
+                seen.add(object_id)
+                results.append((object_id, texts[object_id]))
+            position += 1
+        return results
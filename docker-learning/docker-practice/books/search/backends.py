@@ -0,0 +1,160 @@
+"""
+Full-text search backends.
+
+The search documents are maintained by the database itself (see migration
+0004_full_text_search): a ``search_vector`` tsvector column with a GIN index
+and triggers on PostgreSQL, and FTS5 shadow tables with triggers on SQLite.
+Every write path (services, bulk inserts, raw SQL) therefore keeps the index
+in sync, and the backends below only translate a search into an indexed
+lookup plus a relevance score annotated as ``search_rank``.
+
+Fuzzy (typo-tolerant) search ranks rows by the pg_trgm
+``strict_word_similarity`` of the search term to a single column, served by
+GIN ``gin_trgm_ops`` indexes on PostgreSQL (migration 0005_trigram_indexes)
+and by the in-process index of ``books.search.trigram`` on SQLite. Both
+return the ids and scores of the best ``FUZZY_MAX_RESULTS`` matches, which
+the queryset is then restricted to, with the score annotated as
+``search_rank`` as well.
+
+``ts_rank`` and ``strict_word_similarity`` return ``real``; the PostgreSQL
+scores are cast to double precision so that a score read back from a
+keyset cursor (a Python float) compares equal to the row it came from.
+"""
+
+import re
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramStrictWordSimilarity,
+)
+from django.db import connections, transaction
+from django.db.models import Case, F, FloatField, Value, When
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Cast
+
+from books.search.indexes import get_index
+from books.search.trigram import TrigramIndex
+
+SEARCH_RANK = "search_rank"
+
+# Text search configuration used by the PostgreSQL triggers. "simple" keeps
+# names and ISBNs intact instead of stemming them as English words.
+POSTGRES_SEARCH_CONFIG = "simple"
+
+# FTS5 tables and column weights (bm25) per model table.
+SQLITE_FTS_TABLES = {
+    "books": ("books_fts", (10.0, 10.0, 5.0)),
+    "authors": ("authors_fts", (10.0, 5.0)),
+    "categories": ("categories_fts", (10.0, 5.0)),
+}
+
+# Upper bound of rows returned by a fuzzy search, on either backend; fuzzy
+# matches past the first few hundred are noise.
+FUZZY_MAX_RESULTS = 500
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(terms):
+    """Split search terms into plain word tokens, dropping query syntax."""
+    return [token for term in terms for token in _TOKEN_RE.findall(term)]
+
+
+def rank_matches(queryset, matches):
+    """
+    Restrict queryset to the (score, id) matches of a fuzzy search, with the
+    scores annotated as the search rank.
+    """
+    if not matches:
+        return queryset.none().annotate(**{SEARCH_RANK: Value(0.0)})
+    rank = Case(
+        *(When(pk=object_id, then=Value(score)) for score, object_id in matches),
+        output_field=FloatField(),
+    )
+    return queryset.filter(pk__in=[object_id for _, object_id in matches]).annotate(
+        **{SEARCH_RANK: rank}
+    )
+
+
+class PostgresSearchBackend:
+    """
+    Search the GIN-indexed ``search_vector`` column with a prefix tsquery.
+    """
+
+    def search(self, queryset, tokens):
+        query = SearchQuery(
+            " & ".join(f"{token}:*" for token in tokens),
+            config=POSTGRES_SEARCH_CONFIG,
+            search_type="raw",
+        )
+        return queryset.filter(search_vector=query).annotate(
+            **{
+                SEARCH_RANK: Cast(
+                    SearchRank(F("search_vector"), query), output_field=FloatField()
+                )
+            }
+        )
+
+    def fuzzy_search(self, queryset, field, term, threshold):
+        # %>> compares against pg_trgm.strict_word_similarity_threshold. It is
+        # set for one transaction only: a session setting would outlive the
+        # request and, behind a transaction pooler, apply to whichever client
+        # gets the connection next. The matches are read in that transaction.
+        similarity = Cast(
+            TrigramStrictWordSimilarity(term, field), output_field=FloatField()
+        )
+        with transaction.atomic(using=queryset.db):
+            with connections[queryset.db].cursor() as cursor:
+                cursor.execute(
+                    "SELECT set_config("
+                    "'pg_trgm.strict_word_similarity_threshold', %s, true)",
+                    [str(threshold)],
+                )
+            matches = list(
+                queryset.filter(**{f"{field}__trigram_strict_word_similar": term})
+                .annotate(similarity=similarity)
+                .order_by("-similarity", "-pk")
+                .values_list("similarity", "pk")[:FUZZY_MAX_RESULTS]
+            )
+        return rank_matches(queryset, matches)
+
+
+class SQLiteSearchBackend:
+    """
+    Search the FTS5 shadow table of the model and rank rows with bm25.
+    """
+
+    def search(self, queryset, tokens):
+        table = queryset.model._meta.db_table
+        fts_table, weights = SQLITE_FTS_TABLES[table]
+        match = " ".join('"{}"*'.format(token.replace('"', "")) for token in tokens)
+        bm25_args = ", ".join(str(weight) for weight in weights)
+
+        matching_ids = RawSQL(
+            f"SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH %s", (match,)
+        )
+        # bm25() is lower-is-better; negate it so higher ranks come first
+        # on both backends.
+        rank = RawSQL(
+            f"SELECT -bm25({fts_table}, {bm25_args}) FROM {fts_table} "
+            f'WHERE {fts_table} MATCH %s AND {fts_table}.rowid = "{table}"."id"',
+            (match,),
+        )
+        return queryset.filter(pk__in=matching_ids).annotate(**{SEARCH_RANK: rank})
+
+    def fuzzy_search(self, queryset, field, term, threshold):
+        index = get_index(TrigramIndex, queryset.model, field)
+        return rank_matches(queryset, index.search(term, threshold, FUZZY_MAX_RESULTS))
+
+
+def get_search_backend(alias):
+    """
+    Return the full-text backend for a database alias, None when unsupported.
+    """
+    vendor = connections[alias].vendor
+    if vendor == "postgresql":
+        return PostgresSearchBackend()
+    if vendor == "sqlite":
+        return SQLiteSearchBackend()
+    return None
@@ -0,0 +1,114 @@
+"""
+DRF filter backends that plug the search backends into the viewsets.
+"""
+
+from django.conf import settings
+from rest_framework import filters
+from rest_framework.exceptions import ValidationError
+from rest_framework.settings import api_settings
+
+from books.search.backends import SEARCH_RANK, get_search_backend, tokenize
+
+SEARCH_MODE_FULLTEXT = "fulltext"
+SEARCH_MODE_FUZZY = "fuzzy"
+
+
+class FullTextSearchFilter(filters.SearchFilter):
+    """
+    Drop-in replacement for SearchFilter backed by the full-text index.
+
+    The ``search`` parameter is matched as word prefixes against the indexed
+    document instead of ``ICONTAINS`` scans over ``search_fields``. Results are
+    ordered by relevance unless the client passes an explicit ``ordering``, so
+    this backend must come after OrderingFilter in ``filter_backends``.
+    Databases without a full-text backend fall back to SearchFilter.
+
+    ``search_mode=fuzzy`` switches views declaring a ``fuzzy_search_field`` to
+    typo-tolerant trigram matching on that column, keeping rows whose
+    similarity reaches ``similarity`` (0-1, defaults to
+    ``BOOKS_FUZZY_SIMILARITY_THRESHOLD``).
+    """
+
+    search_mode_param = "search_mode"
+    search_mode_description = (
+        "'fulltext' (default) matches word prefixes; 'fuzzy' tolerates typos."
+    )
+    similarity_param = "similarity"
+    similarity_description = "Minimum trigram similarity (0-1) for fuzzy search."
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+
+        backend = get_search_backend(queryset.db)
+        if backend is None:
+            return super().filter_queryset(request, queryset, view)
+
+        fuzzy_field = getattr(view, "fuzzy_search_field", None)
+        if fuzzy_field and self.get_search_mode(request) == SEARCH_MODE_FUZZY:
+            queryset = backend.fuzzy_search(
+                queryset,
+                fuzzy_field,
+                " ".join(terms),
+                self.get_similarity_threshold(request),
+            )
+        else:
+            tokens = tokenize(terms)
+            if not tokens:
+                return queryset
+            queryset = backend.search(queryset, tokens)
+
+        if not request.query_params.get(api_settings.ORDERING_PARAM):
+            queryset = queryset.order_by(f"-{SEARCH_RANK}", "-id")
+        return queryset
+
+    def get_search_mode(self, request):
+        mode = request.query_params.get(self.search_mode_param, SEARCH_MODE_FULLTEXT)
+        if mode not in (SEARCH_MODE_FULLTEXT, SEARCH_MODE_FUZZY):
+            raise ValidationError(
+                {
+                    self.search_mode_param: [
+                        f"Must be '{SEARCH_MODE_FULLTEXT}' or '{SEARCH_MODE_FUZZY}'."
+                    ]
+                }
+            )
+        return mode
+
+    def get_similarity_threshold(self, request):
+        value = request.query_params.get(self.similarity_param)
+        if value in (None, ""):
+            return settings.BOOKS_FUZZY_SIMILARITY_THRESHOLD
+        try:
+            threshold = float(value)
+        except ValueError:
+            threshold = -1.0
+        if not 0.0 < threshold <= 1.0:
+            raise ValidationError(
+                {self.similarity_param: ["Must be a number between 0 and 1."]}
+            )
+        return threshold
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        if getattr(view, "fuzzy_search_field", None):
+            parameters += [
+                {
+                    "name": self.search_mode_param,
+                    "required": False,
+                    "in": "query",
+                    "description": self.search_mode_description,
+                    "schema": {
+                        "type": "string",
+                        "enum": [SEARCH_MODE_FULLTEXT, SEARCH_MODE_FUZZY],
+                    },
+                },
+                {
+                    "name": self.similarity_param,
+                    "required": False,
+                    "in": "query",
+                    "description": self.similarity_description,
+                    "schema": {"type": "number", "minimum": 0, "maximum": 1},
+                },
+            ]
+        return parameters
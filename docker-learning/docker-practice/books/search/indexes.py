@@ -0,0 +1,145 @@
+"""
+Base class and registry for in-process search indexes.
+
+An in-process index mirrors one text column of a model in memory. There is
+one per process and model field, whatever the number of read replicas: it is
+loaded by the first lookup from the database the router picks for it then,
+and keeps reading from that one. Afterwards a background thread refreshes it
+incrementally from ``updated_at`` (indexed) every
+``BOOKS_SEARCH_INDEX_REFRESH_SECONDS``: it compares ``COUNT``/
+``MAX(updated_at)`` with its last snapshot, pulls the rows changed since then
+and rebuilds from scratch when rows disappeared. Lookups never wait for a
+refresh; with an interval of 0 they refresh inline instead (tests).
+"""
+
+import logging
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, router
+from django.db.models import Count, Max
+
+logger = logging.getLogger(__name__)
+
+# Rows committed slightly out of updated_at order are picked up by re-reading
+# this window behind the last watermark.
+REFRESH_OVERLAP = timedelta(seconds=60)
+
+
+class InProcessIndex:
+    """
+    Keep an in-memory structure in sync with one text column of a model.
+
+    Subclasses implement ``load`` (replace the content with (id, text) rows)
+    and ``upsert`` (index or re-index one row), keep the current text of every
+    row in ``self._texts`` and may override ``upsert_many`` and ``compact``.
+    """
+
+    def __init__(self, model, field, using=None):
+        self.model = model
+        self.field = field
+        self.using = using
+        self._lock = threading.Lock()
+        self._worker = None
+        self.clear()
+
+    def clear(self):
+        """Drop the indexed data; the next lookup rebuilds it."""
+        self.load(())
+        self._snapshot = None
+
+    def load(self, rows):
+        """Replace the index content with (id, text) rows."""
+        raise NotImplementedError
+
+    def upsert(self, object_id, text):
+        """Index or re-index a single row."""
+        raise NotImplementedError
+
+    def upsert_many(self, rows):
+        """Index or re-index (id, text) rows changed since the last refresh."""
+        for object_id, text in rows:
+            self.upsert(object_id, text)
+
+    def compact(self):
+        """Reclaim space left by replaced rows after a refresh."""
+
+    def refresh(self, force=False):
+        """
+        Load the index on first use and make sure the background refresh
+        runs; refresh inline when forced or with an interval of 0.
+        """
+        interval = getattr(settings, "BOOKS_SEARCH_INDEX_REFRESH_SECONDS", 1.0)
+        if force or not interval or self._snapshot is None:
+            self.update()
+        if interval and not (self._worker and self._worker.is_alive()):
+            with self._lock:
+                if not (self._worker and self._worker.is_alive()):
+                    self._worker = threading.Thread(
+                        target=self._refresh_forever,
+                        args=(interval,),
+                        name=f"search-index-{self.model._meta.label}.{self.field}",
+                        daemon=True,
+                    )
+                    self._worker.start()
+
+    def _refresh_forever(self, interval):
+        while True:
+            time.sleep(interval)
+            close_old_connections()
+            try:
+                self.update()
+            except Exception:
+                logger.exception(
+                    "Refreshing the %s.%s search index failed",
+                    self.model._meta.label,
+                    self.field,
+                )
+
+    def update(self):
+        """Bring the index up to date with the database."""
+        with self._lock:
+            if self.using is None:
+                self.using = router.db_for_read(self.model)
+            manager = self.model._default_manager.using(self.using)
+            snapshot = manager.aggregate(total=Count("pk"), last=Max("updated_at"))
+            previous = self._snapshot
+            if snapshot != previous:
+                if (
+                    previous is None
+                    or previous["last"] is None
+                    or snapshot["last"] is None
+                    or snapshot["last"] < previous["last"]
+                ):
+                    self.load(manager.values_list("pk", self.field).iterator())
+                else:
+                    changed = manager.filter(
+                        updated_at__gte=previous["last"] - REFRESH_OVERLAP
+                    ).values_list("pk", self.field)
+                    self.upsert_many(changed)
+                    if len(self._texts) != snapshot["total"]:
+                        self.load(manager.values_list("pk", self.field).iterator())
+                self.compact()
+                self._snapshot = snapshot
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_index(index_class, model, field):
+    """Return the process-wide index of a model field."""
+    key = (index_class, model._meta.label, field)
+    index = _indexes.get(key)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.setdefault(key, index_class(model, field))
+    return index
+
+
+def clear_indexes():
+    """Reset every in-process index of this process."""
+    for index in list(_indexes.values()):
+        index.clear()
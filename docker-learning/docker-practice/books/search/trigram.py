@@ -0,0 +1,160 @@
+"""
+In-process trigram index used for fuzzy search where pg_trgm is unavailable.
+
+Trigrams and scores follow pg_trgm: every lower-cased alphanumeric word is
+padded with two leading spaces and one trailing space, the similarity of two
+trigram sets is ``shared / (len(a) + len(b) - shared)``, and rows are scored
+with ``strict_word_similarity`` (the best similarity between the search term
+and any run of whole words of the row), so both backends accept the same
+thresholds and a misspelled surname still matches a full name.
+
+The index is an inverted list per trigram (compact ``array`` postings) plus
+the current text of every row, kept in sync by ``InProcessIndex``.
+"""
+
+import heapq
+import re
+from array import array
+from collections import Counter
+from functools import lru_cache
+
+from books.search.indexes import InProcessIndex
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+@lru_cache(maxsize=65536)
+def _word_trigrams(word):
+    padded = f"  {word} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+def trigrams(text):
+    """Return the pg_trgm trigram set of a string."""
+    result = set()
+    for word in _WORD_RE.findall(text.lower()):
+        result |= _word_trigrams(word)
+    return result
+
+
+def similarity(left, right):
+    """pg_trgm similarity between two trigram sets."""
+    if not left or not right:
+        return 0.0
+    shared = len(left & right)
+    return shared / (len(left) + len(right) - shared)
+
+
+def strict_word_similarity(query, text):
+    """
+    pg_trgm strict_word_similarity between a query trigram set and a string.
+    """
+    words = [_word_trigrams(word) for word in _WORD_RE.findall(text.lower())]
+    best = 0.0
+    for start in range(len(words)):
+        extent = set()
+        for word in words[start:]:
+            extent |= word
+            best = max(best, similarity(query, extent))
+    return best
+
+
+def _index_row(texts, shortest, postings, object_id, text):
+    """Add one row to the index structures; return its trigram count."""
+    words = [_word_trigrams(word) for word in _WORD_RE.findall(text.lower())]
+    texts[object_id] = text
+    if words:
+        shortest[object_id] = min(len(word) for word in words)
+    else:
+        shortest.pop(object_id, None)
+    grams = set().union(*words)
+    for trigram in grams:
+        row_ids = postings.get(trigram)
+        if row_ids is None:
+            row_ids = postings[trigram] = array("q")
+        row_ids.append(object_id)
+    return len(grams)
+
+
+class TrigramIndex(InProcessIndex):
+    """
+    Inverted trigram index over one text column of a model.
+
+    Besides the postings, every row keeps its text and the trigram count of
+    its shortest word, which bounds the score of any extent of the row and
+    prunes most candidates before the exact score is computed. Replaced or
+    deleted rows leave their old postings behind; they only add candidates
+    (scores are always recomputed from the current text) and are compacted
+    away by a rebuild once they outnumber the live postings.
+
+    The texts, shortest word sizes and postings are held in one tuple that
+    ``load`` replaces as a whole, so a search running during a rebuild reads
+    either the old structures or the new ones, never a mix of both.
+    """
+
+    @property
+    def _texts(self):
+        return self._data[0]
+
+    def load(self, rows):
+        """Replace the index content with (id, text) rows."""
+        texts, shortest, postings = {}, {}, {}
+        live = 0
+        for object_id, text in rows:
+            live += _index_row(texts, shortest, postings, object_id, text)
+        self._data = (texts, shortest, postings)
+        self._live = live
+        self._garbage = 0
+
+    def upsert(self, object_id, text):
+        """Index or re-index a single row."""
+        previous = self._texts.get(object_id)
+        if previous == text:
+            return
+        if previous is not None:
+            stale = len(trigrams(previous))
+            self._live -= stale
+            self._garbage += stale
+        self._live += _index_row(*self._data, object_id, text)
+
+    def search(self, term, threshold, limit):
+        """
+        Return up to ``limit`` (score, id) pairs with a similarity of at
+        least ``threshold``, best first.
+        """
+        self.refresh()
+        query = trigrams(term)
+        if not query:
+            return []
+
+        texts, shortest_words, postings = self._data
+        counts = Counter()
+        for trigram in query:
+            row_ids = postings.get(trigram)
+            if row_ids is not None:
+                counts.update(row_ids)
+
+        # An extent E of a row shares s <= shared trigrams with the query and
+        # has at least max(s, shortest) trigrams, so its similarity
+        # s / (len(query) + len(E) - s) is at most shared / len(query), and at
+        # most shared / (len(query) + shortest - shared) while
+        # shared <= shortest. Rows under either bound cannot match.
+        size = len(query)
+        min_shared = threshold * size
+        matches = []
+        for object_id, shared in counts.items():
+            if shared < min_shared:
+                continue
+            shortest = shortest_words.get(object_id)
+            if shortest is None or (
+                shared <= shortest and shared < threshold * (size + shortest - shared)
+            ):
+                continue
+            score = strict_word_similarity(query, texts[object_id])
+            if score >= threshold:
+                matches.append((score, object_id))
+        return heapq.nlargest(limit, matches)
+
+    def compact(self):
+        if self._garbage > self._live:
+            self.load(list(self._texts.items()))
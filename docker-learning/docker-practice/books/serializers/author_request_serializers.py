@@ -5,7 +5,6 @@ These serializers handle incoming data validation and transformation.
 
 from rest_framework import serializers
 
-from books.models.author import Author
 from books.serializers.author_serializers import AuthorSerializer
 
 
@@ -17,16 +16,14 @@ class AuthorCreateRequestSerializer(AuthorSerializer):
 
     class Meta(AuthorSerializer.Meta):
         fields = ["name", "email", "bio"]
+        # The authors_email_uniq constraint enforces uniqueness (AuthorService
+        # reports violations); no lookup query here.
+        extra_kwargs = {"email": {"validators": []}}
 
     def validate_email(self, value):
-        """Validate email format and uniqueness."""
+        """Validate email format."""
         if not value or "@" not in value:
             raise serializers.ValidationError("Please enter a valid email address.")
-
-        if Author.objects.filter(email=value).exists():
-            raise serializers.ValidationError(
-                "An author with this email already exists."
-            )
         return value
 
     def validate_name(self, value):
@@ -51,19 +48,12 @@ class AuthorUpdateRequestSerializer(AuthorSerializer):
 
     class Meta(AuthorSerializer.Meta):
         fields = ["name", "email", "bio"]
+        extra_kwargs = {"email": {"validators": []}}
 
     def validate_email(self, value):
-        """Validate email format and uniqueness, excluding current instance."""
+        """Validate email format."""
         if not value or "@" not in value:
             raise serializers.ValidationError("Please enter a valid email address.")
-
-        if (
-            self.instance
-            and Author.objects.exclude(pk=self.instance.pk).filter(email=value).exists()
-        ):
-            raise serializers.ValidationError(
-                "An author with this email already exists."
-            )
         return value
 
     def validate_name(self, value):
@@ -9,6 +9,7 @@ from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
 from books.serializers.author_serializers import AuthorSerializer
+from books.serializers.projections import Projection
 
 
 class AuthorListResponseSerializer(AuthorSerializer):
@@ -17,23 +18,35 @@ class AuthorListResponseSerializer(AuthorSerializer):
     Includes basic author information and book count.
     """
 
-    book_count = serializers.SerializerMethodField()
     full_name = serializers.SerializerMethodField()
 
     class Meta(AuthorSerializer.Meta):
         fields = ["id", "name", "full_name", "email", "book_count"]
 
-    @extend_schema_field(serializers.IntegerField)
-    def get_book_count(self, obj) -> int:
-        """Get the number of books by this author."""
-        return obj.books.count()
-
     @extend_schema_field(serializers.CharField)
     def get_full_name(self, obj) -> str:
         """Get the author's full name."""
         return f"{obj.name} ({obj.email})"
 
 
+class AuthorListProjection(Projection):
+    """
+    values() based twin of AuthorListResponseSerializer.
+    """
+
+    serializer_class = AuthorListResponseSerializer
+    columns = ("id", "name", "email", "book_count")
+
+    def to_representation(self, row):
+        return {
+            "id": row["id"],
+            "name": row["name"],
+            "full_name": f"{row['name']} ({row['email']})",
+            "email": row["email"],
+            "book_count": row["book_count"],
+        }
+
+
 class AuthorDetailResponseSerializer(AuthorSerializer):
     """
     Serializer for detailed author information.
@@ -6,9 +6,13 @@ This file serves as the primary interface for author serialization.
 from rest_framework import serializers
 
 from books.models.author import Author
+from books.serializers.field_plans import FieldPlanMixin
+from core_commons.server_timing import TimedSerializerMixin
 
 
-class AuthorSerializer(serializers.ModelSerializer):
+class AuthorSerializer(
+    TimedSerializerMixin, FieldPlanMixin, serializers.ModelSerializer
+):
     """
     Main serializer for the Author model.
     """
@@ -16,4 +20,4 @@ class AuthorSerializer(serializers.ModelSerializer):
     class Meta:
         model = Author
         fields = ["id", "name", "email", "bio", "created_at", "updated_at"]
-        read_only_fields = ["id", "created_at", "updated_at"]
+        read_only_fields = ["id", "book_count", "created_at", "updated_at"]
@@ -0,0 +1,32 @@
+"""
+Request serializers for the autocomplete endpoint.
+These serializers validate the type-ahead query parameters.
+"""
+
+from rest_framework import serializers
+
+from books.services.autocomplete_services import AUTOCOMPLETE_SOURCES
+
+
+class AutocompleteRequestSerializer(serializers.Serializer):
+    """
+    Serializer for the autocomplete query parameters.
+    """
+
+    q = serializers.CharField(max_length=100, trim_whitespace=True)
+    types = serializers.CharField(
+        required=False, default=",".join(AUTOCOMPLETE_SOURCES)
+    )
+    limit = serializers.IntegerField(
+        required=False, default=10, min_value=1, max_value=25
+    )
+
+    def validate_types(self, value):
+        """Split the comma separated suggestion types and check them."""
+        types = [name.strip() for name in value.split(",") if name.strip()]
+        unknown = sorted(set(types) - set(AUTOCOMPLETE_SOURCES))
+        if unknown or not types:
+            raise serializers.ValidationError(
+                f"Choose from: {', '.join(AUTOCOMPLETE_SOURCES)}."
+            )
+        return list(dict.fromkeys(types))
@@ -0,0 +1,26 @@
+"""
+Response serializers for the autocomplete endpoint.
+They document the suggestion payload, which the service builds directly.
+"""
+
+from rest_framework import serializers
+
+
+class AutocompleteSuggestionSerializer(serializers.Serializer):
+    """
+    Serializer for a single suggestion.
+    """
+
+    id = serializers.IntegerField()
+    text = serializers.CharField()
+
+
+class AutocompleteResponseSerializer(serializers.Serializer):
+    """
+    Serializer for the suggestions grouped by type.
+    Only the requested types are present.
+    """
+
+    books = AutocompleteSuggestionSerializer(many=True, required=False)
+    authors = AutocompleteSuggestionSerializer(many=True, required=False)
+    categories = AutocompleteSuggestionSerializer(many=True, required=False)
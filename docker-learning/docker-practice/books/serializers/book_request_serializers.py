@@ -3,12 +3,15 @@ Request serializers for the Book model.
 These serializers handle incoming data validation and transformation.
 """
 
+from django.conf import settings
 from rest_framework import serializers
 
 from books.models.book import Book
+from books.serializers.field_plans import FieldPlanMixin
+from books.services.book_export_services import EXPORT_FORMATS
 
 
-class BookCreateRequestSerializer(serializers.ModelSerializer):
+class BookCreateRequestSerializer(FieldPlanMixin, serializers.ModelSerializer):
     """
     Serializer for creating a new book.
     Handles validation of incoming data for book creation.
@@ -22,13 +25,14 @@ class BookCreateRequestSerializer(serializers.ModelSerializer):
     class Meta:
         model = Book
         fields = ["title", "isbn", "price", "author_id", "category_ids"]
+        # The books_isbn_uniq constraint enforces uniqueness (BookService
+        # reports violations); no lookup query here.
+        extra_kwargs = {"isbn": {"validators": []}}
 
     def validate_isbn(self, value):
-        """Validate ISBN format and uniqueness."""
+        """Validate ISBN format."""
         if len(value) != 13:
             raise serializers.ValidationError("ISBN must be 13 characters long")
-        if Book.objects.filter(isbn=value).exists():
-            raise serializers.ValidationError("A book with this ISBN already exists")
         return value
 
     def validate_price(self, value):
@@ -38,7 +42,7 @@ class BookCreateRequestSerializer(serializers.ModelSerializer):
         return value
 
 
-class BookUpdateRequestSerializer(serializers.ModelSerializer):
+class BookUpdateRequestSerializer(FieldPlanMixin, serializers.ModelSerializer):
     """
     Serializer for updating an existing book.
     All fields are optional for partial updates.
@@ -52,18 +56,12 @@ class BookUpdateRequestSerializer(serializers.ModelSerializer):
     class Meta:
         model = Book
         fields = ["title", "isbn", "price", "author_id", "category_ids"]
+        extra_kwargs = {"isbn": {"validators": []}}
 
     def validate_isbn(self, value):
-        """Validate ISBN format and uniqueness, excluding current instance."""
+        """Validate ISBN format."""
         if len(value) != 13:
             raise serializers.ValidationError("ISBN must be 13 characters long")
-
-        # Check if ISBN exists for other books
-        if (
-            self.instance
-            and Book.objects.exclude(pk=self.instance.pk).filter(isbn=value).exists()
-        ):
-            raise serializers.ValidationError("A book with this ISBN already exists")
         return value
 
     def validate_price(self, value):
@@ -71,3 +69,34 @@ class BookUpdateRequestSerializer(serializers.ModelSerializer):
         if value <= 0:
             raise serializers.ValidationError("Price must be greater than zero")
         return value
+
+
+class BookBulkItemRequestSerializer(BookCreateRequestSerializer):
+    """
+    Serializer for one book of a bulk creation.
+    Only validates the item itself: ISBN uniqueness, authors and categories
+    are checked for the whole batch by BookService.bulk_create_books.
+    """
+
+
+class BookBulkCreateRequestSerializer(serializers.Serializer):
+    """
+    Serializer for creating many books in one request.
+    """
+
+    books = BookBulkItemRequestSerializer(
+        many=True,
+        allow_empty=False,
+        max_length=settings.BOOKS_BULK_CREATE_MAX_ITEMS,
+    )
+
+
+class BookExportRequestSerializer(serializers.Serializer):
+    """
+    Serializer for the export query parameters.
+    ``format`` is reserved by DRF for renderer selection.
+    """
+
+    export_format = serializers.ChoiceField(
+        choices=list(EXPORT_FORMATS), required=False, default="ndjson"
+    )
@@ -9,6 +9,7 @@ from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
 from books.serializers.book_serializers import BookSerializer
+from books.serializers.projections import Projection
 
 
 class BookListResponseSerializer(BookSerializer):
@@ -40,6 +41,27 @@ class BookListResponseSerializer(BookSerializer):
         return None
 
 
+class BookListProjection(Projection):
+    """
+    values() based twin of BookListResponseSerializer.
+    """
+
+    serializer_class = BookListResponseSerializer
+    columns = ("id", "title", "isbn", "price", "author__name")
+    formatted = ("price",)
+
+    def to_representation(self, row):
+        price = row["price"]
+        return {
+            "id": row["id"],
+            "title": row["title"],
+            "isbn": row["isbn"],
+            "price": self.formatters["price"](price),
+            "price_display": None if price is None else f"${float(price):.2f}",
+            "author_name": row["author__name"],
+        }
+
+
 class BookDetailResponseSerializer(BookListResponseSerializer):
     """
     Serializer for detailed book information.
@@ -75,3 +97,22 @@ class BookDetailResponseSerializer(BookListResponseSerializer):
             }
             for category in obj.categories.all()
         ]
+
+
+class BookBulkCreatedItemSerializer(serializers.Serializer):
+    """
+    Serializer for a book created in bulk.
+    """
+
+    id = serializers.IntegerField()
+    isbn = serializers.CharField()
+
+
+class BookBulkCreateResponseSerializer(serializers.Serializer):
+    """
+    Serializer for the result of a bulk creation.
+    Books are listed in request order.
+    """
+
+    created = serializers.IntegerField()
+    books = BookBulkCreatedItemSerializer(many=True)
@@ -6,9 +6,11 @@ This file serves as the primary interface for book serialization.
 from rest_framework import serializers
 
 from books.models.book import Book
+from books.serializers.field_plans import FieldPlanMixin
+from core_commons.server_timing import TimedSerializerMixin
 
 
-class BookSerializer(serializers.ModelSerializer):
+class BookSerializer(TimedSerializerMixin, FieldPlanMixin, serializers.ModelSerializer):
     """
     Main serializer for the Book model.
     """
@@ -5,7 +5,6 @@ These serializers handle incoming data validation and transformation.
 
 from rest_framework import serializers
 
-from books.models.category import Category
 from books.serializers.category_serializers import CategorySerializer
 
 
@@ -17,18 +16,16 @@ class CategoryCreateRequestSerializer(CategorySerializer):
 
     class Meta(CategorySerializer.Meta):
         fields = ["name", "description"]
+        # The categories_name_ci_uniq constraint enforces uniqueness
+        # (CategoryService reports violations); no lookup query here.
+        extra_kwargs = {"name": {"validators": []}}
 
     def validate_name(self, value):
-        """Validate category name format and uniqueness."""
+        """Validate category name format."""
         if not value or len(value.strip()) < 2:
             raise serializers.ValidationError(
                 "Category name must be at least 2 characters long."
             )
-
-        if Category.objects.filter(name=value.strip()).exists():
-            raise serializers.ValidationError(
-                "A category with this name already exists."
-            )
         return value.strip()
 
     def validate_description(self, value):
@@ -53,23 +50,14 @@ class CategoryUpdateRequestSerializer(CategorySerializer):
 
     class Meta(CategorySerializer.Meta):
         fields = ["name", "description"]
+        extra_kwargs = {"name": {"validators": []}}
 
     def validate_name(self, value):
-        """Validate category name format and uniqueness, excluding current instance."""
+        """Validate category name format."""
         if value and len(value.strip()) < 2:
             raise serializers.ValidationError(
                 "Category name must be at least 2 characters long."
             )
-
-        if (
-            self.instance
-            and Category.objects.exclude(pk=self.instance.pk)
-            .filter(name=value.strip())
-            .exists()
-        ):
-            raise serializers.ValidationError(
-                "A category with this name already exists."
-            )
         return value.strip() if value else value
 
     def validate_description(self, value):
@@ -7,6 +7,7 @@ from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
 from books.serializers.category_serializers import CategorySerializer
+from books.serializers.projections import Projection
 
 
 class CategoryListResponseSerializer(CategorySerializer):
@@ -15,24 +16,35 @@ class CategoryListResponseSerializer(CategorySerializer):
     Includes book count and basic category details.
     """
 
-    book_count = serializers.SerializerMethodField()
     name_display = serializers.SerializerMethodField()
 
     class Meta(CategorySerializer.Meta):
         fields = ["id", "name", "name_display", "book_count"]
         read_only_fields = fields
 
-    @extend_schema_field(serializers.IntegerField)
-    def get_book_count(self, obj) -> int:
-        """Get the number of books in this category."""
-        return obj.books.count()
-
     @extend_schema_field(serializers.CharField)
     def get_name_display(self, obj) -> str:
         """Get the formatted category name."""
         return obj.name.strip().title()
 
 
+class CategoryListProjection(Projection):
+    """
+    values() based twin of CategoryListResponseSerializer.
+    """
+
+    serializer_class = CategoryListResponseSerializer
+    columns = ("id", "name", "book_count")
+
+    def to_representation(self, row):
+        return {
+            "id": row["id"],
+            "name": row["name"],
+            "name_display": row["name"].strip().title(),
+            "book_count": row["book_count"],
+        }
+
+
 class CategoryDetailResponseSerializer(CategorySerializer):
     """
     Serializer for detailed category information.
@@ -40,7 +52,6 @@ class CategoryDetailResponseSerializer(CategorySerializer):
     """
 
     books = serializers.SerializerMethodField()
-    book_count = serializers.SerializerMethodField()
     name_display = serializers.SerializerMethodField()
 
     class Meta(CategorySerializer.Meta):
@@ -56,11 +67,6 @@ class CategoryDetailResponseSerializer(CategorySerializer):
         ]
         read_only_fields = fields
 
-    @extend_schema_field(serializers.IntegerField)
-    def get_book_count(self, obj) -> int:
-        """Get the number of books in this category."""
-        return obj.books.count()
-
     @extend_schema_field(serializers.CharField)
     def get_name_display(self, obj) -> str:
         """Get the formatted category name."""
@@ -6,9 +6,13 @@ This file serves as the primary interface for category serialization.
 from rest_framework import serializers
 
 from books.models.category import Category
+from books.serializers.field_plans import FieldPlanMixin
+from core_commons.server_timing import TimedSerializerMixin
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(
+    TimedSerializerMixin, FieldPlanMixin, serializers.ModelSerializer
+):
     """
     Main serializer for the Category model.
     """
@@ -16,4 +20,4 @@ class CategorySerializer(serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = ["id", "name", "description", "created_at", "updated_at"]
-        read_only_fields = ["id", "created_at", "updated_at"]
+        read_only_fields = ["id", "book_count", "created_at", "updated_at"]
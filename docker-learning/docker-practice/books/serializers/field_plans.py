@@ -0,0 +1,48 @@
+"""
+Per-class field plans for the books serializers.
+
+``ModelSerializer.get_fields()`` introspects the model and deep-copies every
+declared field each time a serializer is instantiated, which for the small
+detail and request payloads costs more than serializing the data. The mixin
+below builds the unbound field dict once per serializer class and hands each
+instance cheap copies of it; DRF binds the copies to the instance as usual.
+"""
+
+import copy
+
+from rest_framework.serializers import BaseSerializer
+
+
+def copy_field(field):
+    """
+    Return an unbound copy of a plan field.
+
+    Plain fields are copied shallowly: binding only assigns attributes, and
+    their validators are stateless. Fields holding bound children (ListField,
+    nested serializers, many=True relations) are deep-copied, as DRF does.
+    """
+    if (
+        isinstance(field, BaseSerializer)
+        or hasattr(field, "child")
+        or hasattr(field, "child_relation")
+    ):
+        return copy.deepcopy(field)
+    return copy.copy(field)
+
+
+class FieldPlanMixin:
+    """
+    Cache the result of ``get_fields()`` per serializer class.
+
+    Only for serializers whose fields do not depend on the instance, the
+    context or the request (true for every serializer in books.serializers).
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        # Read the class's own __dict__ so subclasses build their own plan.
+        plan = cls.__dict__.get("_field_plan")
+        if plan is None:
+            plan = super().get_fields()
+            cls._field_plan = plan
+        return {name: copy_field(field) for name, field in plan.items()}
@@ -0,0 +1,54 @@
+"""
+Projection-based representations for read-only list responses.
+
+A projection produces exactly the output of a list response serializer from
+``values()`` rows: only the needed columns are fetched and every row becomes
+a dict directly, without model instances or per-field serializer calls.
+Model fields reuse the serializer's own field for formatting (decimals,
+dates), so both paths render byte-identical JSON.
+"""
+
+from functools import cached_property
+
+from core_commons.server_timing import measure
+
+
+class Projection:
+    """
+    Base class of list projections.
+
+    Subclasses name the serializer they mirror, the ``values()`` columns they
+    read and implement ``to_representation(row)``; ``formatted`` holds the
+    serializer fields whose ``to_representation`` must be applied to a column.
+    """
+
+    serializer_class = None
+    columns = ()
+    formatted = ()
+
+    @cached_property
+    def formatters(self):
+        """to_representation of the serializer fields named in ``formatted``."""
+        fields = self.serializer_class().fields
+        return {name: fields[name].to_representation for name in self.formatted}
+
+    def values(self, queryset):
+        """
+        Return queryset as values() rows of the projection columns plus the
+        ordering columns the keyset paginator reads from each row.
+        """
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        extra = [
+            "id" if name == "pk" else name
+            for name in (term.lstrip("-") for term in ordering if isinstance(term, str))
+        ]
+        columns = list(dict.fromkeys([*self.columns, *extra]))
+        return queryset.prefetch_related(None).values(*columns)
+
+    def represent(self, rows):
+        """Return the list representation of the rows."""
+        with measure("serialize"):
+            return [self.to_representation(row) for row in rows]
+
+    def to_representation(self, row):
+        raise NotImplementedError
@@ -0,0 +1,21 @@
+"""
+Request serializers for the query statistics endpoint.
+These serializers validate the query parameters of the report.
+"""
+
+from rest_framework import serializers
+
+from core_commons.query_stats import ORDERINGS
+
+
+class QueryStatsRequestSerializer(serializers.Serializer):
+    """
+    Serializer for the query statistics parameters.
+    """
+
+    limit = serializers.IntegerField(
+        required=False, default=20, min_value=1, max_value=500
+    )
+    order_by = serializers.ChoiceField(
+        choices=ORDERINGS, required=False, default="total_ms"
+    )
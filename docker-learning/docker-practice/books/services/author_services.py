@@ -4,10 +4,19 @@ This layer handles complex business operations and keeps viewsets clean.
 """
 
 from django.db import models, transaction
-from django.shortcuts import get_object_or_404
+from django.db.models.functions import Coalesce
+from django.shortcuts import aget_object_or_404, get_object_or_404
 from rest_framework.exceptions import ValidationError
 
 from books.models.author import Author
+from books.models.book import Book
+from books.utils import (
+    afetch_all,
+    apply_changes,
+    bump_versions,
+    save_changes,
+    unique_violations,
+)
 
 
 class AuthorService:
@@ -19,8 +28,11 @@ class AuthorService:
     def get_all_authors():
         """
         Retrieve all authors with optimized queries.
+
+        The book count is read from the denormalized Author.book_count column,
+        so list pages cost a fixed number of queries.
         """
-        return Author.objects.prefetch_related("books").all()
+        return Author.objects.all()
 
     @staticmethod
     def get_author_by_id(author_id):
@@ -34,13 +46,12 @@ class AuthorService:
     def create_author(validated_data):
         """
         Create a new author with business logic validation.
-        """
-        # Check for duplicate email
-        email = validated_data.get("email")
-        if Author.objects.filter(email=email).exists():
-            raise ValidationError({"email": "Author with this email already exists."})
 
-        author = Author.objects.create(**validated_data)
+        The email is unique by constraint: a duplicate is a ValidationError.
+        """
+        with unique_violations(Author):
+            author = Author.objects.create(**validated_data)
+        bump_versions("authors")
         return author
 
     @staticmethod
@@ -48,19 +59,16 @@ class AuthorService:
     def update_author(author_id, validated_data):
         """
         Update an existing author with business logic validation.
-        """
-        author = AuthorService.get_author_by_id(author_id)
-
-        # Check for duplicate email (excluding current author)
-        email = validated_data.get("email")
-        if email and Author.objects.filter(email=email).exclude(id=author_id).exists():
-            raise ValidationError({"email": "Author with this email already exists."})
 
-        # Update fields
-        for field, value in validated_data.items():
-            setattr(author, field, value)
+        Only the row is loaded and only the changed columns are written; the
+        book counter is never overwritten with the value read here.
+        """
+        author = get_object_or_404(Author, id=author_id)
 
-        author.save()
+        changed = apply_changes(author, validated_data)
+        with unique_violations(Author):
+            if save_changes(author, changed):
+                bump_versions("authors")
         return author
 
     @staticmethod
@@ -68,12 +76,21 @@ class AuthorService:
     def delete_author(author_id):
         """
         Delete an author with business logic checks.
+
+        The guard checks for books that exist rather than trusting the
+        denormalized counter: books cascade with their author, so a drifted
+        counter must not let them be deleted. The author row is locked, so
+        no book can be assigned between the check and the delete.
         """
-        author = AuthorService.get_author_by_id(author_id)
+        books = Book.objects.filter(author_id=models.OuterRef("pk"))
+        author = get_object_or_404(
+            Author.objects.select_for_update().annotate(has_books=models.Exists(books)),
+            id=author_id,
+        )
 
         # Check if author has books
-        book_count = author.books.count()
-        if book_count > 0:
+        if author.has_books:
+            book_count = Book.objects.filter(author_id=author.id).count()
             raise ValidationError(
                 {
                     "detail": f"Cannot delete author. Author has {book_count} book(s) assigned. "
@@ -82,6 +99,7 @@ class AuthorService:
             )
 
         author.delete()
+        bump_versions("authors")
         return True
 
     @staticmethod
@@ -89,21 +107,69 @@ class AuthorService:
         """
         Get all books by a specific author.
         """
-        author = AuthorService.get_author_by_id(author_id)
+        author = get_object_or_404(Author, id=author_id)
+        # The reverse manager caches the author on every book it returns.
         return author.books.all()
 
+    @staticmethod
+    async def aget_author_books(author_id):
+        """
+        Async variant of get_author_books.
+        """
+        author = await aget_object_or_404(Author, id=author_id)
+        return await afetch_all(author.books.all())
+
     @staticmethod
     def get_author_statistics(author_id):
         """
         Get statistics for an author.
+
+        Computed by a single query: the book count and average price are
+        aggregated over the author's books, while the distinct category count
+        and the latest title come from correlated subqueries (joining the
+        categories directly would duplicate book rows and skew the average).
+        """
+        stats = get_object_or_404(AuthorService._statistics_query(author_id))
+        return AuthorService._format_statistics(stats)
+
+    @staticmethod
+    async def aget_author_statistics(author_id):
         """
-        author = AuthorService.get_author_by_id(author_id)
-        books = author.books.all()
+        Async variant of get_author_statistics; the same single query.
+        """
+        stats = await aget_object_or_404(AuthorService._statistics_query(author_id))
+        return AuthorService._format_statistics(stats)
 
+    @staticmethod
+    def _statistics_query(author_id):
+        category_count = (
+            Book.categories.through.objects.filter(book__author=models.OuterRef("pk"))
+            .order_by()
+            .values("book__author")
+            .annotate(total=models.Count("category", distinct=True))
+            .values("total")
+        )
+        latest_title = (
+            Book.objects.filter(author=models.OuterRef("pk"))
+            .order_by("-created_at")
+            .values("title")[:1]
+        )
+        return (
+            Author.objects.filter(id=author_id)
+            .annotate(
+                total_books=models.Count("books"),
+                total_categories=Coalesce(models.Subquery(category_count), 0),
+                average_price=models.Avg("books__price"),
+                latest_book=models.Subquery(latest_title),
+            )
+            .values("total_books", "total_categories", "average_price", "latest_book")
+        )
+
+    @staticmethod
+    def _format_statistics(stats):
         return {
-            "total_books": books.count(),
-            "total_categories": books.values("categories").distinct().count(),
-            "average_price": books.aggregate(avg_price=models.Avg("price"))["avg_price"]
-            or 0,
-            "latest_book": books.first().title if books.exists() else None,
+            "total_books": stats["total_books"],
+            "total_categories": stats["total_categories"],
+            "average_price": stats["average_price"] or 0,
+            "latest_book": stats["latest_book"],
         }
@@ -0,0 +1,40 @@
+"""
+Business logic services for type-ahead suggestions.
+Suggestions are served from in-process prefix indexes, so a keystroke costs a
+binary search instead of a database query.
+"""
+
+from books.models.author import Author
+from books.models.book import Book
+from books.models.category import Category
+from books.search.autocomplete import PrefixIndex
+from books.search.indexes import get_index
+
+# Suggestion type -> (model, indexed field).
+AUTOCOMPLETE_SOURCES = {
+    "books": (Book, "title"),
+    "authors": (Author, "name"),
+    "categories": (Category, "name"),
+}
+
+
+class AutocompleteService:
+    """
+    Service class for prefix suggestions over titles and names.
+    """
+
+    @staticmethod
+    def suggest(query, types, limit):
+        """
+        Return up to limit {"id", "text"} suggestions per requested type whose
+        words start with the query.
+        """
+        suggestions = {}
+        for name in types:
+            model, field = AUTOCOMPLETE_SOURCES[name]
+            index = get_index(PrefixIndex, model, field)
+            suggestions[name] = [
+                {"id": object_id, "text": text}
+                for object_id, text in index.search(query, limit)
+            ]
+        return suggestions
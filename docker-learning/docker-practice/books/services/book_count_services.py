@@ -0,0 +1,160 @@
+"""
+Business logic services for the denormalized book counters.
+Author.book_count and Category.book_count are kept in sync by the book
+write paths; this layer owns the updates and the drift repair.
+"""
+
+from django.db import DEFAULT_DB_ALIAS, models
+from django.db.models.functions import Coalesce
+
+from books.models.author import Author
+from books.models.book import Book
+from books.models.category import Category
+from books.utils import bump_versions
+
+
+def _group_by_delta(deltas):
+    """Invert {id: delta} into {delta: [ids]}, dropping zero deltas."""
+    groups = {}
+    for object_id, delta in deltas.items():
+        if delta:
+            groups.setdefault(delta, []).append(object_id)
+    return groups
+
+
+class BookCountService:
+    """
+    Service class for maintaining the author and category book counters.
+    """
+
+    @staticmethod
+    def adjust_author(author_id, delta):
+        """
+        Add delta to an author's book counter.
+        """
+        if delta:
+            Author.objects.filter(id=author_id).update(
+                book_count=models.F("book_count") + delta
+            )
+
+    @staticmethod
+    def adjust_categories(category_ids, delta):
+        """
+        Add delta to the book counter of every given category.
+        """
+        category_ids = set(category_ids)
+        if delta and category_ids:
+            Category.objects.filter(id__in=category_ids).update(
+                book_count=models.F("book_count") + delta
+            )
+
+    @staticmethod
+    def adjust_authors(deltas):
+        """
+        Apply {author_id: delta} with one UPDATE per distinct delta.
+        """
+        for delta, author_ids in _group_by_delta(deltas).items():
+            Author.objects.filter(id__in=author_ids).update(
+                book_count=models.F("book_count") + delta
+            )
+
+    @staticmethod
+    def adjust_category_counts(deltas):
+        """
+        Apply {category_id: delta} with one UPDATE per distinct delta.
+        """
+        for delta, category_ids in _group_by_delta(deltas).items():
+            Category.objects.filter(id__in=category_ids).update(
+                book_count=models.F("book_count") + delta
+            )
+
+    @staticmethod
+    def adjust_book_categories(book_id, delta):
+        """
+        Add delta to the book counter of every category of a book, without
+        loading the categories.
+        """
+        if delta:
+            Category.objects.filter(books=book_id).update(
+                book_count=models.F("book_count") + delta
+            )
+
+    @staticmethod
+    def author_total():
+        """Expression counting the books of the outer author."""
+        return Coalesce(models.Subquery(BookCountService._author_counts()), 0)
+
+    @staticmethod
+    def category_total():
+        """Expression counting the books of the outer category."""
+        return Coalesce(models.Subquery(BookCountService._category_counts()), 0)
+
+    @staticmethod
+    def _author_counts():
+        """Subquery returning the real number of books for an outer author."""
+        return (
+            Book.objects.filter(author=models.OuterRef("pk"))
+            .order_by()
+            .values("author")
+            .annotate(total=models.Count("pk"))
+            .values("total")
+        )
+
+    @staticmethod
+    def _category_counts():
+        """Subquery returning the real number of books for an outer category."""
+        return (
+            Book.categories.through.objects.filter(category=models.OuterRef("pk"))
+            .order_by()
+            .values("category")
+            .annotate(total=models.Count("pk"))
+            .values("total")
+        )
+
+    @staticmethod
+    def find_author_drift():
+        """
+        Return (id, stored, actual) for every author whose counter has drifted.
+        """
+        actual = BookCountService.author_total()
+        return list(
+            Author.objects.annotate(actual=actual)
+            .exclude(book_count=models.F("actual"))
+            .order_by("id")
+            .values_list("id", "book_count", "actual")
+        )
+
+    @staticmethod
+    def find_category_drift():
+        """
+        Return (id, stored, actual) for every category whose counter has drifted.
+        """
+        actual = BookCountService.category_total()
+        return list(
+            Category.objects.annotate(actual=actual)
+            .exclude(book_count=models.F("actual"))
+            .order_by("id")
+            .values_list("id", "book_count", "actual")
+        )
+
+    @staticmethod
+    def repair_authors(author_ids=None, using=DEFAULT_DB_ALIAS):
+        """
+        Recompute the counter of the given authors (all authors when None).
+        """
+        queryset = Author.objects.using(using)
+        if author_ids is not None:
+            queryset = queryset.filter(id__in=author_ids)
+        bump_versions("authors")
+        return queryset.update(book_count=BookCountService.author_total())
+
+    @staticmethod
+    def repair_categories(category_ids=None, using=DEFAULT_DB_ALIAS):
+        """
+        Recompute the counter of the given categories (all categories when None).
+        """
+        queryset = Category.objects.using(using)
+        if category_ids is not None:
+            queryset = queryset.filter(id__in=category_ids)
+        bump_versions("categories")
+        return queryset.update(book_count=BookCountService.category_total())
@@ -0,0 +1,170 @@
+"""
+Business logic services for full catalog exports.
+Books are read with a server-side cursor and encoded chunk by chunk, so an
+export holds one chunk in memory whatever the size of the catalog.
+"""
+
+import csv
+import io
+from itertools import islice
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from books.models.book import Book
+from books.utils import chunked
+
+EXPORT_FIELDS = [
+    "id",
+    "title",
+    "isbn",
+    "price",
+    "author_id",
+    "category_ids",
+    "created_at",
+    "updated_at",
+]
+
+# Export format -> (content type, file extension)
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv", "csv"),
+}
+
+# Separator of the category ids in the CSV "category_ids" column (the same as
+# in the import_catalog "categories" column).
+CATEGORY_SEPARATOR = "|"
+
+
+class BookExportService:
+    """
+    Service class for streaming every book of the catalog.
+    """
+
+    @staticmethod
+    def book_rows():
+        """Return the queryset of the book rows, without their categories."""
+        return Book.objects.order_by("id").values(
+            *(field for field in EXPORT_FIELDS if field != "category_ids")
+        )
+
+    @staticmethod
+    def category_links(ids):
+        """Return the (book id, category id) pairs of the given books."""
+        return (
+            Book.categories.through.objects.filter(book_id__in=ids)
+            .order_by("book_id", "category_id")
+            .values_list("book_id", "category_id")
+        )
+
+    @staticmethod
+    def add_category_ids(chunk, links):
+        """Set the "category_ids" of the rows of chunk from their links."""
+        category_ids = {}
+        for book_id, category_id in links:
+            category_ids.setdefault(book_id, []).append(category_id)
+        for row in chunk:
+            row["category_ids"] = category_ids.get(row["id"], [])
+        return chunk
+
+    @staticmethod
+    def iter_chunks(chunk_size=None):
+        """
+        Yield lists of book rows (dicts of EXPORT_FIELDS) in id order.
+        Category ids are loaded with one query per chunk.
+        """
+        chunk_size = chunk_size or settings.BOOKS_EXPORT_CHUNK_SIZE
+        rows = BookExportService.book_rows().iterator(chunk_size=chunk_size)
+        while chunk := list(islice(rows, chunk_size)):
+            links = [
+                link
+                for ids in chunked([row["id"] for row in chunk])
+                for link in BookExportService.category_links(ids)
+            ]
+            yield BookExportService.add_category_ids(chunk, links)
+
+    @staticmethod
+    async def aiter_chunks(chunk_size=None):
+        """iter_chunks through the async ORM."""
+        chunk_size = chunk_size or settings.BOOKS_EXPORT_CHUNK_SIZE
+
+        async def with_categories(chunk):
+            links = [
+                link
+                for ids in chunked([row["id"] for row in chunk])
+                async for link in BookExportService.category_links(ids)
+            ]
+            return BookExportService.add_category_ids(chunk, links)
+
+        chunk = []
+        rows = BookExportService.book_rows().aiterator(chunk_size=chunk_size)
+        async for row in rows:
+            chunk.append(row)
+            if len(chunk) == chunk_size:
+                yield await with_categories(chunk)
+                chunk = []
+        if chunk:
+            yield await with_categories(chunk)
+
+    @staticmethod
+    def ndjson_encoder():
+        """Return the header and the chunk encoder of newline-delimited JSON."""
+        encoder = DjangoJSONEncoder()
+
+        def encode(chunk):
+            return "".join(f"{encoder.encode(row)}\n" for row in chunk)
+
+        return "", encode
+
+    @staticmethod
+    def csv_encoder():
+        """Return the header line and the chunk encoder of CSV."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        def encode(chunk):
+            for row in chunk:
+                writer.writerow(
+                    [
+                        *(row[field] for field in EXPORT_FIELDS[:5]),
+                        CATEGORY_SEPARATOR.join(map(str, row["category_ids"])),
+                        row["created_at"].isoformat(),
+                        row["updated_at"].isoformat(),
+                    ]
+                )
+            encoded = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            return encoded
+
+        writer.writerow(EXPORT_FIELDS)
+        return encode([]), encode
+
+    @staticmethod
+    def encoder(export_format):
+        """Return (header, chunk encoder) of the given format."""
+        if export_format == "csv":
+            return BookExportService.csv_encoder()
+        return BookExportService.ndjson_encoder()
+
+    @staticmethod
+    def stream(export_format, chunk_size=None):
+        """Return an iterator of encoded strings for the given format."""
+        header, encode = BookExportService.encoder(export_format)
+        if header:
+            yield header
+        for chunk in BookExportService.iter_chunks(chunk_size):
+            yield encode(chunk)
+
+    @staticmethod
+    async def astream(export_format, chunk_size=None):
+        """
+        stream as an async iterator. Under ASGI a StreamingHttpResponse
+        reads a sync iterator to the end (sync_to_async(list)) before sending
+        anything; this one is read chunk by chunk.
+        """
+        header, encode = BookExportService.encoder(export_format)
+        if header:
+            yield header
+        async for chunk in BookExportService.aiter_chunks(chunk_size):
+            yield encode(chunk)
@@ -3,13 +3,15 @@ Business logic services for the books app.
 This layer handles complex business operations and keeps viewsets clean.
 """
 
-from django.db import transaction
+from django.db import models, transaction
 from django.shortcuts import get_object_or_404
 from rest_framework.exceptions import ValidationError
 
 from books.models.author import Author
 from books.models.book import Book
 from books.models.category import Category
+from books.services.book_count_services import BookCountService
+from books.utils import apply_changes, bump_versions, unique_violations, values_by
 
 
 class BookService:
@@ -67,67 +69,220 @@ class BookService:
                     }
                 )
 
-        # Create book
-        book = Book.objects.create(author=author, **validated_data)
+        # Create book; the ISBN is unique by constraint
+        with unique_violations(Book):
+            book = Book.objects.create(author=author, **validated_data)
 
         # Add categories
         if category_ids:
             book.categories.set(category_ids)
 
+        # Keep the denormalized counters in sync
+        BookCountService.adjust_author(author.id, 1)
+        BookCountService.adjust_categories(category_ids, 1)
+
+        bump_versions("books")
         return book
 
+    @staticmethod
+    @transaction.atomic
+    def bulk_create_books(items):
+        """
+        Create many books at once, all or nothing.
+
+        ISBNs, authors and categories are checked for the whole batch with a
+        handful of set-based queries; every failing item is reported under
+        its index, including ISBNs another request inserts before this one.
+        Books and their category links are then inserted with
+        bulk_create, and the counters are updated with one UPDATE per
+        distinct delta. Returns the created books in request order.
+        """
+        isbns = [item["isbn"] for item in items]
+        author_ids = {item["author_id"] for item in items}
+        category_ids = {
+            category_id for item in items for category_id in item["category_ids"]
+        }
+
+        existing_isbns = set(values_by(Book.objects, "isbn", set(isbns)))
+        existing_authors = set(values_by(Author.objects, "id", author_ids))
+        existing_categories = set(values_by(Category.objects, "id", category_ids))
+
+        errors = {}
+        seen_isbns = set()
+        for index, item in enumerate(items):
+            item_errors = {}
+            if item["isbn"] in existing_isbns:
+                item_errors["isbn"] = ["A book with this ISBN already exists"]
+            elif item["isbn"] in seen_isbns:
+                item_errors["isbn"] = ["Duplicate ISBN in this request"]
+            seen_isbns.add(item["isbn"])
+            if item["author_id"] not in existing_authors:
+                item_errors["author_id"] = ["Author with this ID does not exist."]
+            invalid_ids = sorted(set(item["category_ids"]) - existing_categories)
+            if invalid_ids:
+                item_errors["category_ids"] = [
+                    f"Categories with IDs {invalid_ids} do not exist."
+                ]
+            if item_errors:
+                errors[index] = item_errors
+        if errors:
+            raise ValidationError({"books": errors})
+
+        try:
+            with unique_violations(Book), transaction.atomic():
+                books = Book.objects.bulk_create(
+                    Book(
+                        title=item["title"],
+                        isbn=item["isbn"],
+                        price=item["price"],
+                        author_id=item["author_id"],
+                    )
+                    for item in items
+                )
+        except ValidationError as err:
+            # A concurrent request committed one of the ISBNs after the
+            # check: check again to report the items it took.
+            existing_isbns = set(values_by(Book.objects, "isbn", set(isbns)))
+            errors = {
+                index: err.detail
+                for index, item in enumerate(items)
+                if item["isbn"] in existing_isbns
+            }
+            if not errors:
+                raise
+            raise ValidationError({"books": errors}) from err
+        if any(book.pk is None for book in books):
+            # Backends that cannot return rows from a bulk insert
+            ids = values_by(Book.objects, "isbn", isbns)
+            for book in books:
+                book.pk = ids[book.isbn]
+
+        Through = Book.categories.through
+        Through.objects.bulk_create(
+            Through(book_id=book.pk, category_id=category_id)
+            for book, item in zip(books, items, strict=True)
+            for category_id in set(item["category_ids"])
+        )
+
+        author_deltas = {}
+        category_deltas = {}
+        for item in items:
+            author_deltas[item["author_id"]] = (
+                author_deltas.get(item["author_id"], 0) + 1
+            )
+            for category_id in set(item["category_ids"]):
+                category_deltas[category_id] = category_deltas.get(category_id, 0) + 1
+        BookCountService.adjust_authors(author_deltas)
+        BookCountService.adjust_category_counts(category_deltas)
+
+        bump_versions("books")
+        return books
+
     @staticmethod
     @transaction.atomic
     def update_book(book_id, validated_data):
         """
         Update an existing book with business logic validation.
+
+        The book is loaded with its author only: the category links are read
+        as ids when the request replaces them, and the categories fetched to
+        validate the new ids are reused by the response. Only the changed
+        columns and links are written.
+
+        The book row is locked first: the author and category counters are
+        adjusted from the links and author read next, which a concurrent
+        update of the same book must not change in between.
         """
-        book = BookService.get_book_by_id(book_id)
+        book = get_object_or_404(
+            Book.objects.select_related("author").select_for_update(of=("self",)),
+            id=book_id,
+        )
+        changed = []
 
         # Handle author update
         if "author_id" in validated_data:
             author_id = validated_data.pop("author_id")
-            try:
-                author = Author.objects.get(id=author_id)
+            if author_id != book.author_id:
+                try:
+                    author = Author.objects.get(id=author_id)
+                except Author.DoesNotExist as err:
+                    raise ValidationError(
+                        {"author_id": "Author with this ID does not exist."}
+                    ) from err
+                BookCountService.adjust_author(book.author_id, -1)
+                BookCountService.adjust_author(author.id, 1)
                 book.author = author
-            except Author.DoesNotExist as err:
-                raise ValidationError(
-                    {"author_id": "Author with this ID does not exist."}
-                ) from err
+                changed.append("author")
 
         # Handle categories update
+        categories_changed = False
         if "category_ids" in validated_data:
-            category_ids = validated_data.pop("category_ids")
-            if category_ids:
-                existing_categories = Category.objects.filter(id__in=category_ids)
-                if len(existing_categories) != len(category_ids):
-                    invalid_ids = set(category_ids) - set(
-                        existing_categories.values_list("id", flat=True)
-                    )
-                    raise ValidationError(
-                        {
-                            "category_ids": f"Categories with IDs {list(invalid_ids)} do not exist."
-                        }
-                    )
-                book.categories.set(category_ids)
-            else:
-                book.categories.clear()
+            category_ids = set(validated_data.pop("category_ids"))
+            categories = list(Category.objects.filter(id__in=category_ids))
+            if len(categories) != len(category_ids):
+                invalid_ids = category_ids - {category.id for category in categories}
+                raise ValidationError(
+                    {
+                        "category_ids": f"Categories with IDs {list(invalid_ids)} do not exist."
+                    }
+                )
+            categories_changed = BookService._replace_categories(book, category_ids)
+            _cache_categories(book, categories)
 
         # Update other fields
-        for field, value in validated_data.items():
-            setattr(book, field, value)
+        changed += apply_changes(book, validated_data)
 
-        book.save()
+        # New links alone still touch updated_at
+        if changed or categories_changed:
+            with unique_violations(Book):
+                book.save(update_fields=[*changed, "updated_at"])
+            bump_versions("books")
         return book
 
+    @staticmethod
+    def _replace_categories(book, category_ids):
+        """
+        Link book to exactly category_ids, writing only the links that
+        differ. Return whether any link changed. The caller holds the lock
+        on the book row, so the links read here stay current.
+        """
+        Through = Book.categories.through
+        current_ids = set(
+            Through.objects.filter(book_id=book.id).values_list(
+                "category_id", flat=True
+            )
+        )
+        removed = current_ids - category_ids
+        added = category_ids - current_ids
+        if removed:
+            Through.objects.filter(book_id=book.id, category_id__in=removed).delete()
+            BookCountService.adjust_categories(removed, -1)
+        if added:
+            Through.objects.bulk_create(
+                Through(book_id=book.id, category_id=category_id)
+                for category_id in added
+            )
+            BookCountService.adjust_categories(added, 1)
+        return bool(removed or added)
+
     @staticmethod
     @transaction.atomic
     def delete_book(book_id):
         """
         Delete a book with business logic checks.
+
+        Only the author id is loaded; the category counters are decremented
+        through the book's links without reading them. The row is locked so
+        that concurrent deletes of the same book decrement the counters once:
+        the second one finds no book and gets a 404.
         """
-        book = BookService.get_book_by_id(book_id)
+        book = get_object_or_404(
+            Book.objects.select_for_update().only("id", "author_id"), id=book_id
+        )
+        BookCountService.adjust_author(book.author_id, -1)
+        BookCountService.adjust_book_categories(book.id, -1)
         book.delete()
+        bump_versions("books")
         return True
 
     @staticmethod
@@ -135,22 +290,44 @@ class BookService:
     def add_category_to_book(book_id, category_id):
         """
         Add a category to a book.
+
+        The category is loaded together with whether it is already linked.
+        The book row is locked first, so that check is not raced by another
+        request linking the same category; a link written anyway (by the
+        catalog import) is skipped rather than failing the request.
         """
-        book = BookService.get_book_by_id(book_id)
+        book = get_object_or_404(
+            Book.objects.select_related("author").select_for_update(of=("self",)),
+            id=book_id,
+        )
+        Through = Book.categories.through
 
-        try:
-            category = Category.objects.get(id=category_id)
-        except Category.DoesNotExist as err:
+        category = (
+            Category.objects.filter(id=category_id)
+            .annotate(
+                assigned=models.Exists(
+                    Through.objects.filter(
+                        book_id=book.id, category_id=models.OuterRef("pk")
+                    )
+                )
+            )
+            .first()
+        )
+        if category is None:
             raise ValidationError(
                 {"category_id": "Category with this ID does not exist."}
-            ) from err
+            )
 
-        if book.categories.filter(id=category_id).exists():
+        if category.assigned:
             raise ValidationError(
                 {"category_id": "Category is already assigned to this book."}
             )
 
-        book.categories.add(category)
+        Through.objects.bulk_create(
+            [Through(book_id=book.id, category_id=category.id)], ignore_conflicts=True
+        )
+        BookCountService.adjust_categories([category.id], 1)
+        bump_versions("books")
         return book
 
     @staticmethod
@@ -158,13 +335,33 @@ class BookService:
     def remove_category_from_book(book_id, category_id):
         """
         Remove a category from a book.
+
+        Deleting the link tells whether it existed, without a lookup first.
         """
-        book = BookService.get_book_by_id(book_id)
+        book = get_object_or_404(Book.objects.select_related("author"), id=book_id)
 
-        if not book.categories.filter(id=category_id).exists():
+        deleted, _ = Book.categories.through.objects.filter(
+            book_id=book.id, category_id=category_id
+        ).delete()
+        if not deleted:
             raise ValidationError(
                 {"category_id": "Category is not assigned to this book."}
             )
 
-        book.categories.remove(category_id)
+        BookCountService.adjust_categories([category_id], -1)
+        bump_versions("books")
         return book
+
+
+def _cache_categories(book, categories):
+    """
+    Store categories as the prefetched book.categories.all(), so the response
+    serializer does not read back the links just written. categories must be
+    in Category.Meta.ordering, as a query returns them.
+    """
+    if not hasattr(book, "_prefetched_objects_cache"):
+        book._prefetched_objects_cache = {}
+    queryset = book.categories.all()
+    queryset._result_cache = categories
+    queryset._prefetch_done = True
+    book._prefetched_objects_cache["categories"] = queryset
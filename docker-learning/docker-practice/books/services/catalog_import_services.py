@@ -0,0 +1,295 @@
+"""
+Business logic services for bulk catalog imports.
+
+Records are streamed from CSV or JSONL one at a time and written in batches:
+authors are resolved by email, categories by name and books by ISBN, all
+three as upserts, so importing the same file twice is harmless. PostgreSQL
+batches are COPYed into temporary staging tables and merged with set-based
+INSERT ... ON CONFLICT statements; other backends use bulk_create with
+conflict handling.
+"""
+
+import csv
+import io
+import json
+import sys
+from decimal import Decimal, InvalidOperation
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models.functions import Lower
+
+from books.models.author import Author
+from books.models.book import Book
+from books.models.category import Category
+from books.services.book_count_services import BookCountService
+from books.utils import bump_versions, chunked, values_by
+
+FIELDS = ["title", "isbn", "price", "author_name", "author_email", "categories"]
+
+# Separator of the category names in the CSV "categories" column
+CATEGORY_SEPARATOR = "|"
+
+
+class CatalogImportError(ValueError):
+    """An input record cannot be imported."""
+
+
+def _open(path):
+    if path == "-":
+        return sys.stdin
+    return open(path, encoding="utf-8", newline="")
+
+
+def read_records(path, file_format):
+    """
+    Yield the raw records (dicts) of a CSV or JSONL file, or of stdin for "-".
+    Only the current record is held in memory.
+    """
+    stream = _open(path)
+    try:
+        if file_format == "csv":
+            yield from csv.DictReader(stream)
+        else:
+            for line in stream:
+                if line.strip():
+                    yield json.loads(line)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def parse_record(raw, number):
+    """Validate a raw record and return it with typed values."""
+    if not isinstance(raw, dict):
+        raise CatalogImportError(f"Record {number}: expected an object")
+    missing = [field for field in FIELDS[:-1] if not raw.get(field)]
+    if missing:
+        raise CatalogImportError(f"Record {number}: missing {', '.join(missing)}")
+
+    isbn = str(raw["isbn"]).strip()
+    if len(isbn) != 13:
+        raise CatalogImportError(f"Record {number}: ISBN must be 13 characters long")
+    try:
+        price = Decimal(str(raw["price"]))
+    except InvalidOperation as err:
+        raise CatalogImportError(f"Record {number}: invalid price") from err
+    if price <= 0:
+        raise CatalogImportError(f"Record {number}: price must be greater than zero")
+
+    categories = raw.get("categories") or []
+    if isinstance(categories, str):
+        categories = categories.split(CATEGORY_SEPARATOR)
+    return {
+        "title": str(raw["title"]).strip(),
+        "isbn": isbn,
+        "price": price,
+        "author_name": str(raw["author_name"]).strip(),
+        "author_email": str(raw["author_email"]).strip(),
+        "categories": sorted({name.strip() for name in categories if name.strip()}),
+    }
+
+
+def _category_ids(names, using):
+    """
+    Return {lowercased name: id} of the categories, which are unique ignoring
+    case. Names are looked up as written first, then ignoring case for those
+    that match another spelling (Python and SQL lowercase differently beyond
+    ASCII on SQLite).
+    """
+    queryset = Category.objects.using(using)
+    found = {
+        name.lower(): category_id
+        for name, category_id in values_by(queryset, "name", names).items()
+    }
+    missing = {name.lower() for name in names} - found.keys()
+    if missing:
+        found.update(values_by(queryset.annotate(key=Lower("name")), "key", missing))
+    return found
+
+
+def _latest(records, key):
+    """Keep the last record per key; upserts cannot touch a row twice."""
+    return list({record[key]: record for record in records}.values())
+
+
+class CatalogImportService:
+    """
+    Service class for importing catalog records in batches.
+    """
+
+    @staticmethod
+    def import_batch(records, using=DEFAULT_DB_ALIAS):
+        """
+        Upsert one batch of parsed records in a single transaction, with the
+        book counters of every author and category it touches: the authors
+        of its books before and after (a book may move) and the categories
+        it links. A failed or interrupted import leaves no counter behind.
+        """
+        isbns = {record["isbn"] for record in records}
+        books = Book.objects.using(using)
+        with transaction.atomic(using=using):
+            author_ids = set(values_by(books, "isbn", isbns, "author_id").values())
+            if connections[using].vendor == "postgresql":
+                CatalogImportService._copy_batch(records, using)
+            else:
+                CatalogImportService._bulk_batch(records, using)
+            author_ids.update(values_by(books, "isbn", isbns, "author_id").values())
+
+            links = Book.categories.through.objects.using(using)
+            category_ids = set()
+            for chunk in chunked(isbns, using):
+                category_ids.update(
+                    links.filter(book__isbn__in=chunk).values_list(
+                        "category_id", flat=True
+                    )
+                )
+
+            BookCountService.repair_authors(author_ids, using=using)
+            BookCountService.repair_categories(category_ids, using=using)
+            bump_versions("books")
+
+    @staticmethod
+    def _bulk_batch(records, using):
+        """Upsert a batch with bulk_create on any backend."""
+        authors = _latest(records, "author_email")
+        Author.objects.using(using).bulk_create(
+            [
+                Author(name=record["author_name"], email=record["author_email"])
+                for record in authors
+            ],
+            update_conflicts=True,
+            unique_fields=["email"],
+            update_fields=["name", "updated_at"],
+        )
+        author_ids = values_by(
+            Author.objects.using(using),
+            "email",
+            [record["author_email"] for record in authors],
+        )
+
+        names = {name for record in records for name in record["categories"]}
+        Category.objects.using(using).bulk_create(
+            [Category(name=name) for name in names], ignore_conflicts=True
+        )
+        category_ids = _category_ids(names, using)
+
+        books = _latest(records, "isbn")
+        Book.objects.using(using).bulk_create(
+            [
+                Book(
+                    title=record["title"],
+                    isbn=record["isbn"],
+                    price=record["price"],
+                    author_id=author_ids[record["author_email"]],
+                )
+                for record in books
+            ],
+            update_conflicts=True,
+            unique_fields=["isbn"],
+            update_fields=["title", "price", "author", "updated_at"],
+        )
+        book_ids = values_by(
+            Book.objects.using(using), "isbn", [record["isbn"] for record in books]
+        )
+
+        Through = Book.categories.through
+        Through.objects.using(using).bulk_create(
+            [
+                Through(
+                    book_id=book_ids[record["isbn"]],
+                    category_id=category_ids[name.lower()],
+                )
+                for record in records
+                for name in record["categories"]
+            ],
+            ignore_conflicts=True,
+        )
+
+    @staticmethod
+    def _copy_batch(records, using):
+        """Upsert a batch through COPY and set-based merges on PostgreSQL."""
+        connection = connections[using]
+        quote = connection.ops.quote_name
+        through = Book.categories.through._meta.db_table
+
+        books_data = io.StringIO()
+        links_data = io.StringIO()
+        books_writer = csv.writer(books_data)
+        links_writer = csv.writer(links_data)
+        for seq, record in enumerate(records):
+            books_writer.writerow(
+                [
+                    seq,
+                    record["title"],
+                    record["isbn"],
+                    record["price"],
+                    record["author_name"],
+                    record["author_email"],
+                ]
+            )
+            for name in record["categories"]:
+                links_writer.writerow([record["isbn"], name])
+        books_data.seek(0)
+        links_data.seek(0)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS import_catalog_books "
+                "(seq integer, title text, isbn text, price numeric, "
+                "author_name text, author_email text) ON COMMIT DELETE ROWS"
+            )
+            cursor.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS import_catalog_links "
+                "(isbn text, category_name text) ON COMMIT DELETE ROWS"
+            )
+            # Rows are dropped on commit; truncate for batches nested in an
+            # outer transaction.
+            cursor.execute("TRUNCATE import_catalog_books, import_catalog_links")
+            cursor.copy_expert(
+                "COPY import_catalog_books FROM STDIN WITH (FORMAT csv)", books_data
+            )
+            cursor.copy_expert(
+                "COPY import_catalog_links FROM STDIN WITH (FORMAT csv)", links_data
+            )
+            # Unchanged rows are skipped so their updated_at (which drives the
+            # in-process search index refresh) stays put.
+            cursor.execute(
+                f"INSERT INTO {quote(Author._meta.db_table)} "
+                "(name, email, bio, book_count, created_at, updated_at) "
+                "SELECT DISTINCT ON (author_email) author_name, author_email, '', 0, "
+                "now(), now() FROM import_catalog_books "
+                "ORDER BY author_email, seq DESC "
+                "ON CONFLICT (email) DO UPDATE "
+                "SET name = EXCLUDED.name, updated_at = EXCLUDED.updated_at "
+                f"WHERE {quote(Author._meta.db_table)}.name <> EXCLUDED.name"
+            )
+            cursor.execute(
+                f"INSERT INTO {quote(Category._meta.db_table)} "
+                "(name, description, book_count, created_at, updated_at) "
+                "SELECT DISTINCT category_name, '', 0, now(), now() "
+                "FROM import_catalog_links "
+                "ON CONFLICT ((lower(name))) DO NOTHING"
+            )
+            cursor.execute(
+                f"INSERT INTO {quote(Book._meta.db_table)} "
+                "(title, isbn, price, author_id, created_at, updated_at) "
+                "SELECT DISTINCT ON (s.isbn) s.title, s.isbn, s.price, a.id, "
+                "now(), now() FROM import_catalog_books s "
+                f"JOIN {quote(Author._meta.db_table)} a ON a.email = s.author_email "
+                "ORDER BY s.isbn, s.seq DESC "
+                "ON CONFLICT (isbn) DO UPDATE "
+                "SET title = EXCLUDED.title, price = EXCLUDED.price, "
+                "author_id = EXCLUDED.author_id, updated_at = EXCLUDED.updated_at "
+                f"WHERE ({quote(Book._meta.db_table)}.title, "
+                f"{quote(Book._meta.db_table)}.price, "
+                f"{quote(Book._meta.db_table)}.author_id) "
+                "IS DISTINCT FROM (EXCLUDED.title, EXCLUDED.price, EXCLUDED.author_id)"
+            )
+            cursor.execute(
+                f"INSERT INTO {quote(through)} (book_id, category_id) "
+                "SELECT DISTINCT b.id, c.id FROM import_catalog_links l "
+                f"JOIN {quote(Book._meta.db_table)} b ON b.isbn = l.isbn "
+                f"JOIN {quote(Category._meta.db_table)} c "
+                "ON lower(c.name) = lower(l.category_name) "
+                "ON CONFLICT (book_id, category_id) DO NOTHING"
+            )
@@ -4,10 +4,18 @@ This layer handles complex business operations and keeps viewsets clean.
 """
 
 from django.db import models, transaction
-from django.shortcuts import get_object_or_404
+from django.shortcuts import aget_object_or_404, get_object_or_404
 from rest_framework.exceptions import ValidationError
 
+from books.models.book import Book
 from books.models.category import Category
+from books.utils import (
+    afetch_all,
+    apply_changes,
+    bump_versions,
+    save_changes,
+    unique_violations,
+)
 
 
 class CategoryService:
@@ -19,8 +27,11 @@ class CategoryService:
     def get_all_categories():
         """
         Retrieve all categories with optimized queries.
+
+        The book count is read from the denormalized Category.book_count
+        column, so list pages cost a fixed number of queries.
         """
-        return Category.objects.prefetch_related("books").all()
+        return Category.objects.all()
 
     @staticmethod
     def get_category_by_id(category_id):
@@ -36,13 +47,13 @@ class CategoryService:
     def create_category(validated_data):
         """
         Create a new category with business logic validation.
-        """
-        # Check for duplicate name
-        name = validated_data.get("name")
-        if Category.objects.filter(name__iexact=name).exists():
-            raise ValidationError({"name": "Category with this name already exists."})
 
-        category = Category.objects.create(**validated_data)
+        The name is unique, ignoring case, by constraint: a duplicate is a
+        ValidationError.
+        """
+        with unique_violations(Category):
+            category = Category.objects.create(**validated_data)
+        bump_versions("categories")
         return category
 
     @staticmethod
@@ -50,24 +61,16 @@ class CategoryService:
     def update_category(category_id, validated_data):
         """
         Update an existing category with business logic validation.
-        """
-        category = CategoryService.get_category_by_id(category_id)
 
-        # Check for duplicate name (excluding current category)
-        name = validated_data.get("name")
-        if (
-            name
-            and Category.objects.filter(name__iexact=name)
-            .exclude(id=category_id)
-            .exists()
-        ):
-            raise ValidationError({"name": "Category with this name already exists."})
-
-        # Update fields
-        for field, value in validated_data.items():
-            setattr(category, field, value)
+        Only the row is loaded and only the changed columns are written; the
+        book counter is never overwritten with the value read here.
+        """
+        category = get_object_or_404(Category, id=category_id)
 
-        category.save()
+        changed = apply_changes(category, validated_data)
+        with unique_violations(Category):
+            if save_changes(category, changed):
+                bump_versions("categories")
         return category
 
     @staticmethod
@@ -75,12 +78,24 @@ class CategoryService:
     def delete_category(category_id):
         """
         Delete a category with business logic checks.
+
+        The guard checks for links that exist rather than trusting the
+        denormalized counter, which may have drifted. The category row is
+        locked, so no book can be linked between the check and the delete.
         """
-        category = CategoryService.get_category_by_id(category_id)
+        links = Book.categories.through.objects.filter(
+            category_id=models.OuterRef("pk")
+        )
+        category = get_object_or_404(
+            Category.objects.select_for_update().annotate(
+                has_books=models.Exists(links)
+            ),
+            id=category_id,
+        )
 
         # Check if category has books
-        book_count = category.books.count()
-        if book_count > 0:
+        if category.has_books:
+            book_count = category.books.count()
             raise ValidationError(
                 {
                     "detail": f"Cannot delete category. Category has {book_count} book(s) assigned. "
@@ -89,6 +104,7 @@ class CategoryService:
             )
 
         category.delete()
+        bump_versions("categories")
         return True
 
     @staticmethod
@@ -96,27 +112,74 @@ class CategoryService:
         """
         Get all books in a specific category.
         """
-        category = CategoryService.get_category_by_id(category_id)
-        return category.books.select_related("author").all()
+        category = get_object_or_404(Category, id=category_id)
+        return category.books.select_related("author")
+
+    @staticmethod
+    async def aget_category_books(category_id):
+        """
+        Async variant of get_category_books.
+        """
+        category = await aget_object_or_404(Category, id=category_id)
+        return await afetch_all(category.books.select_related("author"))
 
     @staticmethod
     def get_category_statistics(category_id):
         """
         Get statistics for a category.
+
+        Computed by a single query: every figure is aggregated over the
+        category's books and the latest title comes from a correlated subquery.
         """
-        category = CategoryService.get_category_by_id(category_id)
-        books = category.books.select_related("author")
+        stats = get_object_or_404(CategoryService._statistics_query(category_id))
+        return CategoryService._format_statistics(stats)
 
+    @staticmethod
+    async def aget_category_statistics(category_id):
+        """
+        Async variant of get_category_statistics; the same single query.
+        """
+        stats = await aget_object_or_404(CategoryService._statistics_query(category_id))
+        return CategoryService._format_statistics(stats)
+
+    @staticmethod
+    def _statistics_query(category_id):
+        latest_title = (
+            Book.objects.filter(categories=models.OuterRef("pk"))
+            .order_by("-created_at")
+            .values("title")[:1]
+        )
+        return (
+            Category.objects.filter(id=category_id)
+            .annotate(
+                total_books=models.Count("books"),
+                total_authors=models.Count("books__author", distinct=True),
+                average_price=models.Avg("books__price"),
+                min_price=models.Min("books__price"),
+                max_price=models.Max("books__price"),
+                latest_book=models.Subquery(latest_title),
+            )
+            .values(
+                "total_books",
+                "total_authors",
+                "average_price",
+                "min_price",
+                "max_price",
+                "latest_book",
+            )
+        )
+
+    @staticmethod
+    def _format_statistics(stats):
         return {
-            "total_books": books.count(),
-            "total_authors": books.values("author").distinct().count(),
-            "average_price": books.aggregate(avg_price=models.Avg("price"))["avg_price"]
-            or 0,
+            "total_books": stats["total_books"],
+            "total_authors": stats["total_authors"],
+            "average_price": stats["average_price"] or 0,
             "price_range": {
-                "min": books.aggregate(min_price=models.Min("price"))["min_price"] or 0,
-                "max": books.aggregate(max_price=models.Max("price"))["max_price"] or 0,
+                "min": stats["min_price"] or 0,
+                "max": stats["max_price"] or 0,
             },
-            "latest_book": books.first().title if books.exists() else None,
+            "latest_book": stats["latest_book"],
         }
 
     @staticmethod
@@ -124,6 +187,11 @@ class CategoryService:
         """
         Get most popular categories by book count.
         """
-        return Category.objects.annotate(book_count=models.Count("books")).order_by(
-            "-book_count"
-        )[:limit]
+        return Category.objects.order_by("-book_count")[:limit]
+
+    @staticmethod
+    async def aget_popular_categories(limit=10):
+        """
+        Async variant of get_popular_categories, evaluated.
+        """
+        return await afetch_all(CategoryService.get_popular_categories(limit))
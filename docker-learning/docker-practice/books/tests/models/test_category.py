@@ -24,6 +24,12 @@ class CategoryModelTest(TestCase):
         with self.assertRaises(IntegrityError):
             Category.objects.create(name="Fiction")
 
+    def test_name_uniqueness_ignores_case(self):
+        """Test that category names differing only in case are duplicates."""
+        Category.objects.create(name="Fiction")
+        with self.assertRaises(IntegrityError):
+            Category.objects.create(name="FICTION")
+
     def test_description_optional(self):
         """Test that description is optional."""
         category = Category.objects.create(
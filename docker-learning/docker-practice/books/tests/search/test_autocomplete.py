@@ -0,0 +1,178 @@
+"""
+Test the autocomplete endpoint and the in-process prefix index.
+"""
+
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from books.models.author import Author
+from books.models.book import Book
+from books.models.category import Category
+from books.search.autocomplete import PrefixIndex, word_start_keys
+from books.search.indexes import clear_indexes, get_index
+
+
+class PrefixIndexTest(SimpleTestCase):
+    """
+    Test the sorted word-start prefix index.
+    """
+
+    def make_index(self, rows):
+        index = PrefixIndex(Book, "title")
+        index.load(rows)
+        index.refresh = lambda force=False: None
+        return index
+
+    def test_keys_start_at_every_word(self):
+        """Test that keys are normalized and start at each word."""
+        self.assertEqual(
+            word_start_keys("The  Hobbit, Again"),
+            ["the hobbit again", "hobbit again", "again"],
+        )
+
+    def test_search_matches_any_word_start(self):
+        """Test that a prefix matches the start of any word, once per row."""
+        index = self.make_index(
+            [(1, "The Hobbit"), (2, "Hobbits of the Shire"), (3, "Emma")]
+        )
+        self.assertEqual(
+            index.search("HOB", 10), [(1, "The Hobbit"), (2, "Hobbits of the Shire")]
+        )
+        self.assertEqual([row[0] for row in index.search("the", 10)], [1, 2])
+        self.assertEqual(index.search("the h", 10), [(1, "The Hobbit")])
+        self.assertEqual(index.search("obbit", 10), [])
+
+    def test_search_honours_limit(self):
+        """Test that no more than limit suggestions are returned."""
+        index = self.make_index([(i, f"Book {i}") for i in range(1, 30)])
+        self.assertEqual(len(index.search("book", 5)), 5)
+
+    def test_upsert_replaces_keys(self):
+        """Test that a re-indexed row is only found under its new text."""
+        index = self.make_index([(1, "The Hobbit"), (2, "Emma")])
+        index.upsert(1, "Persuasion")
+        index.upsert(3, "Hobbit Lore")
+
+        self.assertEqual(index.search("hob", 10), [(3, "Hobbit Lore")])
+        self.assertEqual(index.search("pers", 10), [(1, "Persuasion")])
+
+    def test_upsert_leaves_published_entries_intact(self):
+        """Test that re-indexing swaps in a new list instead of editing it."""
+        index = self.make_index([(1, "The Hobbit"), (2, "Emma")])
+        entries = list(index._entries)
+        published = index._entries
+
+        index.upsert_many([(1, "Persuasion"), (3, "Hobbit Lore")])
+
+        self.assertEqual(published, entries)
+        self.assertEqual(index._entries, sorted(index._entries))
+        self.assertEqual(index.search("hob", 10), [(3, "Hobbit Lore")])
+
+
+class AutocompleteViewSetTest(APITestCase):
+    """
+    Test the /autocomplete/ endpoint.
+    """
+
+    def setUp(self):
+        clear_indexes()
+        user = get_user_model().objects.create_user(username="reader")
+        self.client.force_authenticate(user=user)
+        self.url = reverse("v1:autocomplete-list")
+        self.author = Author.objects.create(
+            name="John Tolkien", email="tolkien@example.com"
+        )
+        self.category = Category.objects.create(name="Fantasy")
+        self.book = Book.objects.create(
+            title="The Fellowship",
+            isbn="9780000000001",
+            price=Decimal("10.00"),
+            author=self.author,
+        )
+
+    def test_suggestions_for_every_type(self):
+        """Test that suggestions are grouped by type."""
+        response = self.client.get(self.url, {"q": "f"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data["data"],
+            {
+                "books": [{"id": self.book.id, "text": "The Fellowship"}],
+                "authors": [],
+                "categories": [{"id": self.category.id, "text": "Fantasy"}],
+            },
+        )
+
+    def test_types_and_limit(self):
+        """Test that types restricts the groups and limit the suggestions."""
+        Author.objects.create(name="Tolkien Estate", email="estate@example.com")
+
+        response = self.client.get(
+            self.url, {"q": "tolk", "types": "authors", "limit": 1}
+        )
+
+        self.assertEqual(list(response.data["data"]), ["authors"])
+        self.assertEqual(len(response.data["data"]["authors"]), 1)
+
+    def test_new_rows_are_suggested(self):
+        """Test that writes are picked up by the index."""
+        self.client.get(self.url, {"q": "tolk"})
+        self.author.name = "Ursula Le Guin"
+        self.author.save()
+
+        response = self.client.get(self.url, {"q": "le g", "types": "authors"})
+        self.assertEqual(
+            response.data["data"]["authors"],
+            [{"id": self.author.id, "text": "Ursula Le Guin"}],
+        )
+
+    def test_invalid_parameters(self):
+        """Test that a missing query or an unknown type returns 400."""
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+        self.assertEqual(
+            self.client.get(self.url, {"q": "a", "types": "publishers"}).status_code,
+            400,
+        )
+        self.assertEqual(
+            self.client.get(self.url, {"q": "a", "limit": 100}).status_code, 400
+        )
+
+
+@override_settings(BOOKS_SEARCH_INDEX_REFRESH_SECONDS=3600)
+class InProcessIndexRefreshTest(TestCase):
+    """
+    Test that lookups leave the index refresh to the background thread.
+    """
+
+    def setUp(self):
+        clear_indexes()
+        self.author = Author.objects.create(name="John Tolkien", email="j@example.com")
+
+    def test_one_index_per_model_field(self):
+        """Test that the index does not depend on the database picked."""
+        with override_settings(DATABASE_REPLICAS=["replica1", "replica2"]):
+            indexes = {id(get_index(PrefixIndex, Author, "name")) for _ in range(10)}
+
+        self.assertEqual(len(indexes), 1)
+
+    def test_lookups_do_not_query(self):
+        """Test that only the first lookup reads the database."""
+        index = get_index(PrefixIndex, Author, "name")
+        with self.assertNumQueries(2):
+            self.assertEqual(
+                index.search("tolk", 10), [(self.author.id, "John Tolkien")]
+            )
+        self.assertTrue(index._worker.is_alive())
+
+        Author.objects.create(name="Tolkien Estate", email="estate@example.com")
+        with self.assertNumQueries(0):
+            self.assertEqual(len(index.search("tolk", 10)), 1)
+
+        # What the background thread runs every interval
+        index.update()
+        self.assertEqual(len(index.search("tolk", 10)), 2)
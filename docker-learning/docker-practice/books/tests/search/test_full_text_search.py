@@ -0,0 +1,95 @@
+"""
+Test the full-text search filter on the catalog endpoints.
+"""
+
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from books.models.author import Author
+from books.models.book import Book
+from books.models.category import Category
+
+
+class FullTextSearchTest(APITestCase):
+    """
+    Test that the search parameter uses the maintained full-text index.
+    """
+
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="reader")
+        self.client.force_authenticate(user=user)
+        self.tolkien = Author.objects.create(
+            name="John Tolkien", email="tolkien@example.com"
+        )
+        self.other = Author.objects.create(name="Jane Austen", email="jane@example.com")
+        self.hobbit = Book.objects.create(
+            title="The Hobbit",
+            isbn="9780000000001",
+            price=Decimal("10.00"),
+            author=self.tolkien,
+        )
+        self.about = Book.objects.create(
+            title="Reading Tolkien",
+            isbn="9780000000002",
+            price=Decimal("12.00"),
+            author=self.other,
+        )
+        Book.objects.create(
+            title="Emma",
+            isbn="9780000000003",
+            price=Decimal("9.00"),
+            author=self.other,
+        )
+
+    def search(self, name, term, **params):
+        """Return the ids returned by a search on the given list endpoint."""
+        response = self.client.get(
+            reverse(f"v1:{name}-list"), {"search": term, **params}
+        )
+        self.assertEqual(response.status_code, 200)
+        return [row["id"] for row in response.data["results"]]
+
+    def test_search_matches_title_and_author_prefixes(self):
+        """Test that books match on title and author name word prefixes."""
+        self.assertEqual(
+            set(self.search("book", "tolk")), {self.hobbit.id, self.about.id}
+        )
+        self.assertEqual(self.search("book", "hobb"), [self.hobbit.id])
+        self.assertEqual(
+            self.search("book", "9780000000003"), [Book.objects.get(title="Emma").id]
+        )
+
+    def test_search_results_are_ranked(self):
+        """Test that title matches rank above author name matches."""
+        self.assertEqual(
+            self.search("book", "tolkien"), [self.about.id, self.hobbit.id]
+        )
+
+    def test_explicit_ordering_overrides_rank(self):
+        """Test that an ordering parameter replaces the relevance order."""
+        ids = self.search("book", "tolkien", ordering="price")
+
+        self.assertEqual(ids, [self.hobbit.id, self.about.id])
+
+    def test_index_follows_writes(self):
+        """Test that renames and deletes are reflected by the index."""
+        # A queryset update bypasses the models; the triggers still fire.
+        Author.objects.filter(id=self.tolkien.id).update(name="Ronald Reuel")
+
+        self.assertEqual(self.search("book", "reuel"), [self.hobbit.id])
+        self.assertEqual(self.search("author", "ronald"), [self.tolkien.id])
+
+        self.hobbit.delete()
+        self.assertEqual(self.search("book", "reuel"), [])
+
+    def test_category_search(self):
+        """Test that categories are searched by name and description."""
+        fantasy = Category.objects.create(
+            name="Fantasy", description="Dragons and wizards"
+        )
+        Category.objects.create(name="Romance", description="Love stories")
+
+        self.assertEqual(self.search("category", "wizard"), [fantasy.id])
@@ -0,0 +1,156 @@
+"""
+Test the fuzzy (trigram) search mode and the in-process trigram index.
+"""
+
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from books.models.author import Author
+from books.models.book import Book
+from books.search.indexes import clear_indexes
+from books.search.trigram import (
+    TrigramIndex,
+    similarity,
+    strict_word_similarity,
+    trigrams,
+)
+
+
+class TrigramTest(SimpleTestCase):
+    """
+    Test that trigrams and similarity follow pg_trgm.
+    """
+
+    def test_trigrams_pad_each_word(self):
+        """Test that words are lower-cased and padded like pg_trgm."""
+        self.assertEqual(trigrams("Cat"), {"  c", " ca", "cat", "at "})
+        self.assertEqual(trigrams("a-b"), {"  a", " a ", "  b", " b "})
+
+    def test_scores_match_pg_trgm(self):
+        """Test the documented pg_trgm examples for 'word' and 'two words'."""
+        self.assertAlmostEqual(
+            similarity(trigrams("word"), trigrams("two words")), 0.363636, places=5
+        )
+        self.assertAlmostEqual(
+            strict_word_similarity(trigrams("word"), "two words"), 0.571429, places=5
+        )
+
+    def test_index_ranks_and_applies_threshold(self):
+        """Test that the index returns matches over the threshold, best first."""
+        index = TrigramIndex(Author, "name")
+        index.load([(1, "John Tolkien"), (2, "Jane Austen"), (3, "Tolkin")])
+        index.refresh = lambda force=False: None
+
+        matches = index.search("Tolkein", threshold=0.2, limit=10)
+        self.assertEqual([object_id for _, object_id in matches], [3, 1])
+        self.assertEqual(index.search("Tolkein", threshold=0.9, limit=10), [])
+
+    def test_upsert_replaces_text(self):
+        """Test that re-indexed rows are scored on their new text only."""
+        index = TrigramIndex(Author, "name")
+        index.load([(1, "John Tolkien")])
+        index.refresh = lambda force=False: None
+        index.upsert(1, "Jane Austen")
+
+        self.assertEqual(index.search("Tolkien", threshold=0.3, limit=10), [])
+        self.assertEqual(index.search("Austin", threshold=0.3, limit=10)[0][1], 1)
+
+    def test_load_swaps_in_new_structures(self):
+        """Test that a rebuild leaves the structures of a running search intact."""
+        index = TrigramIndex(Author, "name")
+        index.load([(1, "John Tolkien")])
+        index.refresh = lambda force=False: None
+        texts, shortest, postings = index._data
+
+        index.load([(2, "Jane Austen")])
+
+        self.assertEqual(texts, {1: "John Tolkien"})
+        self.assertIn(1, shortest)
+        self.assertIn("tol", postings)
+        self.assertEqual(index.search("Tolkien", threshold=0.3, limit=10), [])
+
+
+class FuzzySearchTest(APITestCase):
+    """
+    Test that search_mode=fuzzy tolerates typos on the list endpoints.
+    """
+
+    def setUp(self):
+        clear_indexes()
+        user = get_user_model().objects.create_user(username="reader")
+        self.client.force_authenticate(user=user)
+        self.tolkien = Author.objects.create(
+            name="John Tolkien", email="tolkien@example.com"
+        )
+        self.austen = Author.objects.create(
+            name="Jane Austen", email="jane@example.com"
+        )
+        self.hobbit = Book.objects.create(
+            title="The Hobbit",
+            isbn="9780000000001",
+            price=Decimal("10.00"),
+            author=self.tolkien,
+        )
+        Book.objects.create(
+            title="Emma",
+            isbn="9780000000002",
+            price=Decimal("9.00"),
+            author=self.austen,
+        )
+
+    def fuzzy(self, name, term, **params):
+        """Return the response of a fuzzy search on the given list endpoint."""
+        return self.client.get(
+            reverse(f"v1:{name}-list"),
+            {"search": term, "search_mode": "fuzzy", **params},
+        )
+
+    def test_misspelled_names_match(self):
+        """Test that misspelled author names and book titles still match."""
+        response = self.fuzzy("author", "Tolkein")
+        self.assertEqual(
+            [row["id"] for row in response.data["results"]], [self.tolkien.id]
+        )
+
+        response = self.fuzzy("book", "Hobit")
+        self.assertEqual(
+            [row["id"] for row in response.data["results"]], [self.hobbit.id]
+        )
+
+    def test_results_are_ranked_by_similarity(self):
+        """Test that closer names rank first."""
+        close = Author.objects.create(name="Jon Tolkien", email="jon@example.com")
+
+        response = self.fuzzy("author", "Jon Tolkien", similarity="0.2")
+        ids = [row["id"] for row in response.data["results"]]
+        self.assertEqual(ids, [close.id, self.tolkien.id])
+
+    def test_threshold_is_tunable(self):
+        """Test that a stricter similarity drops weaker matches."""
+        response = self.fuzzy("author", "Tolkein", similarity="0.9")
+        self.assertEqual(response.data["results"], [])
+
+    def test_invalid_parameters_are_rejected(self):
+        """Test that an unknown mode or an out of range threshold returns 400."""
+        self.assertEqual(self.fuzzy("author", "x", similarity="2").status_code, 400)
+        self.assertEqual(self.fuzzy("author", "x", similarity="abc").status_code, 400)
+        response = self.client.get(
+            reverse("v1:author-list"), {"search": "x", "search_mode": "sounds-like"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_index_follows_writes(self):
+        """Test that renamed and deleted rows are picked up by the index."""
+        self.assertEqual(len(self.fuzzy("author", "Tolkein").data["results"]), 1)
+
+        self.tolkien.name = "Ursula Le Guin"
+        self.tolkien.save()
+        self.assertEqual(self.fuzzy("author", "Tolkein").data["results"], [])
+        self.assertEqual(len(self.fuzzy("author", "Le Gwin").data["results"]), 1)
+
+        self.austen.delete()
+        self.assertEqual(self.fuzzy("author", "Austin").data["results"], [])
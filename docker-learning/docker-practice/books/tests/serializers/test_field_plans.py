@@ -0,0 +1,62 @@
+"""
+Test the cached serializer field plans.
+"""
+
+from django.test import SimpleTestCase
+from rest_framework import serializers
+
+from books.models.category import Category
+from books.serializers.book_request_serializers import BookUpdateRequestSerializer
+from books.serializers.book_response_serializers import (
+    BookDetailResponseSerializer,
+    BookListResponseSerializer,
+)
+from books.serializers.field_plans import FieldPlanMixin
+
+
+class FieldPlanTest(SimpleTestCase):
+    """
+    Test that field plans are per class and every instance gets its own fields.
+    """
+
+    def test_instances_get_their_own_bound_fields(self):
+        """Test that fields are copies bound to each serializer instance."""
+        first = BookDetailResponseSerializer()
+        second = BookDetailResponseSerializer()
+
+        for name in first.fields:
+            self.assertIsNot(first.fields[name], second.fields[name])
+            self.assertIs(first.fields[name].parent, first)
+            self.assertIs(second.fields[name].parent, second)
+        self.assertIs(first.fields["category_ids"].child.parent.parent, first)
+
+    def test_many_relations_get_their_own_child(self):
+        """Test that many=True relations do not share their child relation."""
+
+        class LinkedSerializer(FieldPlanMixin, serializers.Serializer):
+            categories = serializers.PrimaryKeyRelatedField(
+                queryset=Category.objects.all(), many=True
+            )
+
+        first = LinkedSerializer().fields["categories"]
+        second = LinkedSerializer().fields["categories"]
+
+        self.assertIsNot(first.child_relation, second.child_relation)
+        self.assertIs(first.child_relation.parent, first)
+        self.assertIs(second.child_relation.parent, second)
+
+    def test_plans_are_per_class(self):
+        """Test that subclasses build their own plan from their own Meta."""
+        self.assertEqual(
+            list(BookListResponseSerializer().fields),
+            ["id", "title", "isbn", "price", "price_display", "author_name"],
+        )
+        self.assertIn("author", BookDetailResponseSerializer().fields)
+
+        class ReadOnlyIsbnSerializer(BookUpdateRequestSerializer):
+            class Meta(BookUpdateRequestSerializer.Meta):
+                extra_kwargs = {"isbn": {"read_only": True}}
+
+        self.assertFalse(BookUpdateRequestSerializer().fields["isbn"].read_only)
+        self.assertTrue(ReadOnlyIsbnSerializer().fields["isbn"].read_only)
+        self.assertFalse(BookUpdateRequestSerializer().fields["isbn"].read_only)
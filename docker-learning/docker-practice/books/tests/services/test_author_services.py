@@ -0,0 +1,74 @@
+"""
+Test the Author service.
+"""
+
+from decimal import Decimal
+
+from django.http import Http404
+from django.test import TestCase
+
+from books.models.author import Author
+from books.models.category import Category
+from books.services.author_services import AuthorService
+from books.services.book_services import BookService
+
+
+class AuthorStatisticsTest(TestCase):
+    """
+    Test AuthorService.get_author_statistics.
+    """
+
+    def setUp(self):
+        self.author = Author.objects.create(name="John Doe", email="john@example.com")
+        fiction = Category.objects.create(name="Fiction")
+        mystery = Category.objects.create(name="Mystery")
+        for isbn, title, price, category_ids in (
+            ("9780000000001", "First", "10.00", [fiction.id, mystery.id]),
+            ("9780000000002", "Second", "20.00", [fiction.id]),
+            ("9780000000003", "Latest", "30.00", []),
+        ):
+            BookService.create_book(
+                {
+                    "title": title,
+                    "isbn": isbn,
+                    "price": Decimal(price),
+                    "author_id": self.author.id,
+                    "category_ids": category_ids,
+                }
+            )
+
+    def test_statistics_use_a_single_query(self):
+        """Test that the statistics are computed by one query."""
+        with self.assertNumQueries(1):
+            stats = AuthorService.get_author_statistics(self.author.id)
+
+        self.assertEqual(
+            stats,
+            {
+                "total_books": 3,
+                "total_categories": 2,
+                "average_price": Decimal("20.00"),
+                "latest_book": "Latest",
+            },
+        )
+
+    def test_statistics_without_books(self):
+        """Test the statistics of an author without books."""
+        author = Author.objects.create(name="Jane Doe", email="jane@example.com")
+
+        stats = AuthorService.get_author_statistics(author.id)
+
+        self.assertEqual(
+            stats,
+            {
+                "total_books": 0,
+                "total_categories": 0,
+                "average_price": 0,
+                "latest_book": None,
+            },
+        )
+
+    def test_statistics_for_missing_author(self):
+        """Test that a missing author raises Http404."""
+        with self.assertRaises(Http404):
+            AuthorService.get_author_statistics(0)
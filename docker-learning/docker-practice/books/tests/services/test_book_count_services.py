@@ -0,0 +1,93 @@
+"""
+Test the denormalized book counters maintained by BookService.
+"""
+
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from books.models.author import Author
+from books.models.category import Category
+from books.services.book_services import BookService
+
+
+class BookCountServiceTest(TestCase):
+    """
+    Test that the book write paths keep Author/Category.book_count in sync.
+    """
+
+    def setUp(self):
+        self.author = Author.objects.create(name="John Doe", email="john@example.com")
+        self.other_author = Author.objects.create(
+            name="Jane Doe", email="jane@example.com"
+        )
+        self.fiction = Category.objects.create(name="Fiction")
+        self.mystery = Category.objects.create(name="Mystery")
+
+    def create_book(self, isbn="9781234567890", category_ids=None):
+        """Create a book through the service layer."""
+        return BookService.create_book(
+            {
+                "title": "Sample Book",
+                "isbn": isbn,
+                "price": Decimal("29.99"),
+                "author_id": self.author.id,
+                "category_ids": category_ids or [],
+            }
+        )
+
+    def assertCounts(self, author, other_author, fiction, mystery):
+        """Assert the stored counters of all fixtures."""
+        for obj, expected in (
+            (self.author, author),
+            (self.other_author, other_author),
+            (self.fiction, fiction),
+            (self.mystery, mystery),
+        ):
+            obj.refresh_from_db(fields=["book_count"])
+            self.assertEqual(obj.book_count, expected, obj)
+
+    def test_create_and_delete(self):
+        """Test that creating and deleting a book updates all counters."""
+        book = self.create_book(category_ids=[self.fiction.id, self.mystery.id])
+        self.assertCounts(1, 0, 1, 1)
+
+        BookService.delete_book(book.id)
+        self.assertCounts(0, 0, 0, 0)
+
+    def test_update_author_and_categories(self):
+        """Test that moving a book between authors and categories moves counts."""
+        book = self.create_book(category_ids=[self.fiction.id])
+
+        BookService.update_book(
+            book.id,
+            {"author_id": self.other_author.id, "category_ids": [self.mystery.id]},
+        )
+        self.assertCounts(0, 1, 0, 1)
+
+        BookService.update_book(book.id, {"category_ids": []})
+        self.assertCounts(0, 1, 0, 0)
+
+    def test_add_and_remove_category(self):
+        """Test that the category actions update the category counter."""
+        book = self.create_book()
+
+        BookService.add_category_to_book(book.id, self.fiction.id)
+        self.assertCounts(1, 0, 1, 0)
+
+        BookService.remove_category_from_book(book.id, self.fiction.id)
+        self.assertCounts(1, 0, 0, 0)
+
+    def test_sync_command_repairs_drift(self):
+        """Test that sync_book_counts detects and repairs drifted counters."""
+        self.create_book(category_ids=[self.fiction.id])
+        Author.objects.filter(id=self.author.id).update(book_count=7)
+        Category.objects.filter(id=self.mystery.id).update(book_count=3)
+
+        with self.assertRaises(CommandError):
+            call_command("sync_book_counts", "--check", stdout=StringIO())
+
+        call_command("sync_book_counts", stdout=StringIO())
+        self.assertCounts(1, 0, 1, 0)
@@ -0,0 +1,173 @@
+"""
+Test the import_catalog command and CatalogImportService.
+"""
+
+import csv
+import json
+import os
+import tempfile
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from books.models.author import Author
+from books.models.book import Book
+from books.models.category import Category
+from books.services.book_count_services import BookCountService
+
+
+class CatalogImportTest(TestCase):
+    """
+    Test streaming catalog imports from CSV and JSONL files.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def write_csv(self, name, rows):
+        path = self.path(name)
+        with open(path, "w", encoding="utf-8", newline="") as stream:
+            writer = csv.DictWriter(
+                stream,
+                ["title", "isbn", "price", "author_name", "author_email", "categories"],
+            )
+            writer.writeheader()
+            writer.writerows(rows)
+        return path
+
+    def rows(self, count):
+        return [
+            {
+                "title": f"Book {index}",
+                "isbn": f"{index:013d}",
+                "price": "12.50",
+                "author_name": f"Author {index % 3}",
+                "author_email": f"author{index % 3}@example.com",
+                "categories": "Fiction|History" if index % 2 else "Fiction",
+            }
+            for index in range(count)
+        ]
+
+    def test_import_csv(self):
+        """Test that books, authors, categories and counters are imported."""
+        path = self.write_csv("books.csv", self.rows(10))
+
+        out = StringIO()
+        call_command("import_catalog", path, "--batch-size", "4", stdout=out)
+
+        self.assertIn("Imported 10 record(s)", out.getvalue())
+        self.assertIn("rows/s", out.getvalue())
+        self.assertEqual(Book.objects.count(), 10)
+        self.assertEqual(Author.objects.count(), 3)
+        self.assertEqual(
+            dict(Category.objects.values_list("name", "book_count")),
+            {"Fiction": 10, "History": 5},
+        )
+        self.assertEqual(Author.objects.get(email="author0@example.com").book_count, 4)
+        self.assertEqual(Book.objects.get(isbn=f"{1:013d}").price, Decimal("12.50"))
+
+    def test_import_is_an_upsert(self):
+        """Test that reimporting updates rows by natural key without duplicates."""
+        author = Author.objects.create(name="Old Name", email="author0@example.com")
+        path = self.write_csv("books.csv", self.rows(6))
+        call_command("import_catalog", path, stdout=StringIO())
+
+        rows = self.rows(6)
+        rows[0]["title"] = "Renamed"
+        rows[0]["author_email"] = "author1@example.com"
+        call_command(
+            "import_catalog", self.write_csv("again.csv", rows), stdout=StringIO()
+        )
+
+        self.assertEqual(Book.objects.count(), 6)
+        self.assertEqual(Author.objects.count(), 3)
+        author.refresh_from_db()
+        self.assertEqual(author.name, "Author 0")
+        book = Book.objects.get(isbn=f"{0:013d}")
+        self.assertEqual(
+            (book.title, book.author.email), ("Renamed", "author1@example.com")
+        )
+        self.assertEqual(author.book_count, 1)
+
+    def test_failed_import_leaves_counters_in_sync(self):
+        """Test that every committed batch carries its counters."""
+        rows = self.rows(7)
+        rows[6]["price"] = "free"
+
+        with self.assertRaises(CommandError):
+            call_command(
+                "import_catalog",
+                self.write_csv("books.csv", rows),
+                "--batch-size",
+                "3",
+                stdout=StringIO(),
+            )
+
+        self.assertEqual(Book.objects.count(), 6)
+        self.assertEqual(BookCountService.find_author_drift(), [])
+        self.assertEqual(BookCountService.find_category_drift(), [])
+        self.assertEqual(Author.objects.get(email="author0@example.com").book_count, 2)
+
+    def test_categories_are_matched_ignoring_case(self):
+        """Test that a category spelled in another case links the existing one."""
+        Category.objects.create(name="Fiction")
+        rows = self.rows(2)
+        rows[0]["categories"] = "FICTION|Éducation"
+        rows[1]["categories"] = "fiction|Éducation"
+
+        call_command(
+            "import_catalog", self.write_csv("books.csv", rows), stdout=StringIO()
+        )
+
+        self.assertEqual(
+            dict(Category.objects.values_list("name", "book_count")),
+            {"Fiction": 2, "Éducation": 2},
+        )
+
+    def test_import_jsonl(self):
+        """Test that JSONL records with category lists are imported."""
+        path = self.path("books.jsonl")
+        with open(path, "w", encoding="utf-8") as stream:
+            for row in self.rows(3):
+                row["categories"] = row["categories"].split("|")
+                stream.write(json.dumps(row) + "\n")
+
+        call_command("import_catalog", path, stdout=StringIO())
+
+        self.assertEqual(Book.objects.count(), 3)
+        self.assertEqual(Book.objects.get(isbn=f"{1:013d}").categories.count(), 2)
+
+    def test_resume_from_checkpoint(self):
+        """Test that an invalid record stops the import and a rerun resumes."""
+        rows = self.rows(10)
+        rows[6]["price"] = "free"
+        path = self.write_csv("books.csv", rows)
+        checkpoint = self.path("books.ckpt")
+
+        with self.assertRaisesMessage(CommandError, "Record 7: invalid price"):
+            call_command(
+                "import_catalog",
+                path,
+                "--batch-size",
+                "3",
+                "--checkpoint",
+                checkpoint,
+                stdout=StringIO(),
+            )
+        self.assertEqual(Book.objects.count(), 6)
+
+        rows[6]["price"] = "3.00"
+        self.write_csv("books.csv", rows)
+        out = StringIO()
+        call_command("import_catalog", path, "--checkpoint", checkpoint, stdout=out)
+
+        self.assertIn("Resuming after 6 record(s)", out.getvalue())
+        self.assertIn("Imported 4 record(s)", out.getvalue())
+        self.assertEqual(Book.objects.count(), 10)
+        self.assertFalse(os.path.exists(checkpoint))
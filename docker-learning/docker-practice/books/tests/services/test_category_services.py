@@ -0,0 +1,59 @@
+"""
+Test the Category service.
+"""
+
+from decimal import Decimal
+
+from django.http import Http404
+from django.test import TestCase
+
+from books.models.author import Author
+from books.models.category import Category
+from books.services.book_services import BookService
+from books.services.category_services import CategoryService
+
+
+class CategoryStatisticsTest(TestCase):
+    """
+    Test CategoryService.get_category_statistics.
+    """
+
+    def setUp(self):
+        self.category = Category.objects.create(name="Fiction")
+        first_author = Author.objects.create(name="John Doe", email="john@example.com")
+        second_author = Author.objects.create(name="Jane Doe", email="jane@example.com")
+        for isbn, title, price, author in (
+            ("9780000000001", "First", "10.00", first_author),
+            ("9780000000002", "Second", "15.00", first_author),
+            ("9780000000003", "Latest", "35.00", second_author),
+        ):
+            BookService.create_book(
+                {
+                    "title": title,
+                    "isbn": isbn,
+                    "price": Decimal(price),
+                    "author_id": author.id,
+                    "category_ids": [self.category.id],
+                }
+            )
+
+    def test_statistics_use_a_single_query(self):
+        """Test that the statistics are computed by one query."""
+        with self.assertNumQueries(1):
+            stats = CategoryService.get_category_statistics(self.category.id)
+
+        self.assertEqual(
+            stats,
+            {
+                "total_books": 3,
+                "total_authors": 2,
+                "average_price": Decimal("20.00"),
+                "price_range": {"min": Decimal("10.00"), "max": Decimal("35.00")},
+                "latest_book": "Latest",
+            },
+        )
+
+    def test_statistics_for_missing_category(self):
+        """Test that a missing category raises Http404."""
+        with self.assertRaises(Http404):
+            CategoryService.get_category_statistics(0)
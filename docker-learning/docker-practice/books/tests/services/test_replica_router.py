@@ -0,0 +1,162 @@
+"""
+Test the routing of the catalog queries to the read replicas.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from books.models.author import Author
+from books.services.author_services import AuthorService
+from core_commons.replicas import PIN_COOKIE_NAME, pin_to_primary
+
+REPLICAS = ["replica1", "replica2"]
+
+
+@override_settings(DATABASE_REPLICAS=REPLICAS)
+class ReplicaRouterTest(TransactionTestCase):
+    """
+    Test the router against SQLite replicas that nothing replicates into, so
+    a row is only visible on the database it was written to.
+    """
+
+    databases = {"default", *REPLICAS}
+
+    def setUp(self):
+        for alias in REPLICAS:
+            Author.objects.using(alias).create(
+                name="Replicated", email="replicated@example.com"
+            )
+
+    def test_service_reads_go_to_a_replica(self):
+        """Test that the service reads come from the replicas."""
+        self.assertIn(AuthorService.get_all_authors().db, REPLICAS)
+        names = [author.name for author in AuthorService.get_all_authors()]
+
+        self.assertEqual(names, ["Replicated"])
+
+    def test_writes_and_atomic_reads_go_to_the_primary(self):
+        """Test that writes, and reads inside a transaction, use the primary."""
+        author = AuthorService.create_author(
+            {"name": "New", "email": "new@example.com"}
+        )
+
+        self.assertEqual(author._state.db, "default")
+        with transaction.atomic():
+            self.assertEqual(Author.objects.get().name, "New")
+        for alias in REPLICAS:
+            self.assertFalse(Author.objects.using(alias).filter(name="New").exists())
+
+    def test_pin_to_primary(self):
+        """Test that a pinned block reads from the primary."""
+        Author.objects.create(name="Primary", email="primary@example.com")
+
+        with pin_to_primary():
+            self.assertEqual(Author.objects.get().name, "Primary")
+        self.assertEqual(Author.objects.get().name, "Replicated")
+
+    def test_other_apps_read_from_the_primary(self):
+        """Test that only the catalog is routed to the replicas."""
+        self.assertEqual(get_user_model().objects.all().db, "default")
+
+
+@override_settings(DATABASE_REPLICAS=REPLICAS)
+class ReplicaPinMiddlewareTest(TransactionTestCase):
+    """
+    Test read-your-writes through the API.
+    """
+
+    databases = {"default", *REPLICAS}
+
+    def setUp(self):
+        self.client = APIClient()
+        user = get_user_model().objects.create_user(username="writer")
+        self.client.force_authenticate(user=user)
+
+    def list_names(self):
+        response = self.client.get(reverse("v1:author-list"))
+        return [row["name"] for row in response.data["results"]]
+
+    def test_client_reads_its_writes(self):
+        """Test that a client reads from the primary for a while after a write."""
+        response = self.client.post(
+            reverse("v1:author-list"),
+            {"name": "Fresh", "email": "fresh@example.com"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 201)
+        pin = response.cookies[PIN_COOKIE_NAME]
+        self.assertEqual(pin["max-age"], 5)
+        self.assertEqual(self.list_names(), ["Fresh"])
+
+        # Once the cookie expires the client is back on the replicas.
+        del self.client.cookies[PIN_COOKIE_NAME]
+        self.assertEqual(self.list_names(), [])
+
+    def test_unsafe_requests_read_from_the_primary(self):
+        """Test that an update reads the row it overwrites from the primary."""
+        author = Author.objects.create(name="Stored", email="stored@example.com")
+
+        response = self.client.patch(
+            reverse("v1:author-detail", args=[author.id]),
+            {"name": "Renamed"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        author.refresh_from_db(using="default")
+        self.assertEqual(author.name, "Renamed")
+
+    def test_reads_do_not_pin(self):
+        """Test that a read-only request does not set the pin cookie."""
+        response = self.client.get(reverse("v1:author-list"))
+
+        self.assertNotIn(PIN_COOKIE_NAME, response.cookies)
+
+
+@override_settings(DATABASE_REPLICAS=REPLICAS, BOOKS_RESPONSE_CACHE_ENABLED=True)
+class ReplicaResponseCacheTest(TransactionTestCase):
+    """
+    Test that the response cache keeps read-your-writes.
+    """
+
+    databases = {"default", *REPLICAS}
+
+    def setUp(self):
+        cache.clear()
+        user = get_user_model().objects.create_user(username="writer")
+        self.writer = APIClient()
+        self.writer.force_authenticate(user=user)
+        self.reader = APIClient()
+        self.reader.force_authenticate(user=user)
+
+    def list_authors(self, client):
+        response = client.get(reverse("v1:author-list"))
+        names = [row["name"] for row in response.data["results"]]
+        return names, response.get("X-Cache")
+
+    def test_replica_page_is_not_served_to_the_writer(self):
+        """Test that a page read from a lagging replica is not cached."""
+        response = self.writer.post(
+            reverse("v1:author-list"),
+            {"name": "Fresh", "email": "fresh@example.com"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+
+        # Another client reads the replica, which has not seen the write.
+        self.assertEqual(self.list_authors(self.reader), ([], "MISS"))
+        # The pinned writer bypasses the cache and reads the primary.
+        self.assertEqual(self.list_authors(self.writer), (["Fresh"], None))
+        # The replica page was not stored under the new version either.
+        self.assertEqual(self.list_authors(self.reader), ([], "MISS"))
+
+    @override_settings(DATABASE_REPLICA_PIN_SECONDS=0)
+    def test_pages_are_cached_once_replicated(self):
+        """Test that caching resumes once the writes have replicated."""
+        self.assertEqual(self.list_authors(self.reader), ([], "MISS"))
+        self.assertEqual(self.list_authors(self.reader), ([], "HIT"))
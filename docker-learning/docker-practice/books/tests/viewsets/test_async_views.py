@@ -0,0 +1,171 @@
+"""
+Test the async read actions of the catalog viewsets against their sync ones.
+"""
+
+from decimal import Decimal
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.contrib.auth import get_user_model
+from django.test import AsyncRequestFactory, TestCase, override_settings
+from rest_framework.test import force_authenticate
+
+from books.models.author import Author
+from books.models.book import Book
+from books.models.category import Category
+from books.viewsets.author_viewset import AuthorViewSet
+from books.viewsets.book_viewset import BookViewSet
+from books.viewsets.category_viewset import CategoryViewSet
+from core_commons.server_timing import ServerTimingMiddleware
+
+
+def without_timestamp(data):
+    """Drop the timestamp of success and error envelopes."""
+    if isinstance(data, dict):
+        return {key: value for key, value in data.items() if key != "timestamp"}
+    return data
+
+
+class AsyncReadViewTest(TestCase):
+    """
+    Test that the async views answer exactly like the sync ones.
+    """
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="reader")
+        self.category = Category.objects.create(name="Fiction")
+        self.authors = [
+            Author.objects.create(name=f"Author {index}", email=f"{index}@example.com")
+            for index in range(3)
+        ]
+        for index in range(30):
+            book = Book.objects.create(
+                title=f"Book {index}",
+                isbn=f"{index:013d}",
+                price=Decimal("9.99") + index,
+                author=self.authors[index % 3],
+            )
+            book.categories.add(self.category)
+        self.book = book
+
+    def views(self, viewset, actions):
+        """Return the (sync, async) views of a route."""
+        with override_settings(BOOKS_ASYNC_VIEWS=True):
+            async_view = viewset.as_view(actions, basename="test")
+        return viewset.as_view(actions, basename="test"), async_view
+
+    def request(self, path, method="get", **extra):
+        request = getattr(AsyncRequestFactory(), method)(path, **extra)
+        force_authenticate(request, user=self.user)
+        return request
+
+    async def assertSameResponse(self, viewset, actions, path, **kwargs):
+        """Run a request through both views and compare the responses."""
+        sync_view, async_view = self.views(viewset, actions)
+        expected = await sync_to_async(sync_view)(self.request(path), **kwargs)
+        response = await async_view(self.request(path), **kwargs)
+
+        self.assertEqual(response.status_code, expected.status_code)
+        self.assertEqual(
+            without_timestamp(response.data), without_timestamp(expected.data)
+        )
+        self.assertEqual(response.get("ETag"), expected.get("ETag"))
+        return response
+
+    def test_only_routes_with_async_actions_are_async(self):
+        """Test that the setting and the async twins decide the view mode."""
+        sync_view, async_view = self.views(BookViewSet, {"get": "list"})
+
+        self.assertFalse(iscoroutinefunction(sync_view))
+        self.assertTrue(iscoroutinefunction(async_view))
+        self.assertFalse(
+            iscoroutinefunction(self.views(BookViewSet, {"get": "export"})[1])
+        )
+
+    async def test_book_list(self):
+        """Test the book list, including filters and both pagination modes."""
+        await self.assertSameResponse(BookViewSet, {"get": "list"}, "/books/")
+        await self.assertSameResponse(
+            BookViewSet,
+            {"get": "list"},
+            f"/books/?categories={self.category.id}&ordering=price&page=2",
+        )
+        response = await self.assertSameResponse(
+            BookViewSet, {"get": "list"}, "/books/?pagination=cursor"
+        )
+        self.assertIsNotNone(response.data["next"])
+
+    async def test_book_list_invalid_page(self):
+        """Test that an out of range page is a 404 on both paths."""
+        response = await self.assertSameResponse(
+            BookViewSet, {"get": "list"}, "/books/?page=99"
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    async def test_retrieve(self):
+        """Test the detail of every viewset, and a missing object."""
+        detail = {"get": "retrieve"}
+        await self.assertSameResponse(BookViewSet, detail, "/", id=self.book.id)
+        await self.assertSameResponse(AuthorViewSet, detail, "/", id=self.authors[0].id)
+        await self.assertSameResponse(CategoryViewSet, detail, "/", id=self.category.id)
+        response = await self.assertSameResponse(BookViewSet, detail, "/", id=0)
+
+        self.assertEqual(response.status_code, 404)
+
+    async def test_author_and_category_lists(self):
+        """Test the author and category lists."""
+        await self.assertSameResponse(AuthorViewSet, {"get": "list"}, "/?search=Author")
+        await self.assertSameResponse(CategoryViewSet, {"get": "list"}, "/")
+
+    async def test_related_books(self):
+        """Test the books actions, including an unknown author or category."""
+        await self.assertSameResponse(
+            AuthorViewSet, {"get": "books"}, "/", id=self.authors[0].id
+        )
+        await self.assertSameResponse(AuthorViewSet, {"get": "books"}, "/", id=0)
+        await self.assertSameResponse(
+            CategoryViewSet, {"get": "books"}, "/", id=self.category.id
+        )
+        await self.assertSameResponse(CategoryViewSet, {"get": "books"}, "/", id=0)
+
+    async def test_statistics_and_popular(self):
+        """Test the statistics and popular actions."""
+        await self.assertSameResponse(
+            AuthorViewSet, {"get": "statistics"}, "/", id=self.authors[0].id
+        )
+        await self.assertSameResponse(
+            CategoryViewSet, {"get": "statistics"}, "/", id=self.category.id
+        )
+        await self.assertSameResponse(CategoryViewSet, {"get": "popular"}, "/?limit=1")
+
+    async def test_sync_actions_of_an_async_route(self):
+        """Test that other methods of an async route keep their sync handler."""
+        _, view = self.views(CategoryViewSet, {"get": "list", "post": "create"})
+        request = self.request(
+            "/", method="post", data={"name": "Poetry"}, content_type="application/json"
+        )
+
+        response = await view(request)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(await Category.objects.filter(name="Poetry").aexists())
+
+    async def test_unauthenticated_request(self):
+        """Test that authentication still runs before the async action."""
+        _, view = self.views(BookViewSet, {"get": "list"})
+
+        response = await view(AsyncRequestFactory().get("/books/"))
+
+        self.assertEqual(response.status_code, 403)
+
+    async def test_queries_are_timed_in_async_mode(self):
+        """Test that the middleware sees the queries of the async ORM."""
+        _, view = self.views(CategoryViewSet, {"get": "statistics"})
+
+        async def get_response(request):
+            return await view(request, id=self.category.id)
+
+        response = await ServerTimingMiddleware(get_response)(self.request("/"))
+
+        self.assertIn("db;dur=", response["Server-Timing"])
+        self.assertIn('desc="1 queries"', response["Server-Timing"])
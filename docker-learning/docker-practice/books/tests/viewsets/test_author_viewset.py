@@ -0,0 +1,58 @@
+"""
+Test the Author viewset.
+"""
+
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from books.models.author import Author
+from books.services.book_services import BookService
+
+
+class AuthorViewSetTest(APITestCase):
+    """
+    Test the Author viewset.
+    """
+
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="reader")
+        self.client.force_authenticate(user=user)
+
+    def create_author(self, index, book_count):
+        """Create an author with the given number of books."""
+        author = Author.objects.create(
+            name=f"Author {index}", email=f"author{index}@example.com"
+        )
+        for book_index in range(book_count):
+            BookService.create_book(
+                {
+                    "title": f"Book {index}-{book_index}",
+                    "isbn": f"{index:06d}{book_index:07d}",
+                    "price": Decimal("10.00"),
+                    "author_id": author.id,
+                }
+            )
+        return author
+
+    def test_list_returns_book_counts(self):
+        """Test that the list endpoint reports each author's book count."""
+        self.create_author(1, 3)
+        self.create_author(2, 0)
+
+        response = self.client.get(reverse("v1:author-list"))
+
+        self.assertEqual(response.status_code, 200)
+        counts = {row["name"]: row["book_count"] for row in response.data["results"]}
+        self.assertEqual(counts, {"Author 1": 3, "Author 2": 0})
+
+    def test_list_query_count_is_constant(self):
+        """Test that the list endpoint does not issue a query per author."""
+        for index in range(5):
+            self.create_author(index, 2)
+
+        # One COUNT for pagination and one SELECT for the page.
+        with self.assertNumQueries(2):
+            self.client.get(reverse("v1:author-list"))
@@ -0,0 +1,331 @@
+"""
+Test the Book viewset.
+"""
+
+import csv
+import io
+import json
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import AsyncRequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase, force_authenticate
+
+from books.models.author import Author
+from books.models.book import Book
+from books.models.category import Category
+from books.search.indexes import clear_indexes
+from books.services.book_export_services import EXPORT_FIELDS
+from books.utils import values_by
+from books.viewsets.book_viewset import BookViewSet
+
+
+class BookCursorPaginationTest(APITestCase):
+    """
+    Test the opt-in keyset pagination of the book list.
+    """
+
+    def setUp(self):
+        clear_indexes()
+        user = get_user_model().objects.create_user(username="reader")
+        self.client.force_authenticate(user=user)
+        author = Author.objects.create(name="John Doe", email="john@example.com")
+        now = timezone.now()
+        # Pairs of books share a timestamp and every third price repeats,
+        # so the id tie-breaker is exercised for both orderings.
+        Book.objects.bulk_create(
+            Book(
+                title=f"Book {index:02d}",
+                isbn=f"{index:013d}",
+                price=Decimal(10 + index % 3),
+                author=author,
+                created_at=now - timedelta(minutes=index // 2),
+            )
+            for index in range(45)
+        )
+
+    def walk(self, url, link="next"):
+        """Follow the given link until the end and return every result id."""
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn("count", response.data)
+            ids.extend(row["id"] for row in response.data["results"])
+            url = response.data[link]
+        return ids
+
+    def test_cursor_pages_follow_the_default_ordering(self):
+        """Test that cursor pages cover the list once in (-created_at, -id) order."""
+        ids = self.walk(reverse("v1:book-list") + "?pagination=cursor")
+
+        expected = list(
+            Book.objects.order_by("-created_at", "-id").values_list("id", flat=True)
+        )
+        self.assertEqual(ids, expected)
+
+    def test_cursor_pages_support_other_orderings(self):
+        """Test that cursor pages work with any ordering field."""
+        ids = self.walk(reverse("v1:book-list") + "?pagination=cursor&ordering=price")
+
+        expected = list(
+            Book.objects.order_by("price", "id").values_list("id", flat=True)
+        )
+        self.assertEqual(ids, expected)
+
+    def test_cursor_pages_of_a_search(self):
+        """Test that cursor pages of a ranked search are complete and disjoint."""
+        url = reverse("v1:book-list") + "?pagination=cursor"
+        expected = set(Book.objects.values_list("id", flat=True))
+
+        # Every title matches with the same rank, so the pages cut through
+        # rows tied on search_rank and only the id tells them apart.
+        for query in ("&search=book", "&search=bok&search_mode=fuzzy"):
+            with self.subTest(query=query):
+                ids = self.walk(url + query)
+
+                self.assertEqual(len(ids), len(expected))
+                self.assertEqual(set(ids), expected)
+
+    def test_previous_link_returns_the_previous_page(self):
+        """Test that the previous cursor returns to the page before."""
+        first = self.client.get(reverse("v1:book-list") + "?pagination=cursor")
+        second = self.client.get(first.data["next"])
+        back = self.client.get(second.data["previous"])
+
+        self.assertEqual(back.data["results"], first.data["results"])
+        self.assertIsNone(back.data["previous"])
+
+    def test_deep_cursor_page_query_count(self):
+        """Test that a cursor page never counts the whole table, at any depth."""
+        url = reverse("v1:book-list") + "?pagination=cursor"
+        url = self.client.get(self.client.get(url).data["next"]).data["next"]
+
+        # The conditional GET validators over the page window and the page
+        # SELECT (the list projection skips the categories prefetch).
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(len(queries), 2)
+        self.assertIn("LIMIT 21", queries[0]["sql"])
+        self.assertEqual(len(response.data["results"]), 5)
+
+    def test_invalid_cursor(self):
+        """Test that a tampered cursor is rejected with 404."""
+        response = self.client.get(reverse("v1:book-list") + "?cursor=not-a-cursor")
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_page_number_pagination_is_the_default(self):
+        """Test that existing clients keep the page-number response."""
+        response = self.client.get(reverse("v1:book-list") + "?page=3")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 45)
+        self.assertEqual(len(response.data["results"]), 5)
+
+
+class BookBulkCreateTest(APITestCase):
+    """
+    Test the bulk book creation endpoint.
+    """
+
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="reader")
+        self.client.force_authenticate(user=user)
+        self.author = Author.objects.create(name="John Doe", email="john@example.com")
+        self.fiction = Category.objects.create(name="Fiction")
+        self.history = Category.objects.create(name="History")
+        self.url = reverse("v1:book-bulk-create")
+
+    def payload(self, count, **overrides):
+        return {
+            "books": [
+                {
+                    "title": f"Book {index}",
+                    "isbn": f"{index:013d}",
+                    "price": "9.99",
+                    "author_id": self.author.id,
+                    "category_ids": [self.fiction.id, self.history.id],
+                    **overrides,
+                }
+                for index in range(count)
+            ]
+        }
+
+    def test_bulk_create(self):
+        """Test that books, links and counters are written in bulk."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, self.payload(1200), format="json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["data"]["created"], 1200)
+        created = response.data["data"]["books"]
+        self.assertEqual(
+            [row["isbn"] for row in created], [f"{i:013d}" for i in range(1200)]
+        )
+        self.assertEqual(Book.objects.count(), 1200)
+        self.assertEqual(Book.categories.through.objects.count(), 2400)
+        self.author.refresh_from_db()
+        self.fiction.refresh_from_db()
+        self.assertEqual(self.author.book_count, 1200)
+        self.assertEqual(self.fiction.book_count, 1200)
+        # Inserts and IN lookups are batched by the backend's parameter limit
+        # (999 on SQLite), never issued per book.
+        self.assertLess(len(queries), 30)
+
+    def test_invalid_items_are_reported_by_index(self):
+        """Test that nothing is created and every bad item is reported."""
+        Book.objects.create(
+            title="Existing", isbn=f"{1:013d}", price=1, author=self.author
+        )
+        payload = self.payload(4)
+        payload["books"][2]["isbn"] = payload["books"][3]["isbn"]
+        payload["books"][3]["author_id"] = 999999
+        payload["books"][0]["category_ids"] = [999999]
+
+        response = self.client.post(self.url, payload, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        fields = {error["field"] for error in response.data["errors"]}
+        self.assertEqual(
+            fields,
+            {
+                "books[0].category_ids",
+                "books[1].isbn",
+                "books[3].isbn",
+                "books[3].author_id",
+            },
+        )
+        self.assertEqual(Book.objects.count(), 1)
+
+    def test_concurrent_isbn_is_reported_by_index(self):
+        """Test that an ISBN taken after the check is reported, not a 500."""
+
+        def check_then_race(queryset, field, values):
+            found = values_by(queryset, field, values)
+            if field == "isbn" and not Book.objects.filter(title="Racer").exists():
+                Book.objects.create(
+                    title="Racer", isbn=f"{2:013d}", price=1, author=self.author
+                )
+            return found
+
+        with mock.patch(
+            "books.services.book_services.values_by", side_effect=check_then_race
+        ):
+            response = self.client.post(self.url, self.payload(3), format="json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            [error["field"] for error in response.data["errors"]], ["books[2].isbn"]
+        )
+        self.assertFalse(Book.objects.filter(title__startswith="Book").exists())
+
+    def test_item_serializer_errors_are_reported_by_index(self):
+        """Test that per-item field validation errors carry their index."""
+        payload = self.payload(2)
+        payload["books"][1]["price"] = "-1"
+
+        response = self.client.post(self.url, payload, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["errors"][0]["field"], "books[1].price")
+
+    def test_empty_payload_is_rejected(self):
+        """Test that an empty list is rejected."""
+        response = self.client.post(self.url, {"books": []}, format="json")
+
+        self.assertEqual(response.status_code, 400)
+
+
+class BookExportTest(APITestCase):
+    """
+    Test the streaming catalog export.
+    """
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="reader")
+        self.client.force_authenticate(user=self.user)
+        author = Author.objects.create(name="John Doe", email="john@example.com")
+        self.fiction = Category.objects.create(name="Fiction")
+        self.history = Category.objects.create(name="History")
+        Book.objects.bulk_create(
+            Book(
+                title=f"Book {index}",
+                isbn=f"{index:013d}",
+                price=Decimal("9.50"),
+                author=author,
+            )
+            for index in range(7)
+        )
+        self.books = list(Book.objects.order_by("id"))
+        self.books[0].categories.set([self.fiction, self.history])
+        self.books[6].categories.set([self.history])
+        self.url = reverse("v1:book-export")
+
+    def content(self, response):
+        return b"".join(response.streaming_content).decode()
+
+    @override_settings(BOOKS_EXPORT_CHUNK_SIZE=3)
+    def test_export_ndjson(self):
+        """Test that every book is streamed with its author and category ids."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+            rows = [json.loads(line) for line in self.content(response).splitlines()]
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual([row["id"] for row in rows], [book.id for book in self.books])
+        self.assertEqual(
+            rows[0]["category_ids"], sorted([self.fiction.id, self.history.id])
+        )
+        self.assertEqual(rows[6]["category_ids"], [self.history.id])
+        self.assertEqual(rows[1]["category_ids"], [])
+        self.assertEqual(rows[0]["price"], "9.50")
+        self.assertEqual(rows[0]["author_id"], self.books[0].author_id)
+        # One category query per chunk of three books, never one per book.
+        category_queries = [q for q in queries if "books_categories" in q["sql"]]
+        self.assertEqual(len(category_queries), 3)
+
+    def test_export_csv(self):
+        """Test that the CSV export has a header and one line per book."""
+        response = self.client.get(self.url + "?export_format=csv")
+        rows = list(csv.DictReader(io.StringIO(self.content(response))))
+
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertIn("books.csv", response["Content-Disposition"])
+        self.assertEqual(len(rows), 7)
+        self.assertEqual(
+            rows[0]["category_ids"],
+            "|".join(str(pk) for pk in sorted([self.fiction.id, self.history.id])),
+        )
+
+    @override_settings(BOOKS_EXPORT_CHUNK_SIZE=3)
+    async def test_export_under_asgi(self):
+        """Test that under ASGI the rows are read chunk by chunk, not listed."""
+        request = AsyncRequestFactory().get(self.url + "?export_format=csv")
+        force_authenticate(request, user=self.user)
+        view = BookViewSet.as_view({"get": "export"})
+
+        response = await sync_to_async(view)(request)
+        parts = [part.decode() async for part in response]
+
+        self.assertTrue(response.is_async)
+        # The header, then one part per chunk of three books
+        self.assertEqual(len(parts), 4)
+        self.assertEqual(parts[0], ",".join(EXPORT_FIELDS) + "\r\n")
+        rows = list(csv.DictReader(io.StringIO("".join(parts))))
+        self.assertEqual([int(row["id"]) for row in rows], [b.id for b in self.books])
+        self.assertEqual(rows[6]["category_ids"], str(self.history.id))
+
+    def test_invalid_export_format(self):
+        """Test that an unknown export format is rejected."""
+        response = self.client.get(self.url + "?export_format=xml")
+
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,59 @@
+"""
+Test the Category viewset.
+"""
+
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from books.models.author import Author
+from books.models.category import Category
+from books.services.book_services import BookService
+
+
+class CategoryViewSetTest(APITestCase):
+    """
+    Test the Category viewset.
+    """
+
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="reader")
+        self.client.force_authenticate(user=user)
+        self.author = Author.objects.create(name="John Doe", email="john@example.com")
+
+    def create_category(self, name, book_count):
+        """Create a category with the given number of books."""
+        category = Category.objects.create(name=name)
+        for index in range(book_count):
+            BookService.create_book(
+                {
+                    "title": f"{name} {index}",
+                    "isbn": f"{category.id:06d}{index:07d}",
+                    "price": Decimal("10.00"),
+                    "author_id": self.author.id,
+                    "category_ids": [category.id],
+                }
+            )
+        return category
+
+    def test_list_returns_book_counts(self):
+        """Test that the list endpoint reports each category's book count."""
+        self.create_category("Fiction", 2)
+        self.create_category("Poetry", 0)
+
+        response = self.client.get(reverse("v1:category-list"))
+
+        self.assertEqual(response.status_code, 200)
+        counts = {row["name"]: row["book_count"] for row in response.data["results"]}
+        self.assertEqual(counts, {"Fiction": 2, "Poetry": 0})
+
+    def test_list_query_count_is_constant(self):
+        """Test that the list endpoint does not issue a query per category."""
+        for index in range(5):
+            self.create_category(f"Category {index}", 2)
+
+        # One COUNT for pagination and one SELECT for the page.
+        with self.assertNumQueries(2):
+            self.client.get(reverse("v1:category-list"))
@@ -0,0 +1,134 @@
+"""
+Test ETag / Last-Modified conditional GET support on the catalog viewsets.
+"""
+
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from books.models.author import Author
+from books.models.category import Category
+from books.search.filters import FullTextSearchFilter
+from books.services.book_services import BookService
+
+
+class ConditionalGetTest(APITestCase):
+    """
+    Test that list and retrieve answer conditional requests with 304.
+    """
+
+    def setUp(self):
+        cache.clear()
+        user = get_user_model().objects.create_user(username="reader")
+        self.client.force_authenticate(user=user)
+        self.author = Author.objects.create(name="John Doe", email="john@example.com")
+        self.category = Category.objects.create(name="Fiction")
+        self.book = self.create_book("First", "9780000000001")
+
+    def create_book(self, title, isbn):
+        """Create a book through the service and run its commit hooks."""
+        with self.captureOnCommitCallbacks(execute=True):
+            return BookService.create_book(
+                {
+                    "title": title,
+                    "isbn": isbn,
+                    "price": Decimal("10.00"),
+                    "author_id": self.author.id,
+                    "category_ids": [self.category.id],
+                }
+            )
+
+    def test_list_emits_validators(self):
+        """Test that list responses carry ETag, Last-Modified and no-cache."""
+        response = self.client.get(reverse("v1:book-list"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertIn("Last-Modified", response)
+        self.assertIn("no-cache", response["Cache-Control"])
+
+    def test_if_none_match_returns_304_without_fetching_rows(self):
+        """Test that a matching ETag costs a single aggregate query."""
+        url = reverse("v1:book-list")
+        etag = self.client.get(url)["ETag"]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+    def test_search_runs_once(self):
+        """Test that the validators and the page share the filtered queryset."""
+        with mock.patch.object(
+            FullTextSearchFilter,
+            "filter_queryset",
+            autospec=True,
+            side_effect=FullTextSearchFilter.filter_queryset,
+        ) as search:
+            response = self.client.get(reverse("v1:book-list"), {"search": "first"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(search.call_count, 1)
+
+    def test_if_modified_since_returns_304(self):
+        """Test that Last-Modified is honoured by If-Modified-Since."""
+        url = reverse("v1:category-list")
+        last_modified = self.client.get(url)["Last-Modified"]
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+    def test_etag_depends_on_query_and_media_type(self):
+        """Test that different representations get different ETags."""
+        url = reverse("v1:book-list")
+        etag = self.client.get(url)["ETag"]
+
+        self.assertNotEqual(self.client.get(url, {"ordering": "title"})["ETag"], etag)
+        self.assertNotEqual(self.client.get(url, HTTP_ACCEPT="text/html")["ETag"], etag)
+
+    def test_related_write_changes_etag(self):
+        """Test that a new book changes the author list ETag."""
+        url = reverse("v1:author-list")
+        etag = self.client.get(url)["ETag"]
+
+        self.create_book("Second", "9780000000002")
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["results"][0]["book_count"], 2)
+
+    def test_retrieve(self):
+        """Test conditional retrieve, and 404 for missing objects."""
+        url = reverse("v1:book-detail", args=[self.book.id])
+        etag = self.client.get(url)["ETag"]
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        missing = reverse("v1:book-detail", args=[self.book.id + 100])
+        self.assertEqual(self.client.get(missing).status_code, 404)
+
+    @override_settings(BOOKS_RESPONSE_CACHE_ENABLED=True)
+    def test_revalidation_is_free_with_response_cache(self):
+        """Test that cached validators answer 304 without any query."""
+        url = reverse("v1:book-list")
+        etag = self.client.get(url)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    @override_settings(BOOKS_RESPONSE_CACHE_SHARED=None)
+    def test_no_validators_without_shared_cache(self):
+        """Test that a per-process cache emits no ETag or Last-Modified."""
+        response = self.client.get(reverse("v1:book-list"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response)
+        self.assertNotIn("Last-Modified", response)
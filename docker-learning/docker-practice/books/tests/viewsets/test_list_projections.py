@@ -0,0 +1,69 @@
+"""
+Test that list projections render exactly like the list serializers.
+"""
+
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from books.models.author import Author
+from books.models.book import Book
+from books.models.category import Category
+from books.search.indexes import clear_indexes
+from books.viewsets.author_viewset import AuthorViewSet
+from books.viewsets.book_viewset import BookViewSet
+from books.viewsets.category_viewset import CategoryViewSet
+
+
+class ListProjectionTest(APITestCase):
+    """
+    Test the values() list path against the serializer path, byte for byte.
+    """
+
+    def setUp(self):
+        clear_indexes()
+        user = get_user_model().objects.create_user(username="reader")
+        self.client.force_authenticate(user=user)
+        authors = [
+            Author.objects.create(name="John Doe", email="john@example.com"),
+            Author.objects.create(name="Ann  Lee", email="ann@example.com"),
+        ]
+        for name in ("science fiction", " history "):
+            Category.objects.create(name=name)
+        for index, price in enumerate(["9.5", "10", "0.01", "12345678.99"]):
+            Book.objects.create(
+                title=f"Book {index}",
+                isbn=f"{index:013d}",
+                price=Decimal(price),
+                author=authors[index % 2],
+            )
+
+    def assertSameContent(self, viewset, url):
+        projected = self.client.get(url)
+        with mock.patch.object(viewset, "list_projection", None):
+            serialized = self.client.get(url)
+
+        self.assertEqual(projected.status_code, 200)
+        self.assertEqual(projected.content, serialized.content)
+
+    def test_book_list(self):
+        """Test the book list in page and cursor modes."""
+        url = reverse("v1:book-list")
+        self.assertSameContent(BookViewSet, url)
+        self.assertSameContent(BookViewSet, url + "?ordering=-price")
+        self.assertSameContent(BookViewSet, url + "?pagination=cursor")
+        self.assertSameContent(BookViewSet, url + "?search=book&pagination=cursor")
+        self.assertSameContent(
+            BookViewSet, url + "?search=bok&search_mode=fuzzy&pagination=cursor"
+        )
+
+    def test_author_list(self):
+        """Test the author list."""
+        self.assertSameContent(AuthorViewSet, reverse("v1:author-list"))
+
+    def test_category_list(self):
+        """Test the category list."""
+        self.assertSameContent(CategoryViewSet, reverse("v1:category-list"))
@@ -0,0 +1,104 @@
+"""
+Test the Prometheus metrics.
+"""
+
+import os
+import tempfile
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.urls import reverse
+from prometheus_client import REGISTRY
+from rest_framework.test import APITestCase
+
+from books.models.author import Author
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class MetricsTest(APITestCase):
+    """
+    Test the request metrics and the /metrics endpoint.
+    """
+
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="reader")
+        self.client.force_authenticate(user=user)
+        Author.objects.create(name="John Doe", email="john@example.com")
+
+    def test_request_latency_and_queries(self):
+        """Test that a request is observed under its view and method."""
+        labels = {"view": "v1:author-list", "method": "GET"}
+        requests = sample("api_request_duration_seconds_count", **labels)
+        queries = sample("api_request_db_queries_sum", **labels)
+
+        self.client.get(reverse("v1:author-list"))
+
+        self.assertEqual(
+            sample("api_request_duration_seconds_count", **labels), requests + 1
+        )
+        self.assertEqual(sample("api_request_db_queries_sum", **labels), queries + 2)
+        self.assertEqual(sample("api_requests_in_progress", **labels), 0)
+
+    def test_errors_are_counted_by_error_code(self):
+        """Test that error responses are counted with their error_code."""
+        labels = {"view": "v1:author-detail", "error_code": "HTTP404"}
+        errors = sample("api_errors_total", **labels)
+
+        response = self.client.get(reverse("v1:author-detail", args=[999999]))
+
+        self.assertEqual(response.data["error_code"], "HTTP404")
+        self.assertEqual(sample("api_errors_total", **labels), errors + 1)
+
+    @override_settings(BOOKS_RESPONSE_CACHE_ENABLED=True)
+    def test_response_cache_lookups(self):
+        """Test that response cache hits and misses are counted."""
+        url = reverse("v1:author-list")
+        hits = sample(
+            "api_response_cache_lookups_total", viewset="author", outcome="hits"
+        )
+
+        self.client.get(url)
+        self.client.get(url)
+
+        self.assertEqual(
+            sample(
+                "api_response_cache_lookups_total", viewset="author", outcome="hits"
+            ),
+            hits + 1,
+        )
+
+    def test_metrics_endpoint(self):
+        """Test that the endpoint serves the Prometheus text format."""
+        self.client.get(reverse("v1:author-list"))
+
+        response = self.client.get(reverse("metrics"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        self.assertIn(b"api_request_duration_seconds_bucket{", response.content)
+
+    @override_settings(METRICS_BEARER_TOKEN="secret")
+    def test_metrics_endpoint_token(self):
+        """Test that a configured token is required to scrape."""
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 401)
+
+        response = self.client.get(
+            reverse("metrics"), HTTP_AUTHORIZATION="Bearer secret"
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_metrics_endpoint_merges_worker_files(self):
+        """Test that the multiprocess directory is read when configured."""
+        with tempfile.TemporaryDirectory() as directory:
+            with mock.patch.dict(os.environ, {"PROMETHEUS_MULTIPROC_DIR": directory}):
+                with mock.patch(
+                    "core.views.multiprocess.MultiProcessCollector"
+                ) as collector:
+                    response = self.client.get(reverse("metrics"))
+
+        self.assertEqual(response.status_code, 200)
+        collector.assert_called_once()
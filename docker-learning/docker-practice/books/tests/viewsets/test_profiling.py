@@ -0,0 +1,119 @@
+"""
+Test the sampling profiler.
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from books.services.author_services import AuthorService
+from core_commons.profiling import (
+    Sampler,
+    check_profile_token,
+    collapse,
+    make_profile_token,
+)
+
+get_all_authors = AuthorService.get_all_authors
+
+
+def slow_authors():
+    time.sleep(0.05)
+    return get_all_authors()
+
+
+class ProfilingTest(APITestCase):
+    """
+    Test the profiled requests and the collapsed stack files.
+    """
+
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="reader")
+        self.client.force_authenticate(user=user)
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.output = Path(self.directory.name)
+
+    def get_authors(self, **headers):
+        with override_settings(
+            PROFILER_ENABLED=True,
+            PROFILER_INTERVAL=0.001,
+            PROFILER_OUTPUT_DIR=self.output,
+        ):
+            with mock.patch.object(
+                AuthorService, "get_all_authors", side_effect=slow_authors
+            ):
+                return self.client.get(reverse("v1:author-list"), **headers)
+
+    def test_signed_header_profiles_the_request(self):
+        """Test that a signed header writes the stacks of the view."""
+        response = self.get_authors(HTTP_X_PROFILE=make_profile_token())
+
+        self.assertEqual(response.status_code, 200)
+        lines = (self.output / "v1-author-list.collapsed").read_text().splitlines()
+        self.assertTrue(lines)
+        stack, count = lines[0].rsplit(" ", 1)
+        self.assertGreater(int(count), 0)
+        self.assertTrue(any("slow_authors" in line for line in lines))
+        # Stacks start below the profiling middleware.
+        self.assertFalse(any("ProfilingMiddleware" in line for line in lines))
+
+    def test_unsigned_requests_are_not_profiled(self):
+        """Test that a forged header or a zero rate profiles nothing."""
+        self.get_authors(HTTP_X_PROFILE="profile:forged:signature")
+        self.get_authors()
+
+        self.assertEqual(list(self.output.iterdir()), [])
+
+    @override_settings(PROFILER_TOKEN_MAX_AGE=-1)
+    def test_expired_token(self):
+        """Test that tokens expire."""
+        self.assertFalse(check_profile_token(make_profile_token()))
+
+    def test_tokens_are_signed_with_the_secret_key(self):
+        """Test that tokens signed with another key are rejected."""
+        token = signing.TimestampSigner(key="other", salt="core_commons.profiling")
+        self.assertFalse(check_profile_token(token.sign("profile")))
+        self.assertTrue(check_profile_token(make_profile_token()))
+
+
+class SamplerTest(SimpleTestCase):
+    """
+    Test the stack sampler.
+    """
+
+    def test_samples_another_thread(self):
+        """Test that the sampler counts the stacks of the sampled thread."""
+
+        def busy_wait():
+            deadline = time.monotonic() + 0.05
+            while time.monotonic() < deadline:
+                pass
+
+        sampler = Sampler(threading.get_ident(), None, 0.001)
+        sampler.start()
+        busy_wait()
+        stacks = sampler.stop()
+
+        self.assertGreater(sum(stacks.values()), 5)
+        self.assertTrue(any("busy_wait (" in stack for stack in stacks))
+
+    def test_collapse_stops_at_the_root(self):
+        """Test that frames above the root code are left out."""
+
+        def inner():
+            return collapse(sys._getframe(), outer.__code__)
+
+        def outer():
+            return inner()
+
+        self.assertRegex(outer(), r"^inner \(.*test_profiling.py:\d+\)$")
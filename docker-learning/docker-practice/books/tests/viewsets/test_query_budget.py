@@ -0,0 +1,165 @@
+"""
+Test the query budget middleware and the budgets of the viewset actions.
+"""
+
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from books.models.author import Author
+from books.models.book import Book
+from books.models.category import Category
+from books.viewsets.author_viewset import AuthorViewSet
+from books.viewsets.book_viewset import BookViewSet
+from core_commons.query_budget import (
+    QueryBudgetExceeded,
+    QueryBudgetMiddleware,
+    fingerprint,
+    get_view_budget,
+)
+
+
+class QueryBudgetMiddlewareTest(TestCase):
+    """
+    Test the SQL fingerprints and the checks of the middleware.
+    """
+
+    def setUp(self):
+        self.author = Author.objects.create(name="John Doe", email="john@example.com")
+        self.request = RequestFactory().get("/api/v1/authors/")
+
+    def run_view(self, view_func, queries):
+        """Run the middleware around a view issuing the given queries."""
+        middleware = QueryBudgetMiddleware(lambda request: view(request))
+
+        def view(request):
+            middleware.process_view(request, view_func, (), {})
+            for query in queries:
+                query()
+            return HttpResponse()
+
+        return middleware(self.request)
+
+    def test_fingerprint_ignores_parameters(self):
+        """Test that statements differing only by parameters share a shape."""
+        self.assertEqual(
+            fingerprint('SELECT * FROM "books" WHERE "id" IN (%s, %s, %s)'),
+            fingerprint('SELECT * FROM "books"\n WHERE "id" IN (%s)'),
+        )
+        self.assertEqual(
+            fingerprint("INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s)"),
+            fingerprint("INSERT INTO t (a, b) VALUES (%s, %s)"),
+        )
+
+    def test_actions_declare_budgets(self):
+        """Test that the budget is read from the action serving the method."""
+        view = AuthorViewSet.as_view({"get": "books"})
+
+        self.assertEqual(get_view_budget(view, "GET"), 2)
+        self.assertIsNone(get_view_budget(view, "POST"))
+        self.assertIsNone(get_view_budget(lambda request: None, "GET"))
+
+    def test_repeated_selects_are_reported(self):
+        """Test that the same SELECT shape run per row fails the request."""
+        queries = [
+            lambda author_id=author_id: Author.objects.filter(id=author_id).first()
+            for author_id in range(3)
+        ]
+
+        with self.assertRaisesMessage(QueryBudgetExceeded, "3x SELECT"):
+            self.run_view(None, queries)
+
+    def test_exceeded_budget_is_reported(self):
+        """Test that running more queries than the action budget fails."""
+        view = AuthorViewSet.as_view({"get": "statistics"})
+        queries = [Author.objects.count, Book.objects.count]
+
+        with self.assertRaisesMessage(QueryBudgetExceeded, "2 queries, budget is 1"):
+            self.run_view(view, queries)
+
+    def test_requests_within_budget_pass(self):
+        """Test that distinct queries within the budget pass."""
+        view = BookViewSet.as_view({"get": "retrieve"})
+        queries = [Author.objects.count, Book.objects.count]
+
+        self.assertEqual(self.run_view(view, queries).status_code, 200)
+
+    @override_settings(QUERY_BUDGET_RAISE=False)
+    def test_problems_are_logged_when_not_raising(self):
+        """Test that problems are logged as warnings outside the tests."""
+        view = AuthorViewSet.as_view({"get": "statistics"})
+        queries = [Author.objects.count, Book.objects.count]
+
+        with self.assertLogs("core_commons.query_budget", "WARNING") as logs:
+            response = self.run_view(view, queries)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("GET /api/v1/authors/: 2 queries", logs.output[0])
+
+
+class RelatedBooksQueryTest(APITestCase):
+    """
+    Test that the related book lists run a fixed number of queries.
+    """
+
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="reader")
+        self.client.force_authenticate(user=user)
+        self.category = Category.objects.create(name="Fiction")
+        self.authors = [
+            Author.objects.create(name=f"Author {index}", email=f"{index}@example.com")
+            for index in range(5)
+        ]
+        for index in range(10):
+            book = Book.objects.create(
+                title=f"Book {index}",
+                isbn=f"{index:013d}",
+                price=Decimal("9.99"),
+                author=self.authors[index % 5],
+            )
+            book.categories.add(self.category)
+
+    def test_author_books(self):
+        """Test that the author books action reads the author once."""
+        Book.objects.bulk_create(
+            Book(
+                title=f"Extra {index}",
+                isbn=f"9{index:012d}",
+                price=Decimal("5.00"),
+                author=self.authors[0],
+            )
+            for index in range(5)
+        )
+        url = reverse("v1:author-books", args=[self.authors[0].id])
+
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+
+        self.assertEqual(len(response.data["data"]), 7)
+        self.assertEqual(response.data["data"][0]["author_name"], "Author 0")
+
+    def test_category_books(self):
+        """Test that the category books action joins the authors."""
+        url = reverse("v1:category-books", args=[self.category.id])
+
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+
+        self.assertEqual(len(response.data), 10)
+        self.assertEqual(
+            {row["author_name"] for row in response.data},
+            {author.name for author in self.authors},
+        )
+
+    def test_category_detail(self):
+        """Test that the category detail lists its books without an N+1."""
+        url = reverse("v1:category-detail", args=[self.category.id])
+
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+
+        self.assertEqual(len(response.data["books"]), 10)
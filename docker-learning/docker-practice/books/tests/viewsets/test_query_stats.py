@@ -0,0 +1,114 @@
+"""
+Test the SQL statistics and the slow-query log.
+"""
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from books.models.author import Author
+from core_commons.query_stats import QueryStats, query_stats
+
+
+class QueryStatsTest(SimpleTestCase):
+    """
+    Test the aggregation of the statistics.
+    """
+
+    def test_statements_are_aggregated_by_fingerprint(self):
+        """Test that statements differing by parameters share their stats."""
+        stats = QueryStats()
+        for index in range(1, 21):
+            placeholders = ", ".join(["%s"] * index)
+            sql = f'SELECT * FROM "books" WHERE "id" IN ({placeholders})'
+            stats.record(sql, index / 1000, index, "v1:book-list")
+        stats.record('SELECT * FROM "authors"', 0.5, -1, None)
+
+        authors, books = stats.top()
+        self.assertEqual(books["count"], 20)
+        self.assertEqual(books["total_ms"], 210.0)
+        self.assertEqual(books["mean_ms"], 10.5)
+        self.assertEqual(books["p95_ms"], 19.0)
+        self.assertEqual(books["max_ms"], 20.0)
+        self.assertEqual(books["rows"], 210)
+        self.assertEqual(books["views"], ["v1:book-list"])
+        # SQLite reports -1 rows for SELECTs; they are not counted.
+        self.assertEqual(authors["rows"], 0)
+        self.assertEqual(stats.top(order_by="count"), [books, authors])
+        self.assertEqual(stats.top(limit=1), [authors])
+
+    @override_settings(QUERY_STATS_MAX_FINGERPRINTS=1)
+    def test_fingerprints_are_capped(self):
+        """Test that shapes beyond the cap are only counted."""
+        stats = QueryStats()
+        stats.record("SELECT 1", 0.001, 1, None)
+        stats.record("SELECT 2", 0.001, 1, None)
+
+        self.assertEqual(len(stats.top()), 1)
+        self.assertEqual(stats.untracked, 1)
+
+
+class QueryStatsEndpointTest(APITestCase):
+    """
+    Test the observed requests and the admin endpoint.
+    """
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="reader")
+        self.admin = get_user_model().objects.create_user(
+            username="admin", is_staff=True
+        )
+        Author.objects.create(name="John Doe", email="john@example.com")
+        query_stats.reset()
+        self.url = reverse("v1:query-stats-list")
+
+    def test_requests_are_observed(self):
+        """Test that request queries are reported with their view."""
+        self.client.force_authenticate(user=self.user)
+        self.client.get(reverse("v1:author-list"))
+
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(self.url, {"order_by": "count"})
+
+        self.assertEqual(response.status_code, 200)
+        fingerprints = response.data["data"]["fingerprints"]
+        author_queries = [
+            row for row in fingerprints if 'FROM "authors"' in row["fingerprint"]
+        ]
+        self.assertEqual(len(author_queries), 2)
+        self.assertEqual(author_queries[0]["views"], ["v1:author-list"])
+
+    @override_settings(QUERY_STATS_SLOW_MS=0)
+    def test_slow_queries_are_logged(self):
+        """Test that queries over the threshold are logged with their view."""
+        self.client.force_authenticate(user=self.user)
+
+        with self.assertLogs("core_commons.query_stats", "WARNING") as logs:
+            self.client.get(reverse("v1:author-list"))
+
+        self.assertIn("GET /api/v1/authors/ [v1:author-list]", logs.output[0])
+
+    def test_admin_only(self):
+        """Test that regular users cannot read the statistics."""
+        self.client.force_authenticate(user=self.user)
+
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+    def test_invalid_ordering(self):
+        """Test that unknown orderings are rejected."""
+        self.client.force_authenticate(user=self.admin)
+
+        response = self.client.get(self.url, {"order_by": "sql"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_reset(self):
+        """Test that the statistics can be reset."""
+        self.client.force_authenticate(user=self.admin)
+        self.client.get(reverse("v1:author-list"))
+
+        response = self.client.post(reverse("v1:query-stats-reset"))
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(query_stats.top(), [])
@@ -0,0 +1,112 @@
+"""
+Test the orjson and MessagePack renderers and parsers.
+"""
+
+import datetime
+from decimal import Decimal
+
+import msgpack
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from books.models.author import Author
+from books.models.book import Book
+from core_commons.renderers import MessagePackRenderer, ORJSONRenderer
+
+
+class RendererTest(SimpleTestCase):
+    """
+    Test that the fast renderers encode values like DRF's JSONRenderer.
+    """
+
+    data = {
+        "price": Decimal("29.99"),
+        "created_at": datetime.datetime(2024, 5, 1, 12, 30, tzinfo=datetime.UTC),
+        "day": datetime.date(2024, 5, 1),
+        "name": "Fiction \u2028\u2029 Ünïcode",
+        1: [None, True, 1.5],
+    }
+
+    def test_orjson_matches_the_stock_renderer(self):
+        """Test byte-identical output for the default settings."""
+        self.assertEqual(
+            ORJSONRenderer().render(self.data), JSONRenderer().render(self.data)
+        )
+
+    def test_orjson_indent_falls_back_to_the_stock_renderer(self):
+        """Test that indented output keeps the stock formatting."""
+        media_type = "application/json; indent=4"
+        self.assertEqual(
+            ORJSONRenderer().render(self.data, media_type),
+            JSONRenderer().render(self.data, media_type),
+        )
+
+    def test_msgpack_encodes_decimals_and_datetimes(self):
+        """Test Decimal as in JSON and aware datetimes as timestamps."""
+        decoded = msgpack.unpackb(
+            MessagePackRenderer().render(self.data),
+            timestamp=3,
+            strict_map_key=False,
+        )
+
+        self.assertEqual(decoded["price"], 29.99)
+        self.assertEqual(decoded["created_at"], self.data["created_at"])
+        self.assertEqual(decoded["day"], "2024-05-01")
+
+
+class ContentNegotiationTest(APITestCase):
+    """
+    Test MessagePack content negotiation through the API.
+    """
+
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="reader")
+        self.client.force_authenticate(user=user)
+        author = Author.objects.create(name="John Doe", email="john@example.com")
+        Book.objects.create(
+            title="Sample", isbn="9781234567890", price=Decimal("9.50"), author=author
+        )
+
+    def test_list_as_msgpack(self):
+        """Test that Accept: application/msgpack returns the same data."""
+        url = reverse("v1:book-list")
+        json_response = self.client.get(url)
+        response = self.client.get(url, HTTP_ACCEPT="application/msgpack")
+
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        self.assertEqual(msgpack.unpackb(response.content), json_response.json())
+
+    def test_errors_as_msgpack(self):
+        """Test that the exception handler envelope is rendered as MessagePack."""
+        response = self.client.get(
+            reverse("v1:book-detail", args=[999999]),
+            HTTP_ACCEPT="application/msgpack",
+        )
+
+        self.assertEqual(response.status_code, 404)
+        body = msgpack.unpackb(response.content)
+        self.assertFalse(body["success"])
+        self.assertEqual(body["message"], "Resource not found")
+
+    def test_msgpack_request_body(self):
+        """Test that MessagePack request bodies are parsed."""
+        response = self.client.post(
+            reverse("v1:author-list"),
+            {"name": "Jane Doe", "email": "jane@example.com"},
+            format="msgpack",
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(Author.objects.filter(email="jane@example.com").exists())
+
+    def test_invalid_json_body(self):
+        """Test that malformed JSON is a 400 parse error."""
+        response = self.client.post(
+            reverse("v1:author-list"), "{oops", content_type="application/json"
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["error_code"], "PARSEERROR")
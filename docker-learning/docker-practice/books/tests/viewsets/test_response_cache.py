@@ -0,0 +1,134 @@
+"""
+Test the versioned response cache of the catalog viewsets.
+"""
+
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from books.models.author import Author
+from books.models.category import Category
+from books.services.book_services import BookService
+
+
+@override_settings(BOOKS_RESPONSE_CACHE_ENABLED=True)
+class ResponseCacheTest(APITestCase):
+    """
+    Test that list/retrieve responses are cached and invalidated on write.
+    """
+
+    def setUp(self):
+        cache.clear()
+        user = get_user_model().objects.create_user(username="reader")
+        self.client.force_authenticate(user=user)
+        self.author = Author.objects.create(name="John Doe", email="john@example.com")
+        self.category = Category.objects.create(name="Fiction")
+        BookService.create_book(
+            {
+                "title": "First",
+                "isbn": "9780000000001",
+                "price": Decimal("10.00"),
+                "author_id": self.author.id,
+                "category_ids": [self.category.id],
+            }
+        )
+
+    def test_repeated_get_is_served_from_cache(self):
+        """Test that a repeated list request hits the cache without queries."""
+        url = reverse("v1:book-list")
+        first = self.client.get(url, {"ordering": "title", "page": 1})
+
+        with self.assertNumQueries(0):
+            second = self.client.get(url, {"page": 1, "ordering": "title"})
+
+        self.assertEqual(first["X-Cache"], "MISS")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(second.data, first.data)
+
+    def test_write_invalidates_dependent_responses(self):
+        """Test that creating a book refreshes book and author responses."""
+        books_url = reverse("v1:book-list")
+        author_url = reverse("v1:author-list")
+        self.client.get(books_url)
+        self.client.get(author_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                books_url,
+                {
+                    "title": "Second",
+                    "isbn": "9780000000002",
+                    "price": "12.00",
+                    "author_id": self.author.id,
+                },
+                format="json",
+            )
+        self.assertEqual(response.status_code, 201)
+
+        response = self.client.get(books_url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["count"], 2)
+        response = self.client.get(author_url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["results"][0]["book_count"], 2)
+
+    def test_unrelated_responses_stay_cached(self):
+        """Test that renaming an author keeps category responses cached."""
+        self.client.get(reverse("v1:book-list"))
+        self.client.get(reverse("v1:category-list"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(
+                reverse("v1:author-detail", args=[self.author.id]),
+                {"name": "Jane Doe"},
+                format="json",
+            )
+
+        response = self.client.get(reverse("v1:book-list"))
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["results"][0]["author_name"], "Jane Doe")
+        self.assertEqual(self.client.get(reverse("v1:category-list"))["X-Cache"], "HIT")
+
+    def test_errors_are_not_cached(self):
+        """Test that a 404 is not served again once the row exists."""
+        url = reverse("v1:author-detail", args=[999])
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+        Author.objects.create(id=999, name="Late Author", email="late@example.com")
+
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_stats_count_hits_and_misses(self):
+        """Test that the admin stats endpoint reports the counters."""
+        self.client.get(reverse("v1:category-list"))
+        self.client.get(reverse("v1:category-list"))
+        url = reverse("v1:cache-stats-list")
+
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        admin = get_user_model().objects.create_user(username="admin", is_staff=True)
+        self.client.force_authenticate(user=admin)
+        stats = self.client.get(url).data["data"]
+        self.assertEqual(stats["category"], {"hits": 1, "misses": 1, "hit_ratio": 0.5})
+
+
+@override_settings(BOOKS_RESPONSE_CACHE_ENABLED=True, BOOKS_RESPONSE_CACHE_SHARED=None)
+class LocalResponseCacheTest(APITestCase):
+    """
+    Test that a cache private to each process is refused.
+    """
+
+    def test_local_memory_cache_is_refused(self):
+        """Test that responses are not cached in a local-memory cache."""
+        user = get_user_model().objects.create_user(username="reader")
+        self.client.force_authenticate(user=user)
+
+        with self.assertLogs("books.utils.response_cache", "WARNING"):
+            response = self.client.get(reverse("v1:book-list"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("X-Cache", response)
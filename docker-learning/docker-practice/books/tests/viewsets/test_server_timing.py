@@ -0,0 +1,87 @@
+"""
+Test the Server-Timing header and the per-request timing log line.
+"""
+
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from books.models.author import Author
+from books.models.book import Book
+from core_commons.server_timing import RequestTimings, measure
+
+
+def parse_header(value):
+    """Return {name: (duration, description)} of a Server-Timing header."""
+    metrics = {}
+    for entry in value.split(", "):
+        name, *params = entry.split(";")
+        params = dict(param.split("=", 1) for param in params)
+        metrics[name] = (float(params["dur"]), params.get("desc"))
+    return metrics
+
+
+class ServerTimingTest(APITestCase):
+    """
+    Test the latency breakdown of API requests.
+    """
+
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="reader")
+        self.client.force_authenticate(user=user)
+        author = Author.objects.create(name="John Doe", email="john@example.com")
+        self.book = Book.objects.create(
+            title="Book", isbn="9780000000001", price=Decimal("9.99"), author=author
+        )
+
+    def test_header_has_every_phase(self):
+        """Test that the header splits the request into its phases."""
+        response = self.client.get(reverse("v1:book-detail", args=[self.book.id]))
+
+        metrics = parse_header(response["Server-Timing"])
+        self.assertEqual(list(metrics), ["db", "serialize", "render", "app", "total"])
+        self.assertEqual(metrics["db"][1], '"3 queries"')
+        parts = sum(metrics[name][0] for name in ("db", "serialize", "render", "app"))
+        self.assertAlmostEqual(parts, metrics["total"][0], delta=0.05)
+
+    def test_list_projection_counts_as_serialization(self):
+        """Test that values() based list pages report their serialization."""
+        response = self.client.get(reverse("v1:book-list"))
+
+        self.assertIn("serialize", parse_header(response["Server-Timing"]))
+
+    def test_log_line(self):
+        """Test that every request logs its breakdown."""
+        with self.assertLogs("core_commons.server_timing", "INFO") as logs:
+            self.client.get(reverse("v1:book-list"))
+
+        record = logs.records[0]
+        self.assertEqual(record.server_timing["view"], "v1:book-list")
+        self.assertEqual(record.server_timing["status"], 200)
+        self.assertEqual(record.server_timing["queries"], 2)
+        self.assertIn("method=GET path=/api/v1/books/", record.getMessage())
+
+    @override_settings(SERVER_TIMING_HEADER=False)
+    def test_header_can_be_disabled(self):
+        """Test that the header can be withheld from clients."""
+        response = self.client.get(reverse("v1:book-list"))
+
+        self.assertNotIn("Server-Timing", response)
+
+    def test_measure_outside_a_request(self):
+        """Test that measuring outside a request is a no-op."""
+        with measure("serialize"):
+            pass
+
+    def test_phases_exclude_their_queries(self):
+        """Test that nested measures count once, without the SQL they run."""
+        timings = RequestTimings()
+        with timings.measure("serialize"):
+            with timings.measure("serialize"):
+                # One second of queries run while serializing.
+                timings.db_time += 1.0
+
+        self.assertAlmostEqual(timings.durations["serialize"], -1.0, delta=0.05)
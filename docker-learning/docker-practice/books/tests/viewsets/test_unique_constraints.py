@@ -0,0 +1,163 @@
+"""
+Test that the write endpoints rely on the unique constraints of the models.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from books.models.author import Author
+from books.models.book import Book
+from books.models.category import Category
+
+
+class UniqueConstraintTest(APITestCase):
+    """
+    Test that duplicates are reported as validation errors without any
+    lookup query before the write.
+    """
+
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="writer")
+        self.client.force_authenticate(user=user)
+        self.author = Author.objects.create(name="John Doe", email="john@example.com")
+        self.category = Category.objects.create(name="Fiction")
+        self.book = Book.objects.create(
+            title="Existing", isbn="9780000000001", price=10, author=self.author
+        )
+
+    def assertDuplicate(self, response, field, message):
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.data["errors"],
+            [{"field": field, "message": message, "code": "invalid"}],
+        )
+
+    def assertSingleWrite(self, queries, table):
+        """Assert that the request wrote table with one INSERT and no lookup."""
+        statements = [
+            query["sql"]
+            for query in queries.captured_queries
+            if table in query["sql"] and not query["sql"].startswith("UPDATE")
+        ]
+        self.assertEqual(len(statements), 1, statements)
+        self.assertTrue(statements[0].startswith("INSERT"))
+
+    def test_duplicate_isbn(self):
+        """Test creating and updating a book with a taken ISBN."""
+        payload = {
+            "title": "Copy",
+            "isbn": "9780000000001",
+            "price": "5.00",
+            "author_id": self.author.id,
+        }
+        response = self.client.post(reverse("v1:book-list"), payload, format="json")
+
+        self.assertDuplicate(response, "isbn", "A book with this ISBN already exists")
+        self.assertEqual(Book.objects.count(), 1)
+
+        other = Book.objects.create(
+            title="Other", isbn="9780000000002", price=10, author=self.author
+        )
+        response = self.client.patch(
+            reverse("v1:book-detail", args=[other.id]),
+            {"isbn": "9780000000001"},
+            format="json",
+        )
+
+        self.assertDuplicate(response, "isbn", "A book with this ISBN already exists")
+
+    def test_book_update_keeps_its_own_isbn(self):
+        """Test that a full update may resend the book's own ISBN."""
+        response = self.client.put(
+            reverse("v1:book-detail", args=[self.book.id]),
+            {
+                "title": "Renamed",
+                "isbn": "9780000000001",
+                "price": "12.00",
+                "author_id": self.author.id,
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.book.refresh_from_db()
+        self.assertEqual(self.book.title, "Renamed")
+
+    def test_duplicate_email(self):
+        """Test creating and updating an author with a taken email."""
+        response = self.client.post(
+            reverse("v1:author-list"),
+            {"name": "Copy", "email": "john@example.com"},
+            format="json",
+        )
+
+        self.assertDuplicate(
+            response, "email", "An author with this email already exists."
+        )
+
+        other = Author.objects.create(name="Jane Doe", email="jane@example.com")
+        response = self.client.patch(
+            reverse("v1:author-detail", args=[other.id]),
+            {"email": "john@example.com"},
+            format="json",
+        )
+
+        self.assertDuplicate(
+            response, "email", "An author with this email already exists."
+        )
+
+    def test_duplicate_category_name_ignores_case(self):
+        """Test that category names are compared ignoring case."""
+        response = self.client.post(
+            reverse("v1:category-list"), {"name": " FICTION "}, format="json"
+        )
+
+        self.assertDuplicate(
+            response, "name", "A category with this name already exists."
+        )
+
+        other = Category.objects.create(name="History")
+        response = self.client.patch(
+            reverse("v1:category-detail", args=[other.id]),
+            {"name": "fiction"},
+            format="json",
+        )
+
+        self.assertDuplicate(
+            response, "name", "A category with this name already exists."
+        )
+
+    def test_creates_insert_without_lookups(self):
+        """Test that each create writes its row with a single INSERT."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                reverse("v1:category-list"), {"name": "Poetry"}, format="json"
+            )
+        self.assertEqual(response.status_code, 201)
+        self.assertSingleWrite(queries, '"categories"')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                reverse("v1:author-list"),
+                {"name": "Jane Doe", "email": "jane@example.com"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, 201)
+        self.assertSingleWrite(queries, '"authors"')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                reverse("v1:book-list"),
+                {
+                    "title": "New",
+                    "isbn": "9780000000009",
+                    "price": "5.00",
+                    "author_id": self.author.id,
+                },
+                format="json",
+            )
+        self.assertEqual(response.status_code, 201)
+        self.assertSingleWrite(queries, 'INTO "books"')
@@ -0,0 +1,294 @@
+"""
+Test the queries run by the update and delete endpoints.
+"""
+
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from books.models.author import Author
+from books.models.book import Book
+from books.models.category import Category
+from books.services.book_services import BookService
+
+
+class WritePathTestCase(APITestCase):
+    """
+    Base class running a write and capturing its statements.
+    """
+
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="writer")
+        self.client.force_authenticate(user=user)
+        self.author = Author.objects.create(name="John Doe", email="john@example.com")
+        self.other_author = Author.objects.create(
+            name="Jane Doe", email="jane@example.com"
+        )
+        self.categories = [
+            Category.objects.create(name=name)
+            for name in ("Fiction", "History", "Poetry", "Science")
+        ]
+        self.book = BookService.create_book(
+            {
+                "title": "Book",
+                "isbn": "9780000000001",
+                "price": Decimal("9.99"),
+                "author_id": self.author.id,
+                "category_ids": [self.categories[0].id, self.categories[1].id],
+            }
+        )
+
+    def write(self, method, url, data=None):
+        """Send the request; return the response and its SQL statements."""
+        with CaptureQueriesContext(connection) as queries:
+            response = getattr(self.client, method)(url, data, format="json")
+        statements = [
+            query["sql"]
+            for query in queries.captured_queries
+            if not query["sql"].startswith(("SAVEPOINT", "RELEASE", "ROLLBACK"))
+        ]
+        return response, statements
+
+    def assertUpdates(self, statements, table, columns):
+        """Assert that the single UPDATE of table sets exactly columns."""
+        updates = [sql for sql in statements if sql.startswith(f'UPDATE "{table}"')]
+        self.assertEqual(len(updates), 1, updates)
+        assignments = updates[0].split(" SET ", 1)[1].split(" WHERE ", 1)[0]
+        self.assertEqual(
+            [
+                assignment.split(" = ")[0].strip('"')
+                for assignment in assignments.split(", ")
+            ],
+            columns,
+        )
+
+    def assertNoWrites(self, statements):
+        self.assertEqual(
+            [sql for sql in statements if not sql.startswith("SELECT")], []
+        )
+
+    def category_counts(self):
+        return dict(Category.objects.values_list("name", "book_count"))
+
+
+class BookWritePathTest(WritePathTestCase):
+    """
+    Test that the book writes load and write only what they need.
+    """
+
+    def detail_url(self):
+        return reverse("v1:book-detail", args=[self.book.id])
+
+    def test_update_writes_changed_columns(self):
+        """Test that a partial update writes the changed column only."""
+        response, statements = self.write(
+            "patch", self.detail_url(), {"title": "Renamed", "price": "9.99"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        # The book with its author, the UPDATE and the response categories
+        self.assertEqual(len(statements), 3, statements)
+        self.assertUpdates(statements, "books", ["title", "updated_at"])
+        self.assertEqual(
+            [category["name"] for category in response.data["data"]["categories"]],
+            ["Fiction", "History"],
+        )
+
+    def test_unchanged_update_does_not_write(self):
+        """Test that resending the stored values writes nothing."""
+        response, statements = self.write(
+            "put",
+            self.detail_url(),
+            {
+                "title": "Book",
+                "isbn": "9780000000001",
+                "price": "9.99",
+                "author_id": self.author.id,
+                "category_ids": [self.categories[1].id, self.categories[0].id],
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(statements), 3, statements)
+        self.assertNoWrites(statements)
+
+    def test_replacing_categories(self):
+        """Test that only the links that differ are written and reused."""
+        response, statements = self.write(
+            "patch",
+            self.detail_url(),
+            {"category_ids": [self.categories[1].id, self.categories[2].id]},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        # Book, categories, current links, one DELETE and one INSERT with
+        # their counters, and the timestamp; no read after the writes.
+        self.assertEqual(len(statements), 8, statements)
+        self.assertTrue(statements[-1].startswith('UPDATE "books"'))
+        self.assertUpdates(statements, "books", ["updated_at"])
+        self.assertEqual(
+            [category["name"] for category in response.data["data"]["categories"]],
+            ["History", "Poetry"],
+        )
+        self.assertEqual(
+            self.category_counts(),
+            {"Fiction": 0, "History": 1, "Poetry": 1, "Science": 0},
+        )
+
+    def test_moving_to_another_author(self):
+        """Test the full update path: new author and new categories."""
+        response, statements = self.write(
+            "patch",
+            self.detail_url(),
+            {
+                "author_id": self.other_author.id,
+                "category_ids": [self.categories[3].id],
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(statements), 11, statements)
+        self.assertUpdates(statements, "books", ["author_id", "updated_at"])
+        self.assertEqual(response.data["data"]["author"]["name"], "Jane Doe")
+        self.assertEqual(
+            dict(Author.objects.values_list("name", "book_count")),
+            {"John Doe": 0, "Jane Doe": 1},
+        )
+
+    def test_delete(self):
+        """Test that a delete reads the author id only."""
+        response, statements = self.write("delete", self.detail_url())
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(len(statements), 5, statements)
+        self.assertIn('SELECT "books"."id", "books"."author_id" FROM', statements[0])
+        self.assertEqual(set(self.category_counts().values()), {0})
+        self.assertEqual(Author.objects.get(id=self.author.id).book_count, 0)
+
+    def test_add_category(self):
+        """Test that the category and its link are checked in one query."""
+        url = reverse("v1:book-add-category", args=[self.book.id])
+
+        response, statements = self.write(
+            "post", url, {"category_id": self.categories[2].id}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(statements), 5, statements)
+        self.assertEqual(len(response.data["data"]["categories"]), 3)
+        self.assertEqual(self.category_counts()["Poetry"], 1)
+
+        response, statements = self.write(
+            "post", url, {"category_id": self.categories[2].id}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(len(statements), 2, statements)
+        self.assertEqual(self.category_counts()["Poetry"], 1)
+
+    def test_remove_category(self):
+        """Test that removing a link needs no lookup first."""
+        url = reverse("v1:book-remove-category", args=[self.book.id])
+
+        response, statements = self.write(
+            "post", url, {"category_id": self.categories[0].id}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(statements), 4, statements)
+        self.assertEqual(len(response.data["data"]["categories"]), 1)
+        self.assertEqual(self.category_counts()["Fiction"], 0)
+
+        response, statements = self.write(
+            "post", url, {"category_id": self.categories[0].id}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.category_counts()["Fiction"], 0)
+
+
+class AuthorWritePathTest(WritePathTestCase):
+    """
+    Test that the author writes do not load the author's books.
+    """
+
+    def test_update_writes_changed_columns(self):
+        """Test that an update leaves the book counter alone."""
+        response, statements = self.write(
+            "patch",
+            reverse("v1:author-detail", args=[self.author.id]),
+            {"name": "John Smith", "email": "john@example.com"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        # The author, the UPDATE and the response books
+        self.assertEqual(len(statements), 3, statements)
+        self.assertUpdates(statements, "authors", ["name", "updated_at"])
+        self.assertEqual(response.data["data"]["books"][0]["title"], "Book")
+
+    def test_delete_guard_checks_books(self):
+        """Test that the guard finds the books, whatever the counter says."""
+        Author.objects.filter(id=self.author.id).update(book_count=0)
+
+        response, statements = self.write(
+            "delete", reverse("v1:author-detail", args=[self.author.id])
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Author has 1 book(s) assigned", str(response.data))
+        self.assertTrue(Book.objects.filter(id=self.book.id).exists())
+
+    def test_delete(self):
+        """Test deleting an author without books."""
+        response, statements = self.write(
+            "delete", reverse("v1:author-detail", args=[self.other_author.id])
+        )
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(len(statements), 3, statements)
+        self.assertFalse(Author.objects.filter(id=self.other_author.id).exists())
+
+
+class CategoryWritePathTest(WritePathTestCase):
+    """
+    Test that the category writes do not load the category's books.
+    """
+
+    def test_update_writes_changed_columns(self):
+        """Test that an update leaves the book counter alone."""
+        response, statements = self.write(
+            "patch",
+            reverse("v1:category-detail", args=[self.categories[0].id]),
+            {"description": "Made up stories"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(statements), 3, statements)
+        self.assertUpdates(statements, "categories", ["description", "updated_at"])
+        self.assertEqual(response.data["data"]["books"], ["Book"])
+
+    def test_delete_guard_checks_books(self):
+        """Test that the guard finds the books, whatever the counter says."""
+        Category.objects.filter(id=self.categories[0].id).update(book_count=0)
+
+        response, statements = self.write(
+            "delete", reverse("v1:category-detail", args=[self.categories[0].id])
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Category has 1 book(s) assigned", str(response.data))
+        self.assertTrue(Book.objects.filter(id=self.book.id).exists())
+
+    def test_delete(self):
+        """Test deleting a category without books."""
+        response, statements = self.write(
+            "delete", reverse("v1:category-detail", args=[self.categories[3].id])
+        )
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(len(statements), 3, statements)
+        self.assertEqual(Book.objects.get().categories.count(), 2)
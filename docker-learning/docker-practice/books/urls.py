@@ -11,8 +11,11 @@ from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
 from books.viewsets.author_viewset import AuthorViewSet
+from books.viewsets.autocomplete_viewset import AutocompleteViewSet
 from books.viewsets.book_viewset import BookViewSet
+from books.viewsets.cache_viewset import CacheStatsViewSet
 from books.viewsets.category_viewset import CategoryViewSet
+from books.viewsets.query_stats_viewset import QueryStatsViewSet
 
 # Create a DefaultRouter instance for automatic URL pattern generation
 # DefaultRouter provides an API root view with hyperlinks to all registered viewsets
@@ -23,6 +26,9 @@ router = DefaultRouter()
 router.register(r"books", BookViewSet, basename="book")
 router.register(r"authors", AuthorViewSet, basename="author")
 router.register(r"categories", CategoryViewSet, basename="category")
+router.register(r"autocomplete", AutocompleteViewSet, basename="autocomplete")
+router.register(r"cache-stats", CacheStatsViewSet, basename="cache-stats")
+router.register(r"query-stats", QueryStatsViewSet, basename="query-stats")
 
 # URL patterns include:
 # - / (API root with links to all endpoints)
@@ -34,6 +40,9 @@ router.register(r"categories", CategoryViewSet, basename="category")
 # - /authors/{id}/ (retrieve/update/delete specific author)
 # - /categories/ (list/create categories)
 # - /categories/{id}/ (retrieve/update/delete specific category)
+# - /autocomplete/ (type-ahead suggestions)
+# - /cache-stats/ (response cache hit/miss counters, admin only)
+# - /query-stats/ (SQL statistics per fingerprint, admin only)
 
 app_name = "books"  # App namespace for URL reversing
 urlpatterns = [
@@ -1,4 +1,15 @@
 # Import utilities to make them available when importing from books.utils
+from books.utils.async_views import AsyncReadMixin, afetch_all
+from books.utils.batching import chunked, values_by
+from books.utils.conditional import ConditionalGetMixin
+from books.utils.integrity import unique_violations
+from books.utils.projection import ProjectedListMixin
+from books.utils.response_cache import (
+    CachedResponseMixin,
+    bump_versions,
+    get_cache_stats,
+)
+from books.utils.updates import apply_changes, save_changes
 from books.utils.utils import (
     custom_exception_handler,
     format_validation_errors,
@@ -8,6 +19,18 @@ from books.utils.utils import (
 )
 
 __all__ = [
+    "AsyncReadMixin",
+    "CachedResponseMixin",
+    "ConditionalGetMixin",
+    "ProjectedListMixin",
+    "bump_versions",
+    "chunked",
+    "values_by",
+    "unique_violations",
+    "apply_changes",
+    "save_changes",
+    "afetch_all",
+    "get_cache_stats",
     "custom_exception_handler",
     "format_validation_errors",
     "get_error_message",
@@ -0,0 +1,126 @@
+"""
+Async read actions for the catalog viewsets.
+
+A viewset action ``name`` may have an async twin ``aname``. When
+``BOOKS_ASYNC_VIEWS`` is set (core/asgi.py sets it), the routes serving at
+least one such action become coroutine views: Django awaits them on the
+event loop instead of handing the whole request to a thread, and the twins
+read through the async ORM. Other methods of the same route (POST on the
+list route, PUT on the detail route...) keep their sync handlers, run with
+``sync_to_async``. Under WSGI the setting is off and the views stay
+synchronous.
+
+DRF itself is synchronous: authentication, permissions, throttling and the
+filter backends (which may query, e.g. ModelChoiceFilter validation or the
+search index) run in one ``sync_to_async`` call each. Twins must return what
+their sync action returns; the tests compare both.
+
+The queries of an action are awaited one after the other: with Django 5.0
+the async ORM runs each of them through the request's single sync thread,
+so awaiting them together would queue them all the same.
+"""
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.http import Http404
+from rest_framework.response import Response
+
+
+async def afetch_all(queryset):
+    """Evaluate a queryset through the async ORM."""
+    return [row async for row in queryset]
+
+
+class AsyncReadMixin:
+    """
+    Serve the actions that have an ``a<action>`` coroutine asynchronously,
+    and provide the async ``list``/``retrieve`` the other mixins build on.
+    Goes right before the DRF viewset base class.
+    """
+
+    serve_async = False
+
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        serve_async = getattr(settings, "BOOKS_ASYNC_VIEWS", False) and any(
+            iscoroutinefunction(getattr(cls, f"a{action}", None))
+            for action in (actions or {}).values()
+        )
+        if serve_async:
+            initkwargs["serve_async"] = True
+        view = super().as_view(actions, **initkwargs)
+        if serve_async:
+            markcoroutinefunction(view)
+        return view
+
+    def dispatch(self, request, *args, **kwargs):
+        if self.serve_async:
+            return self.adispatch(request, *args, **kwargs)
+        return super().dispatch(request, *args, **kwargs)
+
+    async def adispatch(self, request, *args, **kwargs):
+        """APIView.dispatch, awaiting the async twin of the action if any."""
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            handler = getattr(self, f"a{self.action}", None) if self.action else None
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                method = request.method.lower()
+                if method in self.http_method_names:
+                    handler = getattr(self, method, self.http_method_not_allowed)
+                else:
+                    handler = self.http_method_not_allowed
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def afilter_queryset(self, queryset):
+        return await sync_to_async(self.filter_queryset)(queryset)
+
+    async def apaginate_queryset(self, queryset):
+        if self.paginator is None:
+            return None
+        return await self.paginator.apaginate_queryset(
+            queryset, self.request, view=self
+        )
+
+    async def aget_object(self):
+        """GenericAPIView.get_object through the async ORM."""
+        queryset = await self.afilter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        filter_kwargs = {self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        try:
+            obj = await queryset.aget(**filter_kwargs)
+        except (queryset.model.DoesNotExist, TypeError, ValueError, ValidationError):
+            raise Http404(
+                f"No {queryset.model._meta.object_name} matches the given query."
+            ) from None
+        await sync_to_async(self.check_object_permissions)(self.request, obj)
+        return obj
+
+    async def alist(self, request, *args, **kwargs):
+        queryset = await self.afilter_queryset(self.get_queryset())
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = self.get_serializer(await afetch_all(queryset), many=True)
+        return Response(serializer.data)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        instance = await self.aget_object()
+        serializer = self.get_serializer(instance)
+        return Response(serializer.data)
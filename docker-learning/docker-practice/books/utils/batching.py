@@ -0,0 +1,29 @@
+"""
+Helpers for set-based queries over large value lists.
+"""
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+def chunked(values, using=DEFAULT_DB_ALIAS):
+    """
+    Split values into lists small enough for one IN (...) lookup on the
+    database (SQLite caps bound parameters, PostgreSQL does not).
+    """
+    values = list(values)
+    size = connections[using].features.max_query_params or len(values) or 1
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def values_by(queryset, field, values, value_field="id"):
+    """
+    Return {field value: value_field} for the rows of queryset whose field is
+    in values, looked up in chunks.
+    """
+    found = {}
+    for chunk in chunked(values, queryset.db):
+        found.update(
+            queryset.filter(**{f"{field}__in": chunk}).values_list(field, value_field)
+        )
+    return found
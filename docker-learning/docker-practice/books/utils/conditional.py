@@ -0,0 +1,181 @@
+"""
+Conditional GET (ETag / Last-Modified) support for the catalog viewsets.
+
+Validators are derived from the filtered queryset without fetching its rows
+(the action then reuses that queryset rather than filtering again):
+one aggregate query returns the row count and ``MAX(updated_at)``, which are
+hashed with the request (path, normalized query string, negotiated media
+type) and the write versions of the models the response reads. The versions
+catch changes the aggregate cannot see, such as a denormalized counter or a
+related author name changing.
+
+``If-None-Match`` / ``If-Modified-Since`` are answered with 304 before the
+page is fetched or serialized. When the response cache is enabled the
+validators are cached under the same versioned key, so a revalidation costs
+no query at all; like responses, they are neither read nor stored by
+requests pinned to the primary, nor stored while a write may be replicating.
+
+The versions and write times behind the validators live in the response
+cache alias. When that cache is private to each process, two workers would
+hand out different validators for the same rows, and a write seen by one
+would not change the other's: no validators are emitted then.
+"""
+
+import hashlib
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+
+from books.utils.response_cache import (
+    get_last_write,
+    get_response_cache,
+    replication_pending,
+    request_digest,
+    response_cache_bypassed,
+    response_cache_enabled,
+    response_cache_shared,
+)
+
+VALIDATORS_KEY = "books:validators:{}:{}"
+
+
+class ConditionalGetMixin:
+    """
+    Emit strong ETags and Last-Modified on ``list`` and ``retrieve`` and
+    answer conditional requests with 304 Not Modified.
+
+    Viewsets declare the models their responses read in
+    ``cache_dependencies`` (shared with CachedResponseMixin). Responses are
+    marked ``Cache-Control: private, no-cache`` so clients store them but
+    always revalidate.
+    """
+
+    cache_dependencies = ()
+    filtered_count = None
+    filtered_queryset = None
+
+    def filter_queryset(self, queryset):
+        # The validators and the action read the same rows: filter (and
+        # search) once per request, views being instantiated per request.
+        if self.filtered_queryset is None:
+            self.filtered_queryset = super().filter_queryset(queryset)
+        return self.filtered_queryset.all()
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(super().retrieve, request, *args, **kwargs)
+
+    async def alist(self, request, *args, **kwargs):
+        return await self.aconditional_response(super().alist, request, *args, **kwargs)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        return await self.aconditional_response(
+            super().aretrieve, request, *args, **kwargs
+        )
+
+    def get_validator_queryset(self, request):
+        """
+        Return the unevaluated rows the response is built from, and whether
+        that is the whole filtered queryset (rather than a page window).
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.action == "retrieve":
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            return (
+                queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]}),
+                False,
+            )
+        paginator = self.paginator
+        if paginator is not None and hasattr(paginator, "get_validator_queryset"):
+            window = paginator.get_validator_queryset(queryset, request)
+            return window, window is queryset
+        return queryset, True
+
+    def get_validators(self, request):
+        """
+        Return (etag, last_modified) for the request, None when the object
+        of a retrieve does not exist or the cache holding the versions is
+        not shared by every process.
+        """
+        if not response_cache_shared():
+            return None
+        digest = request_digest(self, request)
+        media_type = request.accepted_renderer.media_type
+        cache = None
+        if response_cache_enabled() and not response_cache_bypassed():
+            cache = get_response_cache()
+        key = VALIDATORS_KEY.format(digest, media_type)
+        if cache is not None:
+            validators = cache.get(key)
+            if validators is not None:
+                return validators
+
+        queryset, complete = self.get_validator_queryset(request)
+        if complete:
+            queryset = queryset.order_by()
+        state = queryset.aggregate(count=Count("pk"), last=Max("updated_at"))
+        if complete:
+            # Lets the paginator skip its own COUNT.
+            self.filtered_count = state["count"]
+        if self.action == "retrieve" and not state["count"]:
+            return None
+
+        last_modified = get_last_write(self.cache_dependencies)
+        if state["last"] is not None:
+            last_modified = max(last_modified, state["last"].timestamp())
+        tag = hashlib.sha256(
+            "\n".join(
+                [digest, media_type, str(state["count"]), str(state["last"])]
+            ).encode()
+        ).hexdigest()
+        validators = (quote_etag(tag[:40]), int(last_modified))
+
+        if cache is not None and not replication_pending(self.cache_dependencies):
+            cache.set(
+                key, validators, getattr(settings, "BOOKS_RESPONSE_CACHE_TIMEOUT", 300)
+            )
+        return validators
+
+    def conditional_response(self, handler, request, *args, **kwargs):
+        validators = self.get_validators(request)
+        if validators is None:
+            return handler(request, *args, **kwargs)
+
+        response = self.get_not_modified(request, validators)
+        if response is None:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+        return self.add_validators(response, validators)
+
+    async def aconditional_response(self, handler, request, *args, **kwargs):
+        # The validators are cache reads plus one aggregate; computing them in
+        # a single thread hop is cheaper than awaiting each step.
+        validators = await sync_to_async(self.get_validators)(request)
+        if validators is None:
+            return await handler(request, *args, **kwargs)
+
+        response = self.get_not_modified(request, validators)
+        if response is None:
+            response = await handler(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+        return self.add_validators(response, validators)
+
+    def get_not_modified(self, request, validators):
+        """Return the 304 (or 412) answering a conditional request, if any."""
+        etag, last_modified = validators
+        return get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+    def add_validators(self, response, validators):
+        etag, last_modified = validators
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
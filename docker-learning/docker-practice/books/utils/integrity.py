@@ -0,0 +1,63 @@
+"""
+Report unique constraint violations as validation errors.
+
+Uniqueness is enforced by the database constraints of the models alone:
+checking first with a query costs a round trip and still lets two
+concurrent requests through. A write runs in ``unique_violations(Model)``
+instead, which turns the IntegrityError of one of the model's
+UniqueConstraints into a ValidationError on the constrained field, with the
+constraint's violation message.
+"""
+
+from contextlib import contextmanager
+
+from django.db import IntegrityError
+from django.db.models import F, UniqueConstraint
+from rest_framework.exceptions import ValidationError
+
+
+def constraint_field(constraint):
+    """Return the field a unique constraint is reported on."""
+    if constraint.fields:
+        return constraint.fields[0]
+    expression = constraint.expressions[0]
+    while not isinstance(expression, F):
+        expression = expression.get_source_expressions()[0]
+    return expression.name
+
+
+def violated_constraint(model, error):
+    """Return the UniqueConstraint of model that error reports, if any."""
+    message = str(error)
+    for constraint in model._meta.constraints:
+        if not isinstance(constraint, UniqueConstraint):
+            continue
+        # PostgreSQL names the constraint; SQLite names the columns of a
+        # table constraint and the index of an expression one.
+        columns = [
+            f"{model._meta.db_table}.{model._meta.get_field(name).column}"
+            for name in constraint.fields
+        ]
+        if f'"{constraint.name}"' in message or f"'{constraint.name}'" in message:
+            return constraint
+        if columns and all(column in message for column in columns):
+            return constraint
+    return None
+
+
+@contextmanager
+def unique_violations(model):
+    """
+    Raise a ValidationError for the unique constraint of model violated by
+    the block. Use inside the transaction of the write, which the error then
+    rolls back.
+    """
+    try:
+        yield
+    except IntegrityError as err:
+        constraint = violated_constraint(model, err)
+        if constraint is None:
+            raise
+        raise ValidationError(
+            {constraint_field(constraint): constraint.get_violation_error_message()}
+        ) from err
@@ -0,0 +1,347 @@
+"""
+Pagination classes for the books API.
+
+CatalogPagination keeps the page-number behaviour by default and switches to
+keyset (cursor) pagination when the client asks for it with
+``?pagination=cursor`` or follows a ``cursor`` link. Keyset pages filter on
+the last row of the previous page instead of using OFFSET and never run a
+COUNT, so fetching page 10 000 costs the same as fetching page 1.
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from functools import partial
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import InvalidPage
+from django.core.paginator import Paginator as DjangoPaginator
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from books.utils.async_views import afetch_all
+
+
+def _encode_value(value):
+    """Convert an ordering value to something JSON can carry."""
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _row_value(row, name):
+    """Read an ordering value from a model instance or a values() dict."""
+    if isinstance(row, dict):
+        return row[name]
+    return getattr(row, name)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset pagination over the queryset ordering plus an ``id`` tie-breaker.
+
+    The default ordering ``-created_at`` pages on ``(created_at, id)``; any
+    other ordering applied by OrderingFilter works the same way. Cursors are
+    opaque base64 tokens carrying the ordering and the boundary row values.
+    """
+
+    cursor_query_param = "cursor"
+    cursor_query_description = "The pagination cursor value."
+    page_size = api_settings.PAGE_SIZE
+    tie_breaker = "id"
+    invalid_cursor_message = "Invalid cursor"
+
+    def get_window(self, queryset, request):
+        """
+        Return the unevaluated ``page_size + 1`` rows the page is cut from.
+        """
+        self.request = request
+        self.ordering = self.get_ordering(queryset)
+        self.model = queryset.model
+
+        self.cursor = self.decode_cursor(request)
+        self.reverse = bool(self.cursor and self.cursor["previous"])
+
+        if self.cursor is not None:
+            queryset = queryset.filter(
+                self.build_boundary_filter(self.cursor["values"], self.reverse)
+            )
+        queryset = queryset.order_by(
+            *(
+                self._order_term(name, descending != self.reverse)
+                for name, descending in self.ordering
+            )
+        )
+        return queryset[: self.page_size + 1]
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.cut_page(list(self.get_window(queryset, request)))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        window = self.get_window(queryset, request)
+        return self.cut_page(await afetch_all(window))
+
+    def cut_page(self, rows):
+        """Turn the fetched window into the page and its link flags."""
+        cursor, reverse = self.cursor, self.reverse
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+
+        if reverse:
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": self.cursor_query_description,
+                "schema": {"type": "string"},
+            }
+        ]
+
+    def get_ordering(self, queryset):
+        """
+        Return the ordering as (field, descending) pairs ending with the
+        tie-breaker, so every position in the result set is unique.
+        """
+        terms = list(queryset.query.order_by) or list(queryset.model._meta.ordering)
+        ordering = []
+        for term in terms:
+            if not isinstance(term, str):
+                raise NotFound("Cursor pagination requires field based ordering.")
+            name = term.lstrip("-")
+            if name == "pk":
+                name = self.tie_breaker
+            ordering.append((name, term.startswith("-")))
+
+        if self.tie_breaker not in (name for name, _ in ordering):
+            descending = ordering[0][1] if ordering else False
+            ordering.append((self.tie_breaker, descending))
+        return ordering
+
+    def build_boundary_filter(self, values, reverse):
+        """
+        Build the lexicographic "after this row" condition.
+
+        For ``(created_at DESC, id DESC)`` this is
+        ``created_at <= v1 AND (created_at < v1 OR (created_at = v1 AND id < v2))``;
+        the leading non-strict bound lets the database seek the index.
+        """
+        condition = Q()
+        equal = Q()
+        for (name, descending), value in zip(self.ordering, values, strict=True):
+            lookup = "lt" if descending != reverse else "gt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+
+        first_name, first_descending = self.ordering[0]
+        first_lookup = "lte" if first_descending != reverse else "gte"
+        return Q(**{f"{first_name}__{first_lookup}": values[0]}) & condition
+
+    def encode_cursor(self, row, previous):
+        """Build an opaque cursor positioned on the given row."""
+        payload = {
+            "o": self._ordering_signature(),
+            "v": [_encode_value(_row_value(row, name)) for name, _ in self.ordering],
+            "p": int(previous),
+        }
+        encoded = base64.urlsafe_b64encode(
+            json.dumps(payload, separators=(",", ":")).encode()
+        ).decode()
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, PageNumberPagination.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request):
+        """Return the decoded cursor, None for the first page."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            values = [
+                self._to_python(name, value)
+                for (name, _), value in zip(self.ordering, payload["v"], strict=True)
+            ]
+            if payload["o"] != self._ordering_signature():
+                raise ValueError("Cursor was issued for a different ordering.")
+        except (
+            TypeError,
+            KeyError,
+            ValueError,
+            ValidationError,
+            binascii.Error,
+        ) as err:
+            raise NotFound(self.invalid_cursor_message) from err
+
+        return {"values": values, "previous": bool(payload.get("p"))}
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], previous=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], previous=True)
+
+    def _ordering_signature(self):
+        return [
+            ("-" if descending else "") + name for name, descending in self.ordering
+        ]
+
+    def _order_term(self, name, descending):
+        return f"-{name}" if descending else name
+
+    def _to_python(self, name, value):
+        """Convert a cursor value back using the model field when there is one."""
+        try:
+            field = self.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return value
+        return field.to_python(value)
+
+
+class CountedPaginator(DjangoPaginator):
+    """
+    Django paginator that can be given an already known row count.
+    """
+
+    def __init__(self, object_list, per_page, count=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        if count is not None:
+            # Paginator.count is a cached_property; seed it.
+            self.__dict__["count"] = count
+
+
+class CatalogPagination(PageNumberPagination):
+    """
+    Page-number pagination with an opt-in keyset mode.
+
+    ``?pagination=cursor`` (or any request carrying a ``cursor``) is served by
+    KeysetPagination; every other request keeps the existing
+    ``count``/``next``/``previous``/``results`` page-number response.
+    """
+
+    mode_query_param = "pagination"
+    mode_query_description = (
+        "Set to 'cursor' for keyset pagination (no count, constant-time deep pages)."
+    )
+    keyset_class = KeysetPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.use_keyset(request):
+            self.keyset = self.keyset_class()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        self.keyset = None
+        # Views that already counted the filtered queryset (conditional GET
+        # validators) expose it as ``filtered_count``; skip the COUNT query.
+        count = getattr(view, "filtered_count", None)
+        self.django_paginator_class = partial(CountedPaginator, count=count)
+        return super().paginate_queryset(queryset, request, view)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        Async variant of paginate_queryset: the COUNT (unless the view knows
+        it) and the page rows are fetched with the async ORM.
+        """
+        if self.use_keyset(request):
+            self.keyset = self.keyset_class()
+            return await self.keyset.apaginate_queryset(queryset, request, view)
+        self.keyset = None
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        count = getattr(view, "filtered_count", None)
+        if count is None:
+            count = await queryset.acount()
+        # With the count known, Paginator.page() only slices the queryset.
+        paginator = CountedPaginator(queryset, page_size, count=count)
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            msg = self.invalid_page_message.format(
+                page_number=page_number, message=str(exc)
+            )
+            raise NotFound(msg) from exc
+        self.page.object_list = await afetch_all(self.page.object_list)
+
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+        return list(self.page)
+
+    def get_validator_queryset(self, queryset, request):
+        """
+        Return the rows a page depends on: the keyset window in cursor mode
+        (bounded by the page size), the whole queryset otherwise.
+        """
+        if self.use_keyset(request):
+            return self.keyset_class().get_window(queryset, request)
+        return queryset
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                "name": self.mode_query_param,
+                "required": False,
+                "in": "query",
+                "description": self.mode_query_description,
+                "schema": {"type": "string", "enum": ["page", "cursor"]},
+            },
+            *self.keyset_class().get_schema_operation_parameters(view),
+        ]
+
+    def use_keyset(self, request):
+        """Return True when the request opted in to keyset pagination."""
+        params = request.query_params
+        return (
+            params.get(self.mode_query_param) == "cursor"
+            or self.keyset_class.cursor_query_param in params
+        )
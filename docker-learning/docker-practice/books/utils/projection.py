@@ -0,0 +1,42 @@
+"""
+List action served from a values() projection instead of model serializers.
+"""
+
+from rest_framework.response import Response
+
+from books.utils.async_views import afetch_all
+
+
+class ProjectedListMixin:
+    """
+    Serve ``list`` through ``list_projection`` (a
+    ``books.serializers.projections.Projection``) when the viewset sets one.
+
+    Filtering, ordering and pagination are unchanged; only the rows are
+    fetched with ``values()`` and turned into dicts by the projection.
+    """
+
+    list_projection = None
+
+    def list(self, request, *args, **kwargs):
+        projection = self.list_projection
+        if projection is None:
+            return super().list(request, *args, **kwargs)
+
+        rows = projection.values(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(projection.represent(page))
+        return Response(projection.represent(rows))
+
+    async def alist(self, request, *args, **kwargs):
+        projection = self.list_projection
+        if projection is None:
+            return await super().alist(request, *args, **kwargs)
+
+        queryset = await self.afilter_queryset(self.get_queryset())
+        rows = projection.values(queryset)
+        page = await self.apaginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(projection.represent(page))
+        return Response(projection.represent(await afetch_all(rows)))
@@ -0,0 +1,297 @@
+"""
+Versioned response cache for the catalog viewsets.
+
+Every cached response is keyed on the request (path, normalized query string,
+host) and on the current version of each model the response reads. The
+service write methods bump those versions once their transaction commits, so
+a write makes every dependent cache entry unreachable at once instead of
+deleting keys one by one; stale entries simply expire.
+
+With read replicas, a response read from a replica shortly after a write
+may predate it while being keyed on the version the write bumped. Requests
+pinned to the primary therefore bypass the cache, and nothing is stored
+while a write to the models it reads may still be replicating.
+
+The versions live in the cache, so it must be one every worker process
+shares (Redis, Memcached...): with a local-memory cache a write would only
+invalidate the responses of the process that served it, and the response
+cache stays off.
+
+Versions start from the current time in nanoseconds rather than 1, so a
+counter evicted from the cache never restarts at a value whose entries may
+still be cached. Each bump also records the wall-clock time of the write,
+which conditional GETs use as a lower bound for ``Last-Modified``.
+"""
+
+import functools
+import hashlib
+import logging
+import time
+from urllib.parse import urlencode
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from rest_framework import status
+from rest_framework.response import Response
+
+from core_commons.metrics import RESPONSE_CACHE_LOOKUPS
+from core_commons.replicas import get_replicas, is_pinned
+
+VERSION_KEY = "books:version:{}"
+MODIFIED_KEY = "books:modified:{}"
+STATS_KEY = "books:response-cache:{}:{}"
+RESPONSE_KEY = "books:response:{}"
+
+logger = logging.getLogger(__name__)
+
+
+def get_response_cache():
+    """Return the cache backend holding versions and responses."""
+    return caches[getattr(settings, "BOOKS_RESPONSE_CACHE_ALIAS", "default")]
+
+
+def response_cache_shared():
+    """
+    Return True when every process serving the API reads the same cache.
+    A local-memory cache is private to its process: a write would bump the
+    versions of one worker only while the others kept serving stale
+    entries. BOOKS_RESPONSE_CACHE_SHARED overrides the guess.
+    """
+    shared = getattr(settings, "BOOKS_RESPONSE_CACHE_SHARED", None)
+    if shared is None:
+        shared = not isinstance(get_response_cache(), LocMemCache | DummyCache)
+    return shared
+
+
+@functools.cache
+def _log_refusal(alias):
+    logger.warning(
+        "The response cache is off: cache alias %r is local to each process. "
+        "Point it at a shared backend such as Redis.",
+        alias,
+    )
+
+
+def response_cache_enabled():
+    """
+    Return True when BOOKS_RESPONSE_CACHE_ENABLED is set and the cache is
+    shared by every process; a per-process cache is refused with a warning.
+    """
+    if not getattr(settings, "BOOKS_RESPONSE_CACHE_ENABLED", True):
+        return False
+    if not response_cache_shared():
+        _log_refusal(getattr(settings, "BOOKS_RESPONSE_CACHE_ALIAS", "default"))
+        return False
+    return True
+
+
+def response_cache_bypassed():
+    """
+    Return True when the current request must neither read nor fill the
+    cache: it is pinned to the primary to read its own writes, which an
+    entry filled from a lagging replica may not show.
+    """
+    return is_pinned()
+
+
+def replication_pending(names):
+    """
+    Return True while a write to the named models may not have reached the
+    replicas yet, i.e. within DATABASE_REPLICA_PIN_SECONDS of it.
+    """
+    if not get_replicas():
+        return False
+    lag = getattr(settings, "DATABASE_REPLICA_PIN_SECONDS", 5)
+    return get_last_write(names) > time.time() - lag
+
+
+def get_versions(names):
+    """Return the current version of every named model, creating missing ones."""
+    cache = get_response_cache()
+    keys = {name: VERSION_KEY.format(name) for name in names}
+    stored = cache.get_many(keys.values())
+    versions = {}
+    for name, key in keys.items():
+        version = stored.get(key)
+        if version is None:
+            cache.add(key, time.time_ns(), timeout=None)
+            version = cache.get(key)
+        versions[name] = version
+    return versions
+
+
+def get_last_write(names):
+    """
+    Return the time (epoch seconds) of the latest write to the named models.
+    Unknown times default to now, which only costs clients a full response.
+    """
+    cache = get_response_cache()
+    keys = [MODIFIED_KEY.format(name) for name in names]
+    stored = cache.get_many(keys)
+    now = time.time()
+    for key in keys:
+        if key not in stored:
+            cache.add(key, now, timeout=None)
+            stored[key] = cache.get(key, now)
+    return max(stored.values(), default=0.0)
+
+
+def _bump(names):
+    cache = get_response_cache()
+    now = time.time()
+    for name in names:
+        key = VERSION_KEY.format(name)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns(), timeout=None)
+        cache.set(MODIFIED_KEY.format(name), now, timeout=None)
+
+
+def bump_versions(*names):
+    """
+    Invalidate every cached response reading the named models once the
+    current transaction commits (immediately outside a transaction).
+    """
+    transaction.on_commit(lambda: _bump(names))
+
+
+def normalize_query(query_params):
+    """Return a canonical query string: sorted keys, sorted values."""
+    return urlencode(
+        sorted(
+            (key, value) for key in query_params for value in query_params.getlist(key)
+        )
+    )
+
+
+def record(basename, outcome):
+    """Count a cache hit or miss for a viewset."""
+    RESPONSE_CACHE_LOOKUPS.labels(basename, outcome).inc()
+    cache = get_response_cache()
+    key = STATS_KEY.format(basename, outcome)
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def get_cache_stats(basenames):
+    """Return {basename: {"hits", "misses", "hit_ratio"}} for the viewsets."""
+    cache = get_response_cache()
+    keys = {
+        (basename, outcome): STATS_KEY.format(basename, outcome)
+        for basename in basenames
+        for outcome in ("hits", "misses")
+    }
+    stored = cache.get_many(keys.values())
+    stats = {}
+    for basename in basenames:
+        hits = stored.get(keys[basename, "hits"], 0)
+        misses = stored.get(keys[basename, "misses"], 0)
+        total = hits + misses
+        stats[basename] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / total, 4) if total else None,
+        }
+    return stats
+
+
+def request_digest(view, request):
+    """
+    Hash a request together with the versions of the models the view reads
+    (``view.cache_dependencies``).
+    """
+    versions = get_versions(view.cache_dependencies)
+    parts = [
+        view.basename,
+        view.action,
+        request.scheme,
+        request.get_host(),
+        request.path,
+        normalize_query(request.query_params),
+        *(f"{name}={version}" for name, version in sorted(versions.items())),
+    ]
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+class CachedResponseMixin:
+    """
+    Cache the data of successful ``list`` and ``retrieve`` responses.
+
+    Viewsets declare the models their responses read in
+    ``cache_dependencies``; the versions of those models are read before the
+    queryset runs, so a response computed from pre-write rows can only be
+    stored under a version the write has already superseded. Requests pinned
+    to the primary skip the cache. Responses carry an ``X-Cache: HIT``/``MISS``
+    header.
+    """
+
+    cache_dependencies = ()
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
+
+    async def alist(self, request, *args, **kwargs):
+        return await self.acached_response(super().alist, request, *args, **kwargs)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        return await self.acached_response(super().aretrieve, request, *args, **kwargs)
+
+    def get_response_cache_key(self, request):
+        return RESPONSE_KEY.format(request_digest(self, request))
+
+    def cached_response(self, handler, request, *args, **kwargs):
+        if not response_cache_enabled() or response_cache_bypassed():
+            return handler(request, *args, **kwargs)
+
+        key, response = self.lookup_response(request)
+        if response is not None:
+            return response
+        return self.store_response(key, handler(request, *args, **kwargs))
+
+    async def acached_response(self, handler, request, *args, **kwargs):
+        # The cache backends are synchronous; each step is one thread hop.
+        if not response_cache_enabled() or response_cache_bypassed():
+            return await handler(request, *args, **kwargs)
+
+        key, response = await sync_to_async(self.lookup_response)(request)
+        if response is not None:
+            return response
+        response = await handler(request, *args, **kwargs)
+        return await sync_to_async(self.store_response)(key, response)
+
+    def lookup_response(self, request):
+        """Return the cache key of the request and its cached response, if any."""
+        key = self.get_response_cache_key(request)
+        data = get_response_cache().get(key)
+        if data is not None:
+            record(self.basename, "hits")
+            return key, Response(data, headers={"X-Cache": "HIT"})
+        record(self.basename, "misses")
+        return key, None
+
+    def store_response(self, key, response):
+        """
+        Cache the data of a successful response under key, unless it may
+        have been read from a replica that lags a recent write.
+        """
+        if response.status_code == status.HTTP_200_OK and not replication_pending(
+            self.cache_dependencies
+        ):
+            get_response_cache().set(
+                key,
+                response.data,
+                getattr(settings, "BOOKS_RESPONSE_CACHE_TIMEOUT", 300),
+            )
+        response["X-Cache"] = "MISS"
+        return response
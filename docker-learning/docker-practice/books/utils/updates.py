@@ -0,0 +1,33 @@
+"""
+Write only the columns an update changes.
+
+A plain ``save()`` rewrites every column of the row, including values the
+request never touched and the denormalized counters another transaction may
+have moved since the row was read. The update services set the values that
+differ with ``apply_changes`` and write just those with ``save_changes``; an
+update that changes nothing costs no write at all.
+"""
+
+
+def apply_changes(instance, data):
+    """
+    Set the values of data that differ from instance and return the names
+    of the fields that changed, in data order.
+    """
+    changed = []
+    for field, value in data.items():
+        if getattr(instance, field) != value:
+            setattr(instance, field, value)
+            changed.append(field)
+    return changed
+
+
+def save_changes(instance, fields):
+    """
+    Save the given fields of instance, with its updated_at timestamp.
+    Return whether anything was written.
+    """
+    if not fields:
+        return False
+    instance.save(update_fields=[*fields, "updated_at"])
+    return True
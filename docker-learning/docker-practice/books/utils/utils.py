@@ -8,6 +8,8 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import exception_handler
 
+from core_commons.metrics import record_error
+
 
 def custom_exception_handler(exc, context):
     """
@@ -28,32 +30,49 @@ def custom_exception_handler(exc, context):
             custom_response["errors"] = format_validation_errors(exc.detail)
 
         response.data = custom_response
+        record_error(context["request"], custom_response["error_code"])
 
     return response
 
 
-def format_validation_errors(errors):
+def format_validation_errors(errors, prefix=""):
     """
     Format validation errors consistently.
+    Nested errors (bulk payloads) are flattened into paths such as
+    "books[3].isbn".
     """
     formatted = []
     for field, messages in errors.items():
-        if isinstance(messages, list):
-            for message in messages:
+        path = _error_path(prefix, field)
+        if isinstance(messages, dict):
+            formatted.extend(format_validation_errors(messages, path))
+        elif isinstance(messages, list):
+            for index, message in enumerate(messages):
+                if isinstance(message, dict):
+                    formatted.extend(
+                        format_validation_errors(message, f"{path}[{index}]")
+                    )
+                    continue
                 formatted.append(
                     {
-                        "field": field,
+                        "field": path,
                         "message": str(message),
                         "code": getattr(message, "code", "invalid"),
                     }
                 )
         else:
             formatted.append(
-                {"field": field, "message": str(messages), "code": "invalid"}
+                {"field": path, "message": str(messages), "code": "invalid"}
             )
     return formatted
 
 
+def _error_path(prefix, field):
+    if isinstance(field, int):
+        return f"{prefix}[{field}]"
+    return f"{prefix}.{field}" if prefix else field
+
+
 def get_error_message(status_code, exc):
     """
     Get appropriate error message based on status code.
@@ -9,40 +9,64 @@ from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from books.search.filters import FullTextSearchFilter
 from books.serializers.author_request_serializers import (
     AuthorCreateRequestSerializer,
     AuthorUpdateRequestSerializer,
 )
 from books.serializers.author_response_serializers import (
     AuthorDetailResponseSerializer,
+    AuthorListProjection,
     AuthorListResponseSerializer,
 )
 from books.serializers.book_response_serializers import BookListResponseSerializer
 from books.services.author_services import AuthorService
-from books.utils import success_response
+from books.utils import (
+    AsyncReadMixin,
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    ProjectedListMixin,
+    success_response,
+)
+from core_commons.query_budget import query_budget
 from core_commons.response_mixins import ServiceAndUserAuthenticationMixin
 
 
-class AuthorViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
+class AuthorViewSet(
+    ConditionalGetMixin,
+    CachedResponseMixin,
+    ProjectedListMixin,
+    ServiceAndUserAuthenticationMixin,
+    AsyncReadMixin,
+    viewsets.ModelViewSet,
+):
     """
     API endpoint for managing authors.
     Uses proper request/response serializer separation.
     """
 
     lookup_field = "id"
+    cache_dependencies = ("authors", "books")
+    list_projection = AuthorListProjection()
     permission_classes = [IsAuthenticated]
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
         filters.OrderingFilter,
+        FullTextSearchFilter,
     ]
+    filterset_fields = {"book_count": ["exact", "gte", "lte"]}
     search_fields = ["name", "email"]
-    ordering_fields = ["name", "email", "created_at"]
+    fuzzy_search_field = "name"
+    ordering_fields = ["name", "email", "book_count", "created_at"]
     ordering = ["-created_at"]
 
     def get_queryset(self):
         """Get queryset using service layer."""
-        return AuthorService.get_all_authors()
+        queryset = AuthorService.get_all_authors()
+        if self.action == "retrieve":
+            # The detail lists the books; fetch them with the author.
+            queryset = queryset.prefetch_related("books")
+        return queryset
 
     def get_serializer_class(self):
         """
@@ -75,6 +99,10 @@ class AuthorViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         ],
         responses={200: AuthorListResponseSerializer(many=True)},
     )
+    # The validators aggregate and the page. A fuzzy search adds its
+    # threshold and matches on PostgreSQL (in a savepoint within an outer
+    # transaction: 4) or the first load of the in-process index (2).
+    @query_budget(6)
     def list(self, request, *args, **kwargs):
         """Return a list of all authors with basic information."""
         # Let DRF handle pagination automatically
@@ -85,6 +113,7 @@ class AuthorViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         description="Returns detailed information about a specific author including their books.",
         responses={200: AuthorDetailResponseSerializer},
     )
+    @query_budget(3)
     def retrieve(self, request, *args, **kwargs):
         """Return detailed information about a specific author."""
         return super().retrieve(request, *args, **kwargs)
@@ -95,6 +124,7 @@ class AuthorViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         request=AuthorCreateRequestSerializer,
         responses={201: AuthorDetailResponseSerializer},
     )
+    @query_budget(6)
     def create(self, request, *args, **kwargs):
         """Create a new author using service layer."""
         # Use request serializer for validation
@@ -121,6 +151,7 @@ class AuthorViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         request=AuthorUpdateRequestSerializer,
         responses={200: AuthorDetailResponseSerializer},
     )
+    @query_budget(5)
     def update(self, request, *args, **kwargs):
         """Update an author using service layer."""
         partial = kwargs.pop("partial", False)
@@ -149,6 +180,7 @@ class AuthorViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         request=AuthorUpdateRequestSerializer,
         responses={200: AuthorDetailResponseSerializer},
     )
+    @query_budget(5)
     def partial_update(self, request, *args, **kwargs):
         """Partially update an author using service layer."""
         kwargs["partial"] = True
@@ -159,6 +191,7 @@ class AuthorViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         description="Deletes an existing author.",
         responses={204: None},
     )
+    @query_budget(5)
     def destroy(self, request, *args, **kwargs):
         """Delete an author using service layer."""
         AuthorService.delete_author(self.kwargs["id"])
@@ -198,27 +231,35 @@ class AuthorViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         ],
     )
     @action(detail=True, methods=["get"])
+    @query_budget(2)
     def books(self, request, id=None):
         """
         Get all books by a specific author.
         """
         try:
             books = AuthorService.get_author_books(id)
-            serializer = BookListResponseSerializer(
-                books, many=True, context={"request": request}
-            )
+        except Exception as e:
+            return self.error_response(e)
+        return self.books_response(request, books)
 
-            return success_response(
-                data=serializer.data, message="Author books retrieved successfully"
-            )
+    async def abooks(self, request, id=None):
+        """
+        Async variant of books.
+        """
+        try:
+            books = await AuthorService.aget_author_books(id)
         except Exception as e:
-            if "not found" in str(e).lower():
-                return Response(
-                    {"error": "Author not found"}, status=status.HTTP_404_NOT_FOUND
-                )
-            return Response(
-                {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+            return self.error_response(e)
+        return self.books_response(request, books)
+
+    def books_response(self, request, books):
+        """Serialize the books of an author (books and abooks)."""
+        serializer = BookListResponseSerializer(
+            books, many=True, context={"request": request}
+        )
+        return success_response(
+            data=serializer.data, message="Author books retrieved successfully"
+        )
 
     @extend_schema(
         summary="Get author statistics",
@@ -249,21 +290,42 @@ class AuthorViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         ],
     )
     @action(detail=True, methods=["get"])
+    @query_budget(1)
     def statistics(self, request, id=None):
         """
         Get statistics for an author.
         """
         try:
             stats = AuthorService.get_author_statistics(id)
+        except Exception as e:
+            return self.error_response(e)
+        return self.statistics_response(stats)
 
-            return success_response(
-                data=stats, message="Author statistics retrieved successfully"
-            )
+    async def astatistics(self, request, id=None):
+        """
+        Async variant of statistics.
+        """
+        try:
+            stats = await AuthorService.aget_author_statistics(id)
         except Exception as e:
-            if "not found" in str(e).lower():
-                return Response(
-                    {"error": "Author not found"}, status=status.HTTP_404_NOT_FOUND
-                )
+            return self.error_response(e)
+        return self.statistics_response(stats)
+
+    def statistics_response(self, stats):
+        """Wrap the statistics of an author (statistics and astatistics)."""
+        return success_response(
+            data=stats, message="Author statistics retrieved successfully"
+        )
+
+    def error_response(self, exc):
+        """
+        Map an error of the books and statistics actions, sync or async, to
+        a 404 for a missing author and a 500 otherwise.
+        """
+        if "not found" in str(exc).lower():
             return Response(
-                {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                {"error": "Author not found"}, status=status.HTTP_404_NOT_FOUND
             )
+        return Response(
+            {"error": str(exc)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
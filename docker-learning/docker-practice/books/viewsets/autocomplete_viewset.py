@@ -0,0 +1,63 @@
+"""
+Views for type-ahead suggestions.
+"""
+
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import viewsets
+from rest_framework.permissions import IsAuthenticated
+
+from books.serializers.autocomplete_request_serializers import (
+    AutocompleteRequestSerializer,
+)
+from books.serializers.autocomplete_response_serializers import (
+    AutocompleteResponseSerializer,
+)
+from books.services.autocomplete_services import AutocompleteService
+from books.utils import success_response
+from core_commons.query_budget import query_budget
+from core_commons.response_mixins import ServiceAndUserAuthenticationMixin
+
+
+class AutocompleteViewSet(ServiceAndUserAuthenticationMixin, viewsets.ViewSet):
+    """
+    API endpoint for prefix suggestions on book titles, author names and
+    category names.
+
+    Unlike ``?search=`` on the list endpoints it skips the model serializers,
+    pagination and the database: suggestions come from in-process prefix
+    indexes.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="Autocomplete titles and names",
+        description=(
+            "Returns up to `limit` suggestions per type whose words start with `q`."
+        ),
+        parameters=[
+            OpenApiParameter(name="q", type=str, required=True, description="Prefix"),
+            OpenApiParameter(
+                name="types",
+                type=str,
+                description="Comma separated: books, authors, categories (default all)",
+            ),
+            OpenApiParameter(
+                name="limit", type=int, description="Suggestions per type (1-25)"
+            ),
+        ],
+        responses={200: AutocompleteResponseSerializer},
+    )
+    # Includes loading the three prefix indexes on the first request.
+    @query_budget(6)
+    def list(self, request):
+        """Return the suggestions for a prefix."""
+        serializer = AutocompleteRequestSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        suggestions = AutocompleteService.suggest(
+            serializer.validated_data["q"],
+            serializer.validated_data["types"],
+            serializer.validated_data["limit"],
+        )
+        return success_response(data=suggestions)
@@ -2,41 +2,67 @@
 Views for the books app using proper serializer separation.
 """
 
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
 from django_filters.rest_framework import DjangoFilterBackend
-from drf_spectacular.utils import OpenApiParameter, extend_schema
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
 from rest_framework import filters, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from books.search.filters import FullTextSearchFilter
 from books.serializers.book_request_serializers import (
+    BookBulkCreateRequestSerializer,
     BookCreateRequestSerializer,
+    BookExportRequestSerializer,
     BookUpdateRequestSerializer,
 )
 from books.serializers.book_response_serializers import (
+    BookBulkCreateResponseSerializer,
     BookDetailResponseSerializer,
+    BookListProjection,
     BookListResponseSerializer,
 )
+from books.services.book_export_services import EXPORT_FORMATS, BookExportService
 from books.services.book_services import BookService
-from books.utils import success_response
+from books.utils import (
+    AsyncReadMixin,
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    ProjectedListMixin,
+    success_response,
+)
+from core_commons.query_budget import query_budget
 from core_commons.response_mixins import ServiceAndUserAuthenticationMixin
 
 
-class BookViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
+class BookViewSet(
+    ConditionalGetMixin,
+    CachedResponseMixin,
+    ProjectedListMixin,
+    ServiceAndUserAuthenticationMixin,
+    AsyncReadMixin,
+    viewsets.ModelViewSet,
+):
     """
     API endpoint for managing books.
     Uses proper request/response serializer separation.
     """
 
     lookup_field = "id"
+    cache_dependencies = ("books", "authors", "categories")
+    list_projection = BookListProjection()
     permission_classes = [IsAuthenticated]
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
         filters.OrderingFilter,
+        FullTextSearchFilter,
     ]
     filterset_fields = ["author", "categories"]
     search_fields = ["title", "isbn", "author__name"]
+    fuzzy_search_field = "title"
     ordering_fields = ["title", "price", "created_at"]
     ordering = ["-created_at"]
 
@@ -83,6 +109,10 @@ class BookViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         ],
         responses={200: BookListResponseSerializer(many=True)},
     )
+    # The validators aggregate and the page. A fuzzy search adds its
+    # threshold and matches on PostgreSQL (in a savepoint within an outer
+    # transaction: 4) or the first load of the in-process index (2).
+    @query_budget(6)
     def list(self, request, *args, **kwargs):
         """Return a list of all books with basic information."""
         # Let DRF handle pagination automatically
@@ -93,6 +123,7 @@ class BookViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         description="Returns detailed information about a specific book including author and categories.",
         responses={200: BookDetailResponseSerializer},
     )
+    @query_budget(3)
     def retrieve(self, request, *args, **kwargs):
         """Return detailed information about a specific book."""
         return super().retrieve(request, *args, **kwargs)
@@ -103,6 +134,7 @@ class BookViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         request=BookCreateRequestSerializer,
         responses={201: BookDetailResponseSerializer},
     )
+    @query_budget(11)
     def create(self, request, *args, **kwargs):
         """Create a new book using service layer."""
         # Use request serializer for validation
@@ -123,12 +155,82 @@ class BookViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
             status_code=status.HTTP_201_CREATED,
         )
 
+    @extend_schema(
+        summary="Create books in bulk",
+        description=(
+            "Creates up to BOOKS_BULK_CREATE_MAX_ITEMS books in one transaction. "
+            "Nothing is created if any book is invalid; errors are reported "
+            "per item as books[<index>].<field>."
+        ),
+        request=BookBulkCreateRequestSerializer,
+        responses={201: BookBulkCreateResponseSerializer},
+    )
+    @action(detail=False, methods=["post"], url_path="bulk")
+    # Inserts and IN lookups are split by the backend's parameter limit.
+    @query_budget(30)
+    def bulk_create(self, request):
+        """Create many books using service layer."""
+        serializer = BookBulkCreateRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        books = BookService.bulk_create_books(serializer.validated_data["books"])
+
+        response_serializer = BookBulkCreateResponseSerializer(
+            {"created": len(books), "books": books}
+        )
+        return success_response(
+            data=response_serializer.data,
+            message="Books created successfully",
+            status_code=status.HTTP_201_CREATED,
+        )
+
+    @extend_schema(
+        summary="Export every book",
+        description=(
+            "Streams the whole catalog in id order, one row per book with its "
+            "author and category ids, as NDJSON (default) or CSV. Use this "
+            "instead of paging through the list endpoint to mirror the catalog."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="export_format",
+                type=str,
+                enum=tuple(EXPORT_FORMATS),
+                description="ndjson (default) or csv",
+            ),
+        ],
+        responses={
+            (200, content_type): OpenApiResponse(response=OpenApiTypes.STR)
+            for content_type, _ in EXPORT_FORMATS.values()
+        },
+    )
+    @action(detail=False, methods=["get"])
+    # Rows are streamed after the response leaves the middleware.
+    @query_budget(2)
+    def export(self, request):
+        """Stream every book as NDJSON or CSV."""
+        serializer = BookExportRequestSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        export_format = serializer.validated_data["export_format"]
+
+        content_type, extension = EXPORT_FORMATS[export_format]
+        # Each server reads its own kind of iterator chunk by chunk; given
+        # the other kind it would read the whole export into memory first.
+        if isinstance(request._request, ASGIRequest):
+            content = BookExportService.astream(export_format)
+        else:
+            content = BookExportService.stream(export_format)
+        response = StreamingHttpResponse(content, content_type=content_type)
+        response["Content-Disposition"] = f'attachment; filename="books.{extension}"'
+        return response
+
     @extend_schema(
         summary="Update a book",
         description="Updates all fields of an existing book.",
         request=BookUpdateRequestSerializer,
         responses={200: BookDetailResponseSerializer},
     )
+    @query_budget(13)
     def update(self, request, *args, **kwargs):
         """Update a book using service layer."""
         partial = kwargs.pop("partial", False)
@@ -155,6 +257,7 @@ class BookViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         request=BookUpdateRequestSerializer,
         responses={200: BookDetailResponseSerializer},
     )
+    @query_budget(13)
     def partial_update(self, request, *args, **kwargs):
         """Partially update a book using service layer."""
         kwargs["partial"] = True
@@ -165,6 +268,7 @@ class BookViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         description="Deletes an existing book.",
         responses={204: None},
     )
+    @query_budget(7)
     def destroy(self, request, *args, **kwargs):
         """Delete a book using service layer."""
         BookService.delete_book(self.kwargs["id"])
@@ -192,6 +296,7 @@ class BookViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         responses={200: BookDetailResponseSerializer},
     )
     @action(detail=True, methods=["post"])
+    @query_budget(7)
     def add_category(self, request, id=None):
         """Add a category to a book."""
         category_id = request.data.get("category_id")
@@ -228,6 +333,7 @@ class BookViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         responses={200: BookDetailResponseSerializer},
     )
     @action(detail=True, methods=["post"])
+    @query_budget(6)
     def remove_category(self, request, id=None):
         """Remove a category from a book."""
         category_id = request.data.get("category_id")
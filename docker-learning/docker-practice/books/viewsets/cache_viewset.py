@@ -0,0 +1,33 @@
+"""
+Views exposing the response cache counters.
+"""
+
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from rest_framework import viewsets
+from rest_framework.permissions import IsAdminUser
+
+from books.utils import get_cache_stats, success_response
+from core_commons.query_budget import query_budget
+from core_commons.response_mixins import ServiceAndUserAuthenticationMixin
+
+# Basenames of the viewsets using CachedResponseMixin.
+CACHED_VIEWSETS = ["book", "author", "category"]
+
+
+class CacheStatsViewSet(ServiceAndUserAuthenticationMixin, viewsets.ViewSet):
+    """
+    API endpoint reporting response cache hits and misses per viewset.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        summary="Response cache statistics",
+        description="Returns hit/miss counters of the list and retrieve cache.",
+        responses={200: OpenApiTypes.OBJECT},
+    )
+    @query_budget(0)
+    def list(self, request):
+        """Return the response cache counters."""
+        return success_response(data=get_cache_stats(CACHED_VIEWSETS))
@@ -9,6 +9,7 @@ from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from books.search.filters import FullTextSearchFilter
 from books.serializers.book_response_serializers import BookListResponseSerializer
 from books.serializers.category_request_serializers import (
     CategoryCreateRequestSerializer,
@@ -16,33 +17,55 @@ from books.serializers.category_request_serializers import (
 )
 from books.serializers.category_response_serializers import (
     CategoryDetailResponseSerializer,
+    CategoryListProjection,
     CategoryListResponseSerializer,
 )
 from books.services.category_services import CategoryService
-from books.utils import success_response
+from books.utils import (
+    AsyncReadMixin,
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    ProjectedListMixin,
+    success_response,
+)
+from core_commons.query_budget import query_budget
 from core_commons.response_mixins import ServiceAndUserAuthenticationMixin
 
 
-class CategoryViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
+class CategoryViewSet(
+    ConditionalGetMixin,
+    CachedResponseMixin,
+    ProjectedListMixin,
+    ServiceAndUserAuthenticationMixin,
+    AsyncReadMixin,
+    viewsets.ModelViewSet,
+):
     """
     API endpoint for managing categories.
     Uses proper request/response serializer separation.
     """
 
     lookup_field = "id"
+    cache_dependencies = ("categories", "books")
+    list_projection = CategoryListProjection()
     permission_classes = [IsAuthenticated]
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
         filters.OrderingFilter,
+        FullTextSearchFilter,
     ]
+    filterset_fields = {"book_count": ["exact", "gte", "lte"]}
     search_fields = ["name", "description"]
-    ordering_fields = ["name", "created_at"]
+    ordering_fields = ["name", "book_count", "created_at"]
     ordering = ["-created_at"]
 
     def get_queryset(self):
         """Get queryset using service layer."""
-        return CategoryService.get_all_categories()
+        queryset = CategoryService.get_all_categories()
+        if self.action == "retrieve":
+            # The detail lists the book titles; fetch them with the category.
+            queryset = queryset.prefetch_related("books")
+        return queryset
 
     def get_serializer_class(self):
         """
@@ -75,6 +98,8 @@ class CategoryViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         ],
         responses={200: CategoryListResponseSerializer(many=True)},
     )
+    # The validators aggregate and the page (categories have no fuzzy search).
+    @query_budget(2)
     def list(self, request, *args, **kwargs):
         """Return a list of all categories with basic information."""
         # Let DRF handle pagination automatically
@@ -85,6 +110,7 @@ class CategoryViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         description="Returns detailed information about a specific category including associated books.",
         responses={200: CategoryDetailResponseSerializer},
     )
+    @query_budget(3)
     def retrieve(self, request, *args, **kwargs):
         """Return detailed information about a specific category."""
         return super().retrieve(request, *args, **kwargs)
@@ -95,6 +121,7 @@ class CategoryViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         request=CategoryCreateRequestSerializer,
         responses={201: CategoryDetailResponseSerializer},
     )
+    @query_budget(6)
     def create(self, request, *args, **kwargs):
         """Create a new category using service layer."""
         # Use request serializer for validation
@@ -121,6 +148,7 @@ class CategoryViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         request=CategoryUpdateRequestSerializer,
         responses={200: CategoryDetailResponseSerializer},
     )
+    @query_budget(5)
     def update(self, request, *args, **kwargs):
         """Update a category using service layer."""
         partial = kwargs.pop("partial", False)
@@ -149,6 +177,7 @@ class CategoryViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         request=CategoryUpdateRequestSerializer,
         responses={200: CategoryDetailResponseSerializer},
     )
+    @query_budget(5)
     def partial_update(self, request, *args, **kwargs):
         """Partially update a category using service layer."""
         kwargs["partial"] = True
@@ -159,6 +188,7 @@ class CategoryViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         description="Deletes an existing category.",
         responses={204: None},
     )
+    @query_budget(5)
     def destroy(self, request, *args, **kwargs):
         """Delete a category using service layer."""
         CategoryService.delete_category(self.kwargs["id"])
@@ -193,13 +223,22 @@ class CategoryViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         ],
     )
     @action(detail=True, methods=["get"])
+    @query_budget(2)
     def books(self, request, id=None):
         """
         Get all books in a specific category.
         """
-        books = CategoryService.get_category_books(id)
-        serializer = BookListResponseSerializer(books, many=True)
-        return Response(serializer.data)
+        return self.books_response(CategoryService.get_category_books(id))
+
+    async def abooks(self, request, id=None):
+        """
+        Async variant of books.
+        """
+        return self.books_response(await CategoryService.aget_category_books(id))
+
+    def books_response(self, books):
+        """Serialize the books of a category (books and abooks)."""
+        return Response(BookListResponseSerializer(books, many=True).data)
 
     @extend_schema(
         summary="Get category statistics",
@@ -244,6 +283,7 @@ class CategoryViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         ],
     )
     @action(detail=True, methods=["get"])
+    @query_budget(1)
     def statistics(self, request, id=None):
         """
         Get statistics for a category.
@@ -251,6 +291,13 @@ class CategoryViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         stats = CategoryService.get_category_statistics(id)
         return Response(stats)
 
+    async def astatistics(self, request, id=None):
+        """
+        Async variant of statistics.
+        """
+        stats = await CategoryService.aget_category_statistics(id)
+        return Response(stats)
+
     @extend_schema(
         summary="Get popular categories",
         description="Returns most popular categories by book count.",
@@ -285,11 +332,23 @@ class CategoryViewSet(ServiceAndUserAuthenticationMixin, viewsets.ModelViewSet):
         ],
     )
     @action(detail=False, methods=["get"])
+    @query_budget(1)
     def popular(self, request):
         """
         Get most popular categories by book count.
         """
         limit = int(request.query_params.get("limit", 10))
-        categories = CategoryService.get_popular_categories(limit)
-        serializer = CategoryListResponseSerializer(categories, many=True)
-        return Response(serializer.data)
+        return self.popular_response(CategoryService.get_popular_categories(limit))
+
+    async def apopular(self, request):
+        """
+        Async variant of popular.
+        """
+        limit = int(request.query_params.get("limit", 10))
+        return self.popular_response(
+            await CategoryService.aget_popular_categories(limit)
+        )
+
+    def popular_response(self, categories):
+        """Serialize the popular categories (popular and apopular)."""
+        return Response(CategoryListResponseSerializer(categories, many=True).data)
@@ -0,0 +1,67 @@
+"""
+Views exposing the SQL statistics of the process.
+"""
+
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAdminUser
+
+from books.serializers.query_stats_request_serializers import (
+    QueryStatsRequestSerializer,
+)
+from books.utils import success_response
+from core_commons.query_budget import query_budget
+from core_commons.query_stats import ORDERINGS, query_stats
+from core_commons.response_mixins import ServiceAndUserAuthenticationMixin
+
+
+class QueryStatsViewSet(ServiceAndUserAuthenticationMixin, viewsets.ViewSet):
+    """
+    API endpoint reporting the top SQL fingerprints of the serving process.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        summary="SQL statistics",
+        description=(
+            "Returns count, total/mean/p95/max time and rows of the top `limit` "
+            "SQL fingerprints run by this process, ordered by `order_by`."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="limit", type=int, description="Fingerprints (1-500)"
+            ),
+            OpenApiParameter(name="order_by", type=str, enum=ORDERINGS),
+        ],
+        responses={200: OpenApiTypes.OBJECT},
+    )
+    @query_budget(0)
+    def list(self, request):
+        """Return the top SQL fingerprints."""
+        serializer = QueryStatsRequestSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        return success_response(
+            data={
+                "fingerprints": query_stats.top(**serializer.validated_data),
+                "untracked": query_stats.untracked,
+            }
+        )
+
+    @extend_schema(
+        summary="Reset the SQL statistics",
+        request=None,
+        responses={204: None},
+    )
+    @action(detail=False, methods=["post"])
+    @query_budget(0)
+    def reset(self, request):
+        """Forget the statistics gathered so far."""
+        query_stats.reset()
+        return success_response(
+            data=None,
+            message="Query statistics reset",
+            status_code=status.HTTP_204_NO_CONTENT,
+        )
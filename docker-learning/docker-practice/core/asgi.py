@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+# Serve the catalog read actions with their async views (see BOOKS_ASYNC_VIEWS).
+os.environ.setdefault("BOOKS_ASYNC_VIEWS", "true")
 
 application = get_asgi_application()
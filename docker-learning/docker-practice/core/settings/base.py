@@ -22,17 +22,22 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # Third party apps
     "rest_framework",
     "django_filters",
     "corsheaders",
-    "debug_toolbar",
     "drf_spectacular",
     # Local apps
     "books",
 ]
 
 MIDDLEWARE = [
+    "core_commons.profiling.ProfilingMiddleware",
+    "core_commons.server_timing.ServerTimingMiddleware",
+    "core_commons.metrics.MetricsMiddleware",
+    "core_commons.query_stats.QueryStatsMiddleware",
+    "core_commons.replicas.ReplicaPinMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -41,7 +46,6 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "debug_toolbar.middleware.DebugToolbarMiddleware",
 ]
 
 ROOT_URLCONF = "core.urls"
@@ -98,12 +102,124 @@ REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
-        "rest_framework.filters.SearchFilter",
         "rest_framework.filters.OrderingFilter",
+        "books.search.filters.FullTextSearchFilter",
     ],
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_PAGINATION_CLASS": "books.utils.pagination.CatalogPagination",
     "PAGE_SIZE": 20,
     "EXCEPTION_HANDLER": "books.utils.custom_exception_handler",
+    "DEFAULT_RENDERER_CLASSES": [
+        "core_commons.renderers.ORJSONRenderer",
+        "core_commons.renderers.MessagePackRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "core_commons.parsers.ORJSONParser",
+        "core_commons.parsers.MessagePackParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+    "TEST_REQUEST_RENDERER_CLASSES": [
+        "rest_framework.renderers.MultiPartRenderer",
+        "core_commons.renderers.ORJSONRenderer",
+        "core_commons.renderers.MessagePackRenderer",
+    ],
+}
+
+# Search settings
+# Default minimum trigram similarity for ?search_mode=fuzzy (pg_trgm scale).
+BOOKS_FUZZY_SIMILARITY_THRESHOLD = 0.3
+# How often a background thread refreshes the in-process search indexes
+# (autocomplete, and fuzzy search off PostgreSQL); 0 refreshes on every lookup.
+BOOKS_SEARCH_INDEX_REFRESH_SECONDS = 1.0
+
+# Caches
+# The response cache and its versions must be shared by every worker process:
+# set REDIS_URL. Without it each process has a local-memory cache, which the
+# response cache refuses (see books.utils.response_cache).
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+# Response cache settings
+# List/retrieve responses of the catalog viewsets are cached in this cache
+# alias and invalidated by per-model versions bumped on write. The alias must
+# be shared by every process serving the API; a local-memory one turns the
+# cache off unless BOOKS_RESPONSE_CACHE_SHARED says otherwise.
+BOOKS_RESPONSE_CACHE_ENABLED = True
+BOOKS_RESPONSE_CACHE_ALIAS = "default"
+BOOKS_RESPONSE_CACHE_TIMEOUT = 300
+
+# Serve the read actions of the catalog viewsets with their async variants
+# (books.utils.async_views). core/asgi.py turns it on; under WSGI the views
+# stay synchronous.
+BOOKS_ASYNC_VIEWS = os.getenv("BOOKS_ASYNC_VIEWS", "false").lower() == "true"
+
+# Read replicas (core_commons.replicas). Catalog reads go to a random alias
+# of DATABASE_REPLICAS; a client that wrote reads from the primary for
+# DATABASE_REPLICA_PIN_SECONDS, which must exceed the replication lag.
+DATABASE_ROUTERS = ["core_commons.replicas.ReplicaRouter"]
+DATABASE_REPLICAS = []
+DATABASE_REPLICA_PIN_SECONDS = 5
+
+# Maximum number of books accepted by POST /books/bulk/
+BOOKS_BULK_CREATE_MAX_ITEMS = 5000
+
+# Rows fetched per server-side cursor round trip by GET /books/export/
+BOOKS_EXPORT_CHUNK_SIZE = 2000
+
+# Query budgets (core_commons.query_budget.QueryBudgetMiddleware, enabled in
+# the local and test settings). A SELECT shape repeated this many times in one
+# request is reported as an N+1; the allowance covers the session and user
+# lookups of real authentication on top of each action's budget.
+QUERY_BUDGET_REPEAT_THRESHOLD = 3
+QUERY_BUDGET_ALLOWANCE = 2
+QUERY_BUDGET_RAISE = False
+
+# Per-request latency breakdown (core_commons.server_timing). The log line is
+# always written; the Server-Timing header can be withheld from clients.
+SERVER_TIMING_HEADER = True
+
+# Bearer token Prometheus must send to scrape /metrics (open when unset)
+METRICS_BEARER_TOKEN = os.getenv("METRICS_BEARER_TOKEN")
+
+# SQL statistics per fingerprint (core_commons.query_stats, served at
+# /api/v1/query-stats/). Queries slower than QUERY_STATS_SLOW_MS are logged.
+QUERY_STATS_SLOW_MS = 200
+QUERY_STATS_SAMPLES = 500
+QUERY_STATS_MAX_FINGERPRINTS = 1000
+
+# Sampling profiler (core_commons.profiling). When enabled, it profiles this
+# fraction of the requests plus those sending a signed X-Profile header
+# (manage.py profile_token), appending collapsed stacks per view to the
+# output directory.
+PROFILER_ENABLED = os.getenv("PROFILER_ENABLED", "false").lower() == "true"
+PROFILER_SAMPLE_RATE = float(os.getenv("PROFILER_SAMPLE_RATE", "0"))
+PROFILER_INTERVAL = 0.005
+PROFILER_TOKEN_MAX_AGE = 3600
+PROFILER_OUTPUT_DIR = BASE_DIR / "profiles"
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
+        },
+    },
+    "loggers": {
+        "core_commons": {
+            "handlers": ["console"],
+            "level": "INFO",
+        },
+    },
 }
 
 # Spectacular settings
@@ -40,7 +40,12 @@ CORS_ALLOWED_ORIGINS = [
     "http://127.0.0.1:3000",
 ]
 
+# Log N+1s and exceeded query budgets
+MIDDLEWARE.insert(0, "core_commons.query_budget.QueryBudgetMiddleware")
+
 # Debug Toolbar settings
+INSTALLED_APPS.append("debug_toolbar")
+MIDDLEWARE.append("debug_toolbar.middleware.DebugToolbarMiddleware")
 INTERNAL_IPS = ["127.0.0.1"]
 
 # Email settings
@@ -0,0 +1,80 @@
+"""
+Production settings.
+
+PostgreSQL with persistent connections, cached templates and no debug
+tooling (the debug toolbar is only installed by the local settings).
+Configured from the environment; SECRET_KEY and ALLOWED_HOSTS are required.
+"""
+
+import os
+
+from core.settings.base import *  # noqa: F403
+
+SECRET_KEY = os.environ["SECRET_KEY"]
+DEBUG = False
+
+ALLOWED_HOSTS = [
+    host.strip() for host in os.environ["ALLOWED_HOSTS"].split(",") if host.strip()
+]
+
+# Database
+# Each worker keeps its connection open across requests for CONN_MAX_AGE
+# seconds instead of connecting per request, and checks it at the start of
+# the next request so a connection dropped by the server or a failover is
+# replaced instead of failing the request. Keep max_connections on the
+# server above workers x threads of every instance. Under ASGI a request
+# runs its queries in a thread of its own, so connections are not reused
+# between requests there: put PgBouncer in front and set CONN_MAX_AGE=0.
+POSTGRES_PGBOUNCER = os.getenv("POSTGRES_PGBOUNCER", "false").lower() == "true"
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": os.environ.get("POSTGRES_DB", "postgres"),
+        "USER": os.environ.get("POSTGRES_USER", "postgres"),
+        "PASSWORD": os.environ.get("POSTGRES_PASSWORD", ""),
+        "HOST": os.environ.get("POSTGRES_HOST", "localhost"),
+        "PORT": os.environ.get("POSTGRES_PORT", "5432"),
+        "CONN_MAX_AGE": int(os.getenv("CONN_MAX_AGE", "600")),
+        "CONN_HEALTH_CHECKS": True,
+        # Behind PgBouncer in transaction mode a server-side cursor may end
+        # up on another server connection; /books/export/ then reads with a
+        # client-side cursor.
+        "DISABLE_SERVER_SIDE_CURSORS": POSTGRES_PGBOUNCER,
+        "OPTIONS": {
+            "connect_timeout": 5,
+        },
+    }
+}
+
+# Read replicas: the same database, streamed from the primary to each host of
+# POSTGRES_REPLICA_HOSTS (comma separated).
+DATABASE_REPLICAS = []
+for index, host in enumerate(os.getenv("POSTGRES_REPLICA_HOSTS", "").split(",")):
+    if host.strip():
+        alias = f"replica{index + 1}"
+        DATABASES[alias] = {**DATABASES["default"], "HOST": host.strip()}
+        DATABASE_REPLICAS.append(alias)
+
+# Templates are compiled once per process.
+TEMPLATES[0]["APP_DIRS"] = False  # noqa: F405
+TEMPLATES[0]["OPTIONS"]["loaders"] = [  # noqa: F405
+    (
+        "django.template.loaders.cached.Loader",
+        [
+            "django.template.loaders.filesystem.Loader",
+            "django.template.loaders.app_directories.Loader",
+        ],
+    ),
+]
+
+CORS_ALLOW_ALL_ORIGINS = False
+CORS_ALLOWED_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ALLOWED_ORIGINS", "").split(",")
+    if origin.strip()
+]
+
+# Security
+SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
+SESSION_COOKIE_SECURE = True
+CSRF_COOKIE_SECURE = True
@@ -21,11 +21,29 @@ DATABASES = {
     }
 }
 
+# Stand-ins for read replicas, used by the router tests, which enable them
+# with DATABASE_REPLICAS. Nothing replicates into them.
+for alias in ("replica1", "replica2"):
+    DATABASES[alias] = {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+
 CORS_ALLOW_ALL_ORIGINS = False
 CORS_ALLOWED_ORIGINS = []
 
-INSTALLED_APPS.remove("debug_toolbar")
-MIDDLEWARE.remove("debug_toolbar.middleware.DebugToolbarMiddleware")
+MIDDLEWARE.insert(0, "core_commons.query_budget.QueryBudgetMiddleware")
+
+# Fail the test on N+1s and exceeded budgets. Tests authenticate with
+# force_authenticate, which runs no queries.
+QUERY_BUDGET_RAISE = True
+QUERY_BUDGET_ALLOWANCE = 0
+
+# Let the in-process trigram index see every write immediately.
+BOOKS_SEARCH_INDEX_REFRESH_SECONDS = 0
+
+# Tests roll back instead of committing, so version bumps never run; the
+# response cache tests enable it explicitly.
+BOOKS_RESPONSE_CACHE_ENABLED = False
+# The tests run in one process, which the local-memory cache is shared by.
+BOOKS_RESPONSE_CACHE_SHARED = True
 
 EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 PASSWORD_HASHERS = [
@@ -18,6 +18,8 @@ from drf_spectacular.views import (
     SpectacularSwaggerView,
 )
 
+from core.views import metrics
+
 
 def root_redirect(request):
     """Redirect root URL to Swagger documentation for better developer experience."""
@@ -30,6 +32,8 @@ urlpatterns = [
     path("", root_redirect, name="root"),
     # Admin interface
     path("admin/", admin.site.urls),
+    # Prometheus metrics
+    path("metrics", metrics, name="metrics"),
     # API v1 endpoints with namespace for future versioning
     path("api/v1/", include("books.urls", namespace="v1")),
     # API Documentation endpoints
@@ -0,0 +1,35 @@
+"""
+Project-level views.
+"""
+
+import hmac
+import os
+
+from django.conf import settings
+from django.http import HttpResponse
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+    multiprocess,
+)
+
+
+def metrics(request):
+    """
+    Serve the Prometheus metrics, merged across the worker processes when
+    PROMETHEUS_MULTIPROC_DIR is set. A METRICS_BEARER_TOKEN setting makes
+    scrapers authenticate with it.
+    """
+    token = getattr(settings, "METRICS_BEARER_TOKEN", None)
+    if token and not hmac.compare_digest(
+        request.headers.get("Authorization", ""), f"Bearer {token}"
+    ):
+        return HttpResponse(status=401)
+
+    registry = REGISTRY
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return HttpResponse(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,35 @@
+"""
+Install ``execute_wrapper`` hooks on every database alias for the duration of
+a request, from sync and async middleware alike.
+"""
+
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+
+from asgiref.sync import sync_to_async
+from django.db import connections
+
+
+@contextmanager
+def wrap_queries(wrapper):
+    """Run wrapper around every query of the current thread's connections."""
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(wrapper))
+        yield
+
+
+@asynccontextmanager
+async def awrap_queries(wrapper):
+    """
+    Async counterpart of wrap_queries. Under ASGI the ORM runs the queries of
+    a request in a thread of its own (thread-sensitive sync_to_async), whose
+    connections are not those of the event loop, so the hooks are installed
+    from that thread.
+    """
+    hooks = wrap_queries(wrapper)
+    await sync_to_async(hooks.__enter__)()
+    try:
+        yield
+    finally:
+        # Only pops the hooks off the connections; no thread switch needed.
+        hooks.__exit__(None, None, None)
@@ -0,0 +1,128 @@
+"""
+Prometheus metrics of the API, exposed at ``/metrics`` (core.views.metrics).
+
+* ``api_request_duration_seconds``: latency histogram per view and method;
+* ``api_requests_in_progress``: requests being served per view and method;
+* ``api_request_db_queries``: histogram of the queries run per request,
+  read from the ServerTimingMiddleware of the request;
+* ``api_response_cache_lookups_total``: response cache "hits" and "misses"
+  per viewset; the hit ratio is the rate of hits over the rate of both, so
+  it stays correct when summed across processes;
+* ``api_errors_total``: error responses per view and ``error_code``, as
+  produced by custom_exception_handler, plus unhandled exceptions.
+
+Views are labelled with their URL name ("v1:book-list"), which keeps the
+label sets bounded. Under gunicorn every worker writes its samples to the
+files of ``PROMETHEUS_MULTIPROC_DIR`` (see gunicorn.conf.py) and the
+endpoint merges them, so the numbers do not depend on the worker that
+answers the scrape.
+"""
+
+from time import perf_counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from prometheus_client import Counter, Gauge, Histogram
+
+from core_commons.server_timing import current_timings
+
+UNRESOLVED_VIEW = "<unresolved>"
+
+METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+
+REQUEST_LATENCY = Histogram(
+    "api_request_duration_seconds",
+    "Latency of the API requests.",
+    ["view", "method"],
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "api_requests_in_progress",
+    "API requests being served.",
+    ["view", "method"],
+    multiprocess_mode="livesum",
+)
+REQUEST_QUERIES = Histogram(
+    "api_request_db_queries",
+    "Database queries run by an API request.",
+    ["view", "method"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+RESPONSE_CACHE_LOOKUPS = Counter(
+    "api_response_cache_lookups",
+    "Response cache lookups of the catalog viewsets.",
+    ["viewset", "outcome"],
+)
+ERRORS = Counter(
+    "api_errors",
+    "API error responses.",
+    ["view", "error_code"],
+)
+
+
+def get_view_label(request):
+    """Return the URL name of the view serving the request."""
+    match = getattr(request, "resolver_match", None)
+    return match.view_name if match else UNRESOLVED_VIEW
+
+
+def get_method_label(request):
+    """Return the request method, folding unknown methods into "OTHER"."""
+    return request.method if request.method in METHODS else "OTHER"
+
+
+def record_error(request, error_code):
+    """Count an error response of the request."""
+    ERRORS.labels(get_view_label(request), error_code).inc()
+
+
+class MetricsMiddleware:
+    """
+    Record the latency, concurrency and query count of every request.
+    Placed right after ServerTimingMiddleware.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        started = perf_counter()
+        request.metrics_in_progress = None
+        try:
+            return self.get_response(request)
+        finally:
+            self.observe(request, started)
+
+    async def __acall__(self, request):
+        started = perf_counter()
+        request.metrics_in_progress = None
+        try:
+            return await self.get_response(request)
+        finally:
+            self.observe(request, started)
+
+    def observe(self, request, started):
+        labels = (get_view_label(request), get_method_label(request))
+        REQUEST_LATENCY.labels(*labels).observe(perf_counter() - started)
+        timings = current_timings()
+        if timings is not None:
+            REQUEST_QUERIES.labels(*labels).observe(timings.queries)
+        if request.metrics_in_progress is not None:
+            request.metrics_in_progress.dec()
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        gauge = REQUESTS_IN_PROGRESS.labels(
+            get_view_label(request), get_method_label(request)
+        )
+        gauge.inc()
+        request.metrics_in_progress = gauge
+
+    def process_exception(self, request, exception):
+        # Exceptions custom_exception_handler does not turn into responses.
+        record_error(request, exception.__class__.__name__.upper())
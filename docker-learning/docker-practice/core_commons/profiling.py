@@ -0,0 +1,141 @@
+"""
+Opt-in sampling CPU profiler for API requests.
+
+With ``PROFILER_ENABLED`` the ProfilingMiddleware profiles a fraction
+(``PROFILER_SAMPLE_RATE``) of the requests, and any request carrying a valid
+``X-Profile`` header (see make_profile_token and the profile_token command).
+A profiled request gets a sampler thread that records the stack of the
+request thread every ``PROFILER_INTERVAL`` seconds, from the middleware
+down, so the whole lifecycle (middleware, view, serialization, rendering)
+is covered without tracing every call.
+
+The stacks are appended to ``PROFILER_OUTPUT_DIR/<view name>.collapsed`` in
+the collapsed stack format ("frame;frame;frame count"), which flamegraph.pl
+and speedscope read directly and which sums over repeated lines, so files
+written by several requests and processes aggregate by themselves.
+
+Disabled, the middleware removes itself at startup (MiddlewareNotUsed). It
+samples the thread serving the request, so it is sync only: enabled under
+ASGI, Django runs the rest of the middleware chain in a thread per request.
+"""
+
+import os
+import random
+import re
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import MiddlewareNotUsed
+
+HEADER = "X-Profile"
+TOKEN_SALT = "core_commons.profiling"
+_UNSAFE_RE = re.compile(r"[^\w.-]+")
+
+
+def make_profile_token():
+    """Return a signed X-Profile header value profiling one request."""
+    return signing.TimestampSigner(salt=TOKEN_SALT).sign("profile")
+
+
+def check_profile_token(token):
+    """Return True if the token was signed here and has not expired."""
+    try:
+        signing.TimestampSigner(salt=TOKEN_SALT).unsign(
+            token, max_age=getattr(settings, "PROFILER_TOKEN_MAX_AGE", 3600)
+        )
+    except signing.BadSignature:
+        return False
+    return True
+
+
+def frame_label(code):
+    return f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})"
+
+
+def collapse(frame, root_code):
+    """
+    Return the collapsed stack of a frame, from root_code (excluded) down.
+    """
+    labels = []
+    while frame is not None and frame.f_code is not root_code:
+        labels.append(frame_label(frame.f_code).replace(";", ":"))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+class Sampler(threading.Thread):
+    """
+    Thread sampling the stack of another thread at a fixed interval.
+    """
+
+    def __init__(self, thread_id, root_code, interval):
+        super().__init__(name="profiler-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.root_code = root_code
+        self.interval = interval
+        self.stacks = Counter()
+        self._done = threading.Event()
+
+    def run(self):
+        while not self._done.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[collapse(frame, self.root_code)] += 1
+
+    def stop(self):
+        """Stop sampling and return the stack counts."""
+        self._done.set()
+        self.join()
+        return self.stacks
+
+
+def write_stacks(view_name, stacks):
+    """Append stack counts to the collapsed stack file of a view."""
+    directory = Path(getattr(settings, "PROFILER_OUTPUT_DIR", "profiles"))
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{_UNSAFE_RE.sub('-', view_name)}.collapsed"
+    lines = "".join(f"{stack} {count}\n" for stack, count in stacks.items() if stack)
+    # A single O_APPEND write keeps concurrent writers from interleaving.
+    descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        os.write(descriptor, lines.encode())
+    finally:
+        os.close(descriptor)
+
+
+class ProfilingMiddleware:
+    """
+    Sample the stacks of the profiled requests. Meant to be the first
+    middleware.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "PROFILER_ENABLED", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, "PROFILER_SAMPLE_RATE", 0.0)
+        self.interval = getattr(settings, "PROFILER_INTERVAL", 0.005)
+
+    def should_profile(self, request):
+        token = request.headers.get(HEADER)
+        if token:
+            return check_profile_token(token)
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def __call__(self, request):
+        if not self.should_profile(request):
+            return self.get_response(request)
+
+        sampler = Sampler(threading.get_ident(), sys._getframe().f_code, self.interval)
+        sampler.start()
+        try:
+            return self.get_response(request)
+        finally:
+            stacks = sampler.stop()
+            if stacks:
+                match = getattr(request, "resolver_match", None)
+                write_stacks(match.view_name if match else "unresolved", stacks)
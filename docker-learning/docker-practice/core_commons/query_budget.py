@@ -0,0 +1,149 @@
+"""
+Per-request SQL accounting: N+1 detection and per-action query budgets.
+
+QueryBudgetMiddleware records every query a request runs (on every database
+alias, without needing DEBUG) and fingerprints it: literals are already
+parameters, so collapsing placeholder lists and whitespace leaves the shape
+of the statement. A request fails its check when
+
+* it runs more queries than the budget declared on the viewset action with
+  ``@query_budget(n)`` (plus ``QUERY_BUDGET_ALLOWANCE`` for the session and
+  user lookups of real authentication), or
+* the same SELECT shape runs ``QUERY_BUDGET_REPEAT_THRESHOLD`` times or more,
+  the signature of an N+1.
+
+With ``QUERY_BUDGET_RAISE`` the middleware raises QueryBudgetExceeded, which
+the test client re-raises so the test fails; otherwise it logs a warning.
+"""
+
+import logging
+import re
+from collections import Counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from core_commons.db_hooks import awrap_queries, wrap_queries
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDERS_RE = re.compile(r"\(\s*%s(?:\s*,\s*%s)*\s*\)")
+_VALUES_RE = re.compile(r"(\(%s\+\))(?:\s*,\s*\(%s\+\))*")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(AssertionError):
+    """A request ran more queries than its budget, or repeated a query shape."""
+
+
+def query_budget(max_queries):
+    """
+    Declare the number of queries a viewset action may run, excluding
+    authentication (see QUERY_BUDGET_ALLOWANCE).
+    """
+
+    def decorator(func):
+        func.query_budget = max_queries
+        return func
+
+    return decorator
+
+
+def fingerprint(sql):
+    """Return the shape of a parametrized SQL statement."""
+    shape = _PLACEHOLDERS_RE.sub("(%s+)", sql)
+    shape = _VALUES_RE.sub(r"\1", shape)
+    return _WHITESPACE_RE.sub(" ", shape).strip()
+
+
+class QueryRecorder:
+    """
+    ``execute_wrapper`` hook counting the queries of one request by shape.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.shapes = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        self.total += 1
+        self.shapes[fingerprint(sql)] += 1
+        return execute(sql, params, many, context)
+
+    def repeated_selects(self, threshold):
+        """Return (shape, count) of the SELECTs run at least threshold times."""
+        return [
+            (shape, count)
+            for shape, count in self.shapes.most_common()
+            if count >= threshold and shape.upper().startswith("SELECT")
+        ]
+
+
+def get_view_budget(view_func, method):
+    """Return the budget declared on the viewset action serving the request."""
+    actions = getattr(view_func, "actions", None)
+    view_class = getattr(view_func, "cls", None)
+    if not actions or view_class is None:
+        return None
+    handler = getattr(view_class, actions.get(method.lower(), ""), None)
+    return getattr(handler, "query_budget", None)
+
+
+class QueryBudgetMiddleware:
+    """
+    Check every request against its query budget and for repeated queries.
+    Enabled in the local and test settings.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        recorder = QueryRecorder()
+        request.query_budget = None
+        with wrap_queries(recorder):
+            response = self.get_response(request)
+        self.check(request, response, recorder)
+        return response
+
+    async def __acall__(self, request):
+        recorder = QueryRecorder()
+        request.query_budget = None
+        async with awrap_queries(recorder):
+            response = await self.get_response(request)
+        self.check(request, response, recorder)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.query_budget = get_view_budget(view_func, request.method)
+
+    def check(self, request, response, recorder):
+        problems = []
+        budget = request.query_budget
+        renderer = getattr(response, "accepted_renderer", None)
+        if getattr(renderer, "format", None) == "api":
+            # The browsable API queries for its forms; only check repeats.
+            budget = None
+        if budget is not None:
+            budget += getattr(settings, "QUERY_BUDGET_ALLOWANCE", 0)
+            if recorder.total > budget:
+                problems.append(f"{recorder.total} queries, budget is {budget}")
+
+        threshold = getattr(settings, "QUERY_BUDGET_REPEAT_THRESHOLD", 3)
+        for shape, count in recorder.repeated_selects(threshold):
+            problems.append(f"{count}x {shape}")
+
+        if not problems:
+            return
+        message = f"{request.method} {request.path}: " + "; ".join(problems)
+        if getattr(settings, "QUERY_BUDGET_RAISE", False):
+            raise QueryBudgetExceeded(message)
+        logger.warning("Query budget exceeded: %s", message)
@@ -0,0 +1,173 @@
+"""
+In-process SQL statistics per fingerprint and a slow-query log.
+
+QueryStatsMiddleware observes every query run while serving a request, on
+every database alias, and aggregates it under its fingerprint (the
+statement with placeholder lists collapsed, see query_budget.fingerprint):
+execution count, total and maximum time, the 95th percentile over the last
+``QUERY_STATS_SAMPLES`` executions and the rows reported by the cursor
+(``rowcount``; SQLite reports -1 for SELECTs, which is not counted).
+Statements slower than ``QUERY_STATS_SLOW_MS`` are logged with the view
+that ran them.
+
+The statistics live in the process; under gunicorn each worker has its own.
+Admins read them from /api/v1/query-stats/.
+"""
+
+import logging
+import math
+import threading
+from collections import deque
+from functools import lru_cache
+from time import perf_counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from core_commons.db_hooks import awrap_queries, wrap_queries
+from core_commons.query_budget import fingerprint
+
+logger = logging.getLogger(__name__)
+
+ORDERINGS = ("total_ms", "mean_ms", "p95_ms", "max_ms", "count", "rows")
+
+cached_fingerprint = lru_cache(maxsize=4096)(fingerprint)
+
+
+class FingerprintStats:
+    """Running statistics of one fingerprint."""
+
+    __slots__ = ("count", "total", "max", "rows", "samples", "views")
+
+    def __init__(self, samples):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.samples = deque(maxlen=samples)
+        self.views = set()
+
+    def add(self, seconds, rows, view):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        if rows > 0:
+            self.rows += rows
+        self.samples.append(seconds)
+        if view is not None:
+            self.views.add(view)
+
+    def as_dict(self, shape):
+        samples = sorted(self.samples)
+        p95 = samples[math.ceil(len(samples) * 0.95) - 1] if samples else 0.0
+        return {
+            "fingerprint": shape,
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total * 1000 / self.count, 3),
+            "p95_ms": round(p95 * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+            "rows": self.rows,
+            "views": sorted(self.views),
+        }
+
+
+class QueryStats:
+    """
+    Statistics of every fingerprint seen by the process. At most
+    ``QUERY_STATS_MAX_FINGERPRINTS`` are tracked; later shapes are only
+    counted in ``untracked``.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+            self.untracked = 0
+
+    def record(self, sql, seconds, rows, view):
+        shape = cached_fingerprint(sql)
+        with self._lock:
+            stats = self._stats.get(shape)
+            if stats is None:
+                if len(self._stats) >= getattr(
+                    settings, "QUERY_STATS_MAX_FINGERPRINTS", 1000
+                ):
+                    self.untracked += 1
+                    return
+                stats = self._stats[shape] = FingerprintStats(
+                    getattr(settings, "QUERY_STATS_SAMPLES", 500)
+                )
+            stats.add(seconds, rows, view)
+
+    def top(self, limit=20, order_by="total_ms"):
+        """Return the statistics of the top fingerprints, highest first."""
+        with self._lock:
+            rows = [stats.as_dict(shape) for shape, stats in self._stats.items()]
+        rows.sort(key=lambda row: row[order_by], reverse=True)
+        return rows[:limit]
+
+
+query_stats = QueryStats()
+
+
+class QueryObserver:
+    """
+    ``execute_wrapper`` hook feeding query_stats and the slow-query log for
+    the queries of one request.
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self.slow = getattr(settings, "QUERY_STATS_SLOW_MS", 200) / 1000
+
+    def view_name(self):
+        match = getattr(self.request, "resolver_match", None)
+        return match.view_name if match else None
+
+    def __call__(self, execute, sql, params, many, context):
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = perf_counter() - started
+            rows = getattr(context["cursor"], "rowcount", -1)
+            view = self.view_name()
+            query_stats.record(sql, elapsed, rows, view)
+            if elapsed >= self.slow:
+                logger.warning(
+                    "Slow query (%.1f ms) in %s %s [%s]: %s",
+                    elapsed * 1000,
+                    self.request.method,
+                    self.request.path,
+                    view,
+                    sql,
+                )
+
+
+class QueryStatsMiddleware:
+    """
+    Observe the queries of every request.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        with wrap_queries(QueryObserver(request)):
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        async with awrap_queries(QueryObserver(request)):
+            return await self.get_response(request)
@@ -0,0 +1,74 @@
+"""
+Fast renderers for the API: orjson for JSON and MessagePack.
+
+Both fall back to DRF's JSON encoder for the types they do not handle
+themselves (Decimal, lazy strings, querysets, ...), so every value renders
+the same way it does with the stock JSONRenderer.
+"""
+
+import msgpack
+import orjson
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+_encoder = JSONEncoder()
+
+# orjson writes U+2028/U+2029 verbatim; DRF escapes them so the output stays
+# a strict JavaScript subset.
+_LINE_SEPARATOR = "\u2028".encode()
+_PARAGRAPH_SEPARATOR = "\u2029".encode()
+
+
+def default(obj):
+    """Encode what orjson/msgpack cannot, the way DRF's JSONEncoder does."""
+    return _encoder.default(obj)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Drop-in JSONRenderer backed by orjson.
+
+    Compact, UTF-8 output (the DRF defaults) is rendered by orjson;
+    indented output (``; indent=4``, the browsable API) and
+    ``UNICODE_JSON``/``COMPACT_JSON`` set to False use the stock renderer.
+    Aware UTC datetimes render with a ``Z`` suffix, as with DRF.
+    """
+
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        rendered = orjson.dumps(data, default=default, option=self.options)
+        # isascii() is a fast pre-check; most payloads skip both scans.
+        if not rendered.isascii() and (
+            _LINE_SEPARATOR in rendered or _PARAGRAPH_SEPARATOR in rendered
+        ):
+            rendered = rendered.replace(_LINE_SEPARATOR, b"\\u2028").replace(
+                _PARAGRAPH_SEPARATOR, b"\\u2029"
+            )
+        return rendered
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Renders ``application/msgpack``, selected through the Accept header or
+    ``?format=msgpack``.
+
+    Aware datetimes use the native MessagePack timestamp type; other values
+    are encoded as in JSON.
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=default, datetime=True)
@@ -0,0 +1,139 @@
+"""
+Read replicas with read-your-writes stickiness.
+
+ReplicaRouter sends the reads of the catalog (the ``books`` app, i.e. the
+Book/Author/Category services and viewsets) to a random alias of
+``DATABASE_REPLICAS``. Everything else stays on ``default``, the primary:
+writes, reads inside a ``transaction.atomic`` block, and the reads of a
+context pinned to the primary. With no replicas configured every query goes
+to the primary.
+
+ReplicaPinMiddleware pins a request to the primary from its first catalog
+write on, and for all of a request that is not GET/HEAD/OPTIONS: updates
+read the row they overwrite from the primary, and validators such as the
+unique checks see committed data. After a write it sets a cookie that keeps
+the client's next requests on the primary for
+``DATABASE_REPLICA_PIN_SECONDS``, the replication lag we tolerate. Code
+outside requests (management commands, the shell) that reads its own writes
+runs in ``pin_to_primary()``.
+"""
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+PIN_COOKIE_NAME = "primary_pin"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class PrimaryPin:
+    """Routing state of a request or of a pin_to_primary() block."""
+
+    def __init__(self, pinned=False):
+        self.pinned = pinned
+        self.wrote = False
+
+
+_pin = ContextVar("primary_pin", default=None)
+
+
+def is_pinned():
+    pin = _pin.get()
+    return pin is not None and pin.pinned
+
+
+@contextmanager
+def pin_to_primary():
+    """Send every read of the block to the primary."""
+    token = _pin.set(PrimaryPin(pinned=True))
+    try:
+        yield
+    finally:
+        _pin.reset(token)
+
+
+def get_replicas():
+    return getattr(settings, "DATABASE_REPLICAS", [])
+
+
+class ReplicaRouter:
+    """Route the catalog reads to the replicas, everything else to default."""
+
+    route_app_labels = {"books"}
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label not in self.route_app_labels:
+            return None
+        replicas = get_replicas()
+        if not replicas or is_pinned() or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        pin = _pin.get()
+        if pin is not None and model._meta.app_label in self.route_app_labels:
+            pin.pinned = pin.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *get_replicas()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+
+class ReplicaPinMiddleware:
+    """
+    Scope the primary pin to the request: pin unsafe methods and clients
+    that wrote recently, and tell clients that wrote to come back pinned.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        pin, token = self.start(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            _pin.reset(token)
+        return self.finish(pin, response)
+
+    async def __acall__(self, request):
+        pin, token = self.start(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _pin.reset(token)
+        return self.finish(pin, response)
+
+    def start(self, request):
+        pin = PrimaryPin(
+            pinned=request.method not in SAFE_METHODS
+            or PIN_COOKIE_NAME in request.COOKIES
+        )
+        return pin, _pin.set(pin)
+
+    def finish(self, pin, response):
+        if pin.wrote and get_replicas():
+            response.set_cookie(
+                PIN_COOKIE_NAME,
+                "1",
+                max_age=getattr(settings, "DATABASE_REPLICA_PIN_SECONDS", 5),
+                secure=settings.SESSION_COOKIE_SECURE,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
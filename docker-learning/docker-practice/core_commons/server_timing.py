@@ -0,0 +1,218 @@
+"""
+Per-request latency breakdown: a ``Server-Timing`` header and a log line.
+
+ServerTimingMiddleware splits the time of every request into phases:
+
+* ``db``: time spent executing SQL, with the query count, recorded by a
+  ``connection.execute_wrapper`` on every database alias;
+* ``serialize``: time spent turning objects into response data, reported by
+  the serializers (TimedSerializerMixin) and list projections through
+  ``measure("serialize")``, excluding the queries they trigger;
+* ``render``: time spent rendering the response body;
+* ``app``: the rest, i.e. middleware and view logic;
+* ``total``: the whole request as seen by the middleware.
+
+The cost is a few ``perf_counter`` calls per query and per phase, so the
+middleware stays enabled in production; ``SERVER_TIMING_HEADER`` only decides
+whether the breakdown is also sent to clients. The middleware serves sync
+and async requests alike.
+"""
+
+import logging
+from contextlib import nullcontext
+from contextvars import ContextVar
+from time import perf_counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from core_commons.db_hooks import awrap_queries, wrap_queries
+
+logger = logging.getLogger(__name__)
+
+_current_timings = ContextVar("server_timings", default=None)
+
+
+class Phase:
+    """
+    Context manager adding its duration, minus the SQL time it contains, to
+    a phase of the request. Nested measures of the same phase count once.
+    """
+
+    __slots__ = ("timings", "name", "started", "db_started", "outermost")
+
+    def __init__(self, timings, name):
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self):
+        self.outermost = self.name not in self.timings.open_phases
+        if self.outermost:
+            self.timings.open_phases.add(self.name)
+            self.db_started = self.timings.db_time
+            self.started = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.outermost:
+            elapsed = perf_counter() - self.started
+            timings = self.timings
+            timings.open_phases.discard(self.name)
+            timings.add(self.name, elapsed - (timings.db_time - self.db_started))
+
+
+class RequestTimings:
+    """
+    Durations (seconds) and query count of one request; also the
+    ``execute_wrapper`` hook timing its queries.
+    """
+
+    def __init__(self):
+        self.started = perf_counter()
+        self.db_time = 0.0
+        self.queries = 0
+        self.durations = {}
+        self.open_phases = set()
+        self.render_started = None
+
+    def __call__(self, execute, sql, params, many, context):
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += perf_counter() - started
+            self.queries += 1
+
+    def add(self, name, seconds):
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+
+    def measure(self, name):
+        return Phase(self, name)
+
+    def start_render(self):
+        self.render_started = perf_counter()
+
+    def finish_render(self, response):
+        if self.render_started is not None:
+            self.add("render", perf_counter() - self.render_started)
+            self.render_started = None
+        return response
+
+    def breakdown(self):
+        """Return the phases in milliseconds, in Server-Timing order."""
+        total = perf_counter() - self.started
+        phases = {"db": self.db_time, **self.durations}
+        phases["app"] = max(total - sum(phases.values()), 0.0)
+        phases["total"] = total
+        return {name: seconds * 1000 for name, seconds in phases.items()}
+
+
+def current_timings():
+    """Return the RequestTimings of the request being served, if any."""
+    return _current_timings.get()
+
+
+def measure(name):
+    """
+    Return a context manager timing a phase of the current request; a no-op
+    outside a request.
+    """
+    timings = _current_timings.get()
+    if timings is None:
+        return nullcontext()
+    return timings.measure(name)
+
+
+def format_header(breakdown, queries):
+    """Return the Server-Timing header value of a breakdown."""
+    entries = []
+    for name, milliseconds in breakdown.items():
+        entry = f"{name};dur={milliseconds:.2f}"
+        if name == "db":
+            entry += f';desc="{queries} queries"'
+        entries.append(entry)
+    return ", ".join(entries)
+
+
+class TimedSerializerMixin:
+    """
+    Count the time a serializer spends in ``to_representation`` as the
+    ``serialize`` phase of the current request.
+    """
+
+    def to_representation(self, instance):
+        timings = _current_timings.get()
+        if timings is None:
+            return super().to_representation(instance)
+        with timings.measure("serialize"):
+            return super().to_representation(instance)
+
+
+class ServerTimingMiddleware:
+    """
+    Time the phases of every request, add them to the response as a
+    ``Server-Timing`` header and log them. Meant to be the first middleware.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        timings = RequestTimings()
+        token = _current_timings.set(timings)
+        try:
+            with wrap_queries(timings):
+                response = self.get_response(request)
+        finally:
+            _current_timings.reset(token)
+        return self.finish(request, response, timings)
+
+    async def __acall__(self, request):
+        timings = RequestTimings()
+        token = _current_timings.set(timings)
+        try:
+            async with awrap_queries(timings):
+                response = await self.get_response(request)
+        finally:
+            _current_timings.reset(token)
+        return self.finish(request, response, timings)
+
+    def finish(self, request, response, timings):
+        breakdown = timings.breakdown()
+        if getattr(settings, "SERVER_TIMING_HEADER", True):
+            response["Server-Timing"] = format_header(breakdown, timings.queries)
+        self.log(request, response, breakdown, timings.queries)
+        return response
+
+    def process_template_response(self, request, response):
+        # Runs right before rendering; DRF responses are template responses.
+        timings = _current_timings.get()
+        if timings is not None:
+            timings.start_render()
+            response.add_post_render_callback(timings.finish_render)
+        return response
+
+    def log(self, request, response, breakdown, queries):
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        match = getattr(request, "resolver_match", None)
+        fields = {
+            "method": request.method,
+            "path": request.path,
+            "view": match.view_name if match else None,
+            "status": response.status_code,
+            "queries": queries,
+            **{f"{name}_ms": round(value, 2) for name, value in breakdown.items()},
+        }
+        logger.info(
+            " ".join(f"{key}={value}" for key, value in fields.items()),
+            extra={"server_timing": fields},
+        )
@@ -0,0 +1,32 @@
+"""
+Gunicorn configuration.
+
+Set PROMETHEUS_MULTIPROC_DIR in the environment of the master so every
+worker writes its metrics to files there; /metrics merges them. The
+directory is emptied at startup and the files of exited workers are
+marked dead, as prometheus_client requires.
+"""
+
+import multiprocessing
+import os
+from pathlib import Path
+
+wsgi_app = "core.wsgi:application"
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+
+
+def on_starting(server):
+    directory = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        for stale in path.glob("*.db"):
+            stale.unlink()
+
+
+def child_exit(server, worker):
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)